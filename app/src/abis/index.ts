@@ -4,6 +4,7 @@ import ProposalContract from './ProposalContract.json'
 import GovernanceHub from './GovernanceHub.json'
 import ProposalTemplate from './ProposalTemplate.json'
 import CommentTemplate from './CommentTemplate.json'
+import GovernanceLens from './GovernanceLens.json'
 
 export const ABIS = {
   ERC1155,
@@ -12,6 +13,7 @@ export const ABIS = {
   GovernanceHub,
   ProposalTemplate,
   CommentTemplate,
+  GovernanceLens,
 } as const
 
 export type ERC1155Abi = typeof ERC1155
@@ -20,5 +22,6 @@ export type ProposalContractAbi = typeof ProposalContract
 export type GovernanceHubAbi = typeof GovernanceHub
 export type ProposalTemplateAbi = typeof ProposalTemplate
 export type CommentTemplateAbi = typeof CommentTemplate
+export type GovernanceLensAbi = typeof GovernanceLens
 
 
@@ -11,6 +11,13 @@ type ProposalContractConfig = {
 type GovernanceHubConfig = {
   address: `0x${string}`
   abi: typeof ABIS.GovernanceHub
+  // Block the hub was deployed in; event scans (e.g. ProposalBody) start here
+  deployBlock: bigint
+}
+
+type GovernanceLensConfig = {
+  address: `0x${string}`
+  abi: typeof ABIS.GovernanceLens
 }
 
 type ContractsByEnv = Record<
@@ -18,13 +25,15 @@ type ContractsByEnv = Record<
   {
     proposalContract: ProposalContractConfig
     governanceHub: GovernanceHubConfig
+    // Optional read-only lens; zero address falls back to per-proposal reads
+    governanceLens: GovernanceLensConfig
   }
 >
 
 // NOTE:
 // - "testnet" is sepolia
 // - "mainnet" is Ethereum mainnet
-// Update these addresses after each deployment.
+// Update these addresses (and the hub's deployBlock) after each deployment.
 const CONTRACTS_BY_ENV: ContractsByEnv = {
   testnet: {
     proposalContract: {
@@ -36,6 +45,13 @@ const CONTRACTS_BY_ENV: ContractsByEnv = {
       // TODO: replace with your actual sepolia GovernanceHub deployment address
       address: '0xB38895eFAB98086fD3dc09b34E4cA15862c9dD8b',
       abi: ABIS.GovernanceHub,
+      // TODO: replace with the block of your sepolia GovernanceHub deployment
+      deployBlock: 0n,
+    },
+    governanceLens: {
+      // TODO: replace with your actual sepolia GovernanceLens deployment address
+      address: '0x0000000000000000000000000000000000000000',
+      abi: ABIS.GovernanceLens,
     },
   },
   mainnet: {
@@ -48,6 +64,13 @@ const CONTRACTS_BY_ENV: ContractsByEnv = {
       // TODO: replace with your actual mainnet GovernanceHub deployment address
       address: '0x0000000000000000000000000000000000000000',
       abi: ABIS.GovernanceHub,
+      // TODO: replace with the block of your mainnet GovernanceHub deployment
+      deployBlock: 0n,
+    },
+    governanceLens: {
+      // TODO: replace with your actual mainnet GovernanceLens deployment address
+      address: '0x0000000000000000000000000000000000000000',
+      abi: ABIS.GovernanceLens,
     },
   },
 }
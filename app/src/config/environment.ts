@@ -29,4 +29,8 @@ const ADMIN_ADDRESSES_RAW =
 
 export const ADMIN_ADDRESSES: Set<string> = new Set(ADMIN_ADDRESSES_RAW)
 
-
+// Optional: base URL of the indexed read API (scripts/hub_api.py), e.g. "http://127.0.0.1:8787".
+// When unset, proposal lists are read from chain (lens or per-proposal reads).
+export const HUB_API_URL: string = ((import.meta.env.VITE_HUB_API_URL as string | undefined) ?? '')
+  .trim()
+  .replace(/\/+$/, '')
@@ -8,11 +8,11 @@ import bobuThumbs from '../assets/thumbsup.gif'
 import { APP_ENV, IS_MAINNET, IS_TESTNET, ADMIN_ADDRESSES } from '../config/environment'
 import { hasToken, mintDevToken, submitProposal, type Address } from '../web3/proposalContractActions'
 import {
-  getProposalCountByState,
-  getProposalsByState,
-  readProposalDetails,
+  readProposalCounts,
+  readProposalSummaries,
   readProposalBody,
   HubProposalState,
+  type ProposalListSource,
 } from '../web3/governanceHubActions'
 import { parseProposalMarkdown } from '../utils/proposalMarkdown'
 
@@ -361,6 +361,8 @@ export default function GovernancePage() {
     [HubProposalState.ACTIVE]: 0,
     [HubProposalState.CLOSED]: 0,
   })
+  // Counts and pages must come from the same source (indexer API or chain)
+  const [listSource, setListSource] = useState<ProposalListSource>('chain')
   const [selectedStates, setSelectedStates] = useState<Set<number>>(
     () => new Set<number>([HubProposalState.DRAFT])
   )
@@ -435,30 +437,22 @@ export default function GovernancePage() {
   )
   const totalPages = Math.max(1, Math.ceil(totalSelectedCount / PAGE_SIZE))
 
-  const refreshCounts = async () => {
-    const [draft, open, active, closed] = await Promise.all([
-      getProposalCountByState(HubProposalState.DRAFT),
-      getProposalCountByState(HubProposalState.OPEN),
-      getProposalCountByState(HubProposalState.ACTIVE),
-      getProposalCountByState(HubProposalState.CLOSED),
-    ])
-    const counts = {
-      [HubProposalState.DRAFT]: draft,
-      [HubProposalState.OPEN]: open,
-      [HubProposalState.ACTIVE]: active,
-      [HubProposalState.CLOSED]: closed,
-    } as Record<number, number>
-    setCountsByState(counts)
-    return counts
+  const refreshCounts = async (sourceOverride?: ProposalListSource) => {
+    const listing = await readProposalCounts(sourceOverride)
+    setCountsByState(listing.counts)
+    setListSource(listing.source)
+    return listing
   }
 
   const loadPage = async (
     pageNum: number,
     countsOverride?: Record<number, number>,
-    selectedStatesOverride?: HubProposalState[]
-  ) => {
+    selectedStatesOverride?: HubProposalState[],
+    sourceOverride?: ProposalListSource
+  ): Promise<void> => {
         setLoadingProposals(true)
         setLoadError(null)
+    const source = sourceOverride ?? listSource
     try {
       const counts = countsOverride ?? countsByState
       const selectedOrdered = selectedStatesOverride ?? selectedStatesOrdered
@@ -487,22 +481,22 @@ export default function GovernancePage() {
         }
       }
 
-      const addrChunks = await Promise.all(
+      // One lens call per state segment returns addresses and details together
+      const summaryChunks = await Promise.all(
         segments.map((seg) =>
-          getProposalsByState({
+          readProposalSummaries({
             state: seg.state,
             offset: seg.localOffset,
             count: seg.count,
             reverse: true,
-          }).then((addrs) => addrs.map((a) => ({ a, state: seg.state })))
+            source,
+          }).then((items) => items.map((d) => ({ d, a: d.address, state: seg.state })))
         )
       )
-      const addrFlat: Array<{ a: `0x${string}`; state: HubProposalState }> = addrChunks.flat()
+      const addrFlat = summaryChunks.flat()
+      const details = addrFlat.map(({ d }) => d)
 
-      // Fetch proposal details and body for snippet in parallel
-      const details = await Promise.all(
-        addrFlat.map(({ a }) => readProposalDetails(a as `0x${string}`))
-      )
+      // Fetch bodies for snippets in parallel
       const bodies = await Promise.all(
         addrFlat.map(({ a }) => readProposalBody(a as `0x${string}`))
       )
@@ -537,6 +531,12 @@ export default function GovernancePage() {
         setProposals(mapped)
       setCurrentPage(pageNum)
     } catch (err) {
+      if (source === 'api') {
+        // API failed mid-listing: redo counts and the page from chain, never a mix
+        console.warn('hub api page failed, reloading from chain', err)
+        const listing = await refreshCounts('chain')
+        return loadPage(pageNum, listing.counts, selectedStatesOverride, listing.source)
+      }
       const message = err instanceof Error ? err.message : String(err)
       setLoadError(message)
       setProposals([])
@@ -550,9 +550,9 @@ export default function GovernancePage() {
     let cancelled = false
     ;(async () => {
       try {
-        const counts = await refreshCounts()
+        const listing = await refreshCounts()
         if (cancelled) return
-        await loadPage(1, counts, STATE_ORDER.filter((s) => selectedStates.has(s)))
+        await loadPage(1, listing.counts, STATE_ORDER.filter((s) => selectedStates.has(s)), listing.source)
       } catch (err) {
         if (!cancelled) {
           const message = err instanceof Error ? err.message : String(err)
@@ -571,9 +571,9 @@ export default function GovernancePage() {
     let cancelled = false
     ;(async () => {
       try {
-        const counts = await refreshCounts()
+        const listing = await refreshCounts()
         if (cancelled) return
-        await loadPage(1, counts, STATE_ORDER.filter((s) => selectedStates.has(s)))
+        await loadPage(1, listing.counts, STATE_ORDER.filter((s) => selectedStates.has(s)), listing.source)
       } catch (err) {
         if (!cancelled) {
           const message = err instanceof Error ? err.message : String(err)
@@ -608,8 +608,8 @@ export default function GovernancePage() {
       setShowCreate(false)
       setNewProposal('')
       // Refresh counts and reload first page
-      const counts = await refreshCounts()
-      await loadPage(1, counts, STATE_ORDER.filter((s) => selectedStates.has(s)))
+      const listing = await refreshCounts()
+      await loadPage(1, listing.counts, STATE_ORDER.filter((s) => selectedStates.has(s)), listing.source)
     } catch (err) {
       const message = err instanceof Error ? err.message : String(err)
       setSubmitError(message)
@@ -805,8 +805,8 @@ export default function GovernancePage() {
                           // Ensure state reflects new window immediately
                           await syncProposalState(scheduleForId as `0x${string}`)
                           // Refresh list
-                          await refreshCounts()
-                          await loadPage(currentPage)
+                          const listing = await refreshCounts()
+                          await loadPage(currentPage, listing.counts, undefined, listing.source)
                           setScheduleForId(null)
                         } catch (err) {
                           const message = err instanceof Error ? err.message : String(err)
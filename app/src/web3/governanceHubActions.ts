@@ -1,9 +1,9 @@
-import { readContract, writeContract, waitForTransactionReceipt } from 'wagmi/actions'
+import { getPublicClient, readContract, readContracts, writeContract, waitForTransactionReceipt } from 'wagmi/actions'
 import { ACTIVE_CONTRACTS } from '../config/contracts'
 import { wagmiConfig } from './wagmi'
 import { ABIS } from '../abis'
-import { ACTIVE_CHAIN_ID } from '../config/environment'
-import { parseEventLogs, type Abi } from 'viem'
+import { ACTIVE_CHAIN_ID, HUB_API_URL } from '../config/environment'
+import { keccak256, parseAbiItem, parseEventLogs, stringToBytes, type Abi } from 'viem'
 
 export type Address = `0x${string}`
 
@@ -41,6 +41,57 @@ export async function getProposalCountByState(state: HubProposalState): Promise<
   return Number(result as bigint)
 }
 
+/**
+ * Where a proposal listing is paged from. The hub API (indexer) orders each
+ * state by when proposals entered it, while the hub's own lists are reordered
+ * by swap-and-pop removals, so offsets from one source do not line up with the
+ * other. Take the counts and every page of one listing from the same source.
+ */
+export type ProposalListSource = 'api' | 'chain'
+
+/**
+ * Per-state proposal counts and the source to page them from: the hub API
+ * when configured and reachable (unless `source` is 'chain'), else the chain.
+ */
+export async function readProposalCounts(
+  source?: ProposalListSource
+): Promise<{ source: ProposalListSource; counts: Record<number, number> }> {
+  if (HUB_API_URL && source !== 'chain') {
+    try {
+      const res = await fetch(`${HUB_API_URL}/health`)
+      if (!res.ok) throw new Error(`hub api: HTTP ${res.status}`)
+      const { counts } = (await res.json()) as { counts: Record<keyof typeof HubProposalState, number> }
+      return {
+        source: 'api',
+        counts: {
+          [HubProposalState.DRAFT]: counts.DRAFT ?? 0,
+          [HubProposalState.OPEN]: counts.OPEN ?? 0,
+          [HubProposalState.ACTIVE]: counts.ACTIVE ?? 0,
+          [HubProposalState.CLOSED]: counts.CLOSED ?? 0,
+        },
+      }
+    } catch (e) {
+      // Indexer/API down: list from chain reads instead
+      console.warn('hub api unavailable, reading from chain', e)
+    }
+  }
+  const [draft, open, active, closed] = await Promise.all([
+    getProposalCountByState(HubProposalState.DRAFT),
+    getProposalCountByState(HubProposalState.OPEN),
+    getProposalCountByState(HubProposalState.ACTIVE),
+    getProposalCountByState(HubProposalState.CLOSED),
+  ])
+  return {
+    source: 'chain',
+    counts: {
+      [HubProposalState.DRAFT]: draft,
+      [HubProposalState.OPEN]: open,
+      [HubProposalState.ACTIVE]: active,
+      [HubProposalState.CLOSED]: closed,
+    },
+  }
+}
+
 export async function getProposalsByState(opts: {
   state: HubProposalState
   offset: number
@@ -135,15 +186,159 @@ export async function readProposalDetails(addr: Address): Promise<ProposalDetail
   }
 }
 
-export async function readProposalBody(addr: Address): Promise<string> {
-  const body = await readContract(wagmiConfig, {
-    address: addr,
-    abi: ABIS.ProposalTemplate,
-    functionName: 'body',
-    args: [],
+type LensSummary = {
+  proposal: Address
+  title: string
+  author: Address
+  createdAt: bigint
+  voteStart: bigint
+  voteEnd: bigint
+  votesFor: bigint
+  votesAgainst: bigint
+}
+
+type ApiProposal = {
+  address: Address
+  title: string
+  author: Address
+  createdAt: number
+  voteStart: number
+  voteEnd: number
+  votesFor: number
+  votesAgainst: number
+}
+
+async function fetchSummariesFromApi(opts: {
+  state: HubProposalState
+  offset: number
+  count: number
+  reverse: boolean
+}): Promise<ProposalDetails[]> {
+  const { state, offset, count, reverse } = opts
+  const res = await fetch(
+    `${HUB_API_URL}/proposals?state=${state}&offset=${offset}&count=${count}&reverse=${reverse}`
+  )
+  if (!res.ok) throw new Error(`hub api: HTTP ${res.status}`)
+  const page = (await res.json()) as { items: ApiProposal[] }
+  return page.items.map((p) => ({
+    address: p.address,
+    title: p.title,
+    author: p.author,
+    createdAt: p.createdAt,
+    voteStart: p.voteStart,
+    voteEnd: p.voteEnd,
+    votesFor: BigInt(p.votesFor),
+    votesAgainst: BigInt(p.votesAgainst),
+  }))
+}
+
+/**
+ * One page of proposals with their details. With `source: 'api'` the page
+ * comes from the hub API; otherwise uses GovernanceLens (a single eth_call)
+ * when configured, falling back to getProposals plus per-proposal reads.
+ */
+export async function readProposalSummaries(opts: {
+  state: HubProposalState
+  offset: number
+  count: number
+  reverse?: boolean
+  source?: ProposalListSource
+}): Promise<ProposalDetails[]> {
+  // No silent fallback: an API offset means nothing on chain (see ProposalListSource)
+  if (opts.source === 'api') {
+    return fetchSummariesFromApi({ ...opts, reverse: opts.reverse ?? true })
+  }
+  ensureHubConfigured()
+  const lens = ACTIVE_CONTRACTS.governanceLens
+  if (!lens?.address || isZeroAddress(lens.address)) {
+    const addrs = await getProposalsByState(opts)
+    return Promise.all(addrs.map((a) => readProposalDetails(a)))
+  }
+  const { state, offset, count, reverse = true } = opts
+  const result = (await readContract(wagmiConfig, {
+    address: lens.address,
+    abi: lens.abi,
+    functionName: 'getProposalSummaries',
+    args: [hubConfig.address, BigInt(state), BigInt(offset), BigInt(count), reverse],
     chainId: ACTIVE_CHAIN_ID,
+  })) as readonly LensSummary[]
+  return result.map((s) => ({
+    address: s.proposal,
+    title: String(s.title),
+    author: s.author,
+    createdAt: Number(s.createdAt),
+    voteStart: Number(s.voteStart),
+    voteEnd: Number(s.voteEnd),
+    votesFor: BigInt(s.votesFor),
+    votesAgainst: BigInt(s.votesAgainst),
+  }))
+}
+
+const ZERO_HASH = `0x${'0'.repeat(64)}`
+
+const proposalBodyEvent = parseAbiItem(
+  'event ProposalBody(address indexed proposal, bytes32 indexed bodyHash, string body)'
+)
+
+function verifyBody(body: string, expectedHash: string): string {
+  if (keccak256(stringToBytes(body)).toLowerCase() !== expectedHash.toLowerCase()) {
+    throw new Error(`Proposal body does not match its commitment ${expectedHash}`)
+  }
+  return body
+}
+
+// Hashed body mode: the hub only keeps keccak256(body); the text is in ProposalBody.
+// The event is logged in the creation block, which the hub records in snapshot
+// weight mode; otherwise scan from the hub's deployment block.
+async function readCommittedBody(
+  addr: Address,
+  committed: `0x${string}`,
+  createdBlock: bigint
+): Promise<string> {
+  const client = getPublicClient(wagmiConfig, { chainId: ACTIVE_CHAIN_ID })
+  const logs = await client.getLogs({
+    address: hubConfig.address,
+    event: proposalBodyEvent,
+    args: { proposal: addr, bodyHash: committed },
+    fromBlock: createdBlock > 0n ? createdBlock : hubConfig.deployBlock,
+    toBlock: createdBlock > 0n ? createdBlock : 'latest',
+  })
+  if (logs.length === 0) throw new Error(`No ProposalBody event for ${addr}`)
+  return verifyBody(String(logs[0].args.body), committed)
+}
+
+// The hub API only saves the ProposalBody log scan; its bytes are checked
+// against the on-chain commitment, never against a hash the API reports
+async function fetchBodyFromApi(addr: Address, committed: `0x${string}`): Promise<string | null> {
+  try {
+    const res = await fetch(`${HUB_API_URL}/proposals/${addr}/body`)
+    if (!res.ok) throw new Error(`hub api: HTTP ${res.status}`)
+    const data = (await res.json()) as { body: string }
+    return verifyBody(data.body, committed)
+  } catch (e) {
+    console.warn('hub api body unavailable or not matching the commitment, reading it from chain', e)
+    return null
+  }
+}
+
+export async function readProposalBody(addr: Address): Promise<string> {
+  ensureHubConfigured()
+  // Template body (stored mode), hub commitment (hashed mode) and creation block in one multicall
+  const [body, committed, createdBlock] = await readContracts(wagmiConfig, {
+    allowFailure: false,
+    contracts: [
+      { address: addr, abi: ABIS.ProposalTemplate, functionName: 'body', chainId: ACTIVE_CHAIN_ID },
+      { address: hubConfig.address, abi: hubConfig.abi, functionName: 'bodyHash', args: [addr], chainId: ACTIVE_CHAIN_ID },
+      { address: hubConfig.address, abi: hubConfig.abi, functionName: 'createdBlock', args: [addr], chainId: ACTIVE_CHAIN_ID },
+    ],
   })
-  return String(body)
+  if (committed === ZERO_HASH) return String(body)
+  const commitment = committed as `0x${string}`
+  if (HUB_API_URL) {
+    const fromApi = await fetchBodyFromApi(addr, commitment)
+    if (fromApi !== null) return fromApi
+  }
+  return readCommittedBody(addr, commitment, BigInt(createdBlock as bigint))
 }
 
 export async function setVotingWindow(opts: {
@@ -1,8 +1,12 @@
 # @version ^0.4.3
 
+# Upper bound for batch calls (ids/amounts/owners/recipients per call). One
+# constant so deployments can size it; callers' interfaces must match.
+MAX_BATCH: constant(uint256) = 500
+
 interface IERC1155Receiver:
     def onERC1155Received(operator: address, _from: address, id: uint256, amount: uint256, data: Bytes[1024]) -> bytes4: nonpayable
-    def onERC1155BatchReceived(operator: address, _from: address, ids: DynArray[uint256, 100], amounts: DynArray[uint256, 100], data: Bytes[1024]) -> bytes4: nonpayable
+    def onERC1155BatchReceived(operator: address, _from: address, ids: DynArray[uint256, MAX_BATCH], amounts: DynArray[uint256, MAX_BATCH], data: Bytes[1024]) -> bytes4: nonpayable
 
 event TransferSingle:
     operator: indexed(address)
@@ -15,14 +19,22 @@ event TransferBatch:
     operator: indexed(address)
     _from: indexed(address)
     to: indexed(address)
-    ids: DynArray[uint256, 100]
-    amounts: DynArray[uint256, 100]
+    ids: DynArray[uint256, MAX_BATCH]
+    amounts: DynArray[uint256, MAX_BATCH]
 
 event ApprovalForAll:
     owner: indexed(address)
     operator: indexed(address)
     approved: bool
 
+event TransferHookUpdated:
+    hook: indexed(address)
+    by: indexed(address)
+
+# A call to the transfer hook failed; whatever it caches may now be stale
+event TransferHookFailed:
+    hook: indexed(address)
+
 event URI:
     value: String[256]
     id: indexed(uint256)
@@ -39,12 +51,31 @@ ERC1155_METADATA_INTERFACE_ID: constant(bytes4) = 0x0e89341c
 ERC1155_RECEIVED: constant(bytes4) = 0xf23a6e61
 ERC1155_BATCH_RECEIVED: constant(bytes4) = 0xbc197c81
 
+# Account slot, one per (id, owner), so a balance change is one read and
+# one write: balance | checkpoint count << 128 | last checkpoint block << 192
+BALANCE_MASK: constant(uint256) = (1 << 128) - 1
+COUNT_SHIFT: constant(uint256) = 128
+LAST_BLOCK_SHIFT: constant(uint256) = 192
+UINT64_MASK: constant(uint256) = (1 << 64) - 1
+
+# Balance history for snapshot lookups (balanceOfAt): one checkpoint per
+# (id, owner) per block that changed the balance, packed as
+# block << 128 | balance, in block order. The latest checkpoint is the
+# account slot itself; it is archived here only when a later block replaces
+# it, so an account's first balance costs no history write.
+CHECKPOINT_BLOCK_SHIFT: constant(uint256) = 128
+MAX_CHECKPOINT_SEARCH: constant(uint256) = 64  # binary search steps; covers 2**64 checkpoints
+
 # State variables
-balances: HashMap[uint256, HashMap[address, uint256]]
+_accounts: HashMap[uint256, HashMap[address, uint256]]
+_checkpoints: HashMap[uint256, HashMap[address, HashMap[uint256, uint256]]]
 operatorApprovals: HashMap[address, HashMap[address, bool]]
 _uri: String[256]
 
 owner: public(address)
+# Optional observer told about every balance change through
+# onTokenTransfer(address,address,uint256[]) (e.g. a GovernanceHub gate cache)
+transferHook: public(address)
 
 @deploy
 def __init__():
@@ -74,22 +105,87 @@ def balanceOf(owner: address, id: uint256) -> uint256:
     """
     @dev See {IERC1155-balanceOf}.
     """
-    return self.balances[id][owner]
+    return self._accounts[id][owner] & BALANCE_MASK
 
 @external
 @view
-def balanceOfBatch(owners: DynArray[address, 100], ids: DynArray[uint256, 100]) -> DynArray[uint256, 100]:
+def balanceOfBatch(owners: DynArray[address, MAX_BATCH], ids: DynArray[uint256, MAX_BATCH]) -> DynArray[uint256, MAX_BATCH]:
     """
     @dev See {IERC1155-balanceOfBatch}.
     """
-    assert len(owners) == len(ids), "ERC1155: owners and ids length mismatch"
-    result: DynArray[uint256, 100] = []
-    for i: uint256 in range(100):
-        if i >= len(owners):
-            break
-        result.append(self.balances[ids[i]][owners[i]])
+    n: uint256 = len(owners)
+    assert n == len(ids), "ERC1155: owners and ids length mismatch"
+    result: DynArray[uint256, MAX_BATCH] = []
+    for i: uint256 in range(n, bound=MAX_BATCH):
+        result.append(self._accounts[ids[i]][owners[i]] & BALANCE_MASK)
     return result
 
+@external
+@view
+def numCheckpoints(owner: address, id: uint256) -> uint256:
+    """
+    @dev Number of balance checkpoints recorded for `owner` and `id`.
+    """
+    return (self._accounts[id][owner] >> COUNT_SHIFT) & UINT64_MASK
+
+@external
+@view
+def balanceOfAt(owner: address, id: uint256, blockNumber: uint256) -> uint256:
+    """
+    @dev Balance of `owner` for `id` at the end of `blockNumber`, which must
+    already be mined. Binary search over the owner's checkpoints, so the cost
+    grows with log2 of the history length.
+    """
+    assert blockNumber < block.number, "ERC1155: block not yet mined"
+    acct: uint256 = self._accounts[id][owner]
+    n: uint256 = (acct >> COUNT_SHIFT) & UINT64_MASK
+    # Recent snapshots are the common case: the account slot holds the latest
+    if n == 0 or acct >> LAST_BLOCK_SHIFT <= blockNumber:
+        return acct & BALANCE_MASK
+    if n == 1 or self._checkpoints[id][owner][0] >> CHECKPOINT_BLOCK_SHIFT > blockNumber:
+        return 0
+    # Invariant: checkpoint lo is at or before blockNumber, checkpoint hi after
+    # it; hi starts at the latest (the account slot), so mid is always archived
+    lo: uint256 = 0
+    hi: uint256 = n - 1
+    for _: uint256 in range(MAX_CHECKPOINT_SEARCH):
+        if hi - lo <= 1:
+            break
+        mid: uint256 = (lo + hi) // 2
+        if self._checkpoints[id][owner][mid] >> CHECKPOINT_BLOCK_SHIFT <= blockNumber:
+            lo = mid
+        else:
+            hi = mid
+    return self._checkpoints[id][owner][lo] & BALANCE_MASK
+
+@internal
+def _setBalance(owner: address, id: uint256, acct: uint256, amount: uint256):
+    """
+    @dev Write a balance and its checkpoint for the current block, given the
+    account slot `acct` read by the caller.
+    """
+    assert amount <= BALANCE_MASK, "ERC1155: balance overflow"
+    n: uint256 = (acct >> COUNT_SHIFT) & UINT64_MASK
+    last_block: uint256 = acct >> LAST_BLOCK_SHIFT
+    # A second change in the same block only rewrites the account slot
+    if n == 0 or last_block != block.number:
+        if n > 0:
+            self._checkpoints[id][owner][n - 1] = (last_block << CHECKPOINT_BLOCK_SHIFT) | (acct & BALANCE_MASK)
+        n += 1
+    self._accounts[id][owner] = amount | (n << COUNT_SHIFT) | (block.number << LAST_BLOCK_SHIFT)
+
+@internal
+def _credit(to: address, id: uint256, amount: uint256):
+    acct: uint256 = self._accounts[id][to]
+    self._setBalance(to, id, acct, (acct & BALANCE_MASK) + amount)
+
+@internal
+def _debit(_from: address, id: uint256, amount: uint256):
+    acct: uint256 = self._accounts[id][_from]
+    from_balance: uint256 = acct & BALANCE_MASK
+    assert from_balance >= amount, "ERC1155: insufficient balance for transfer"
+    self._setBalance(_from, id, acct, from_balance - amount)
+
 @external
 def setApprovalForAll(operator: address, approved: bool):
     """
@@ -106,6 +202,42 @@ def isApprovedForAll(owner: address, operator: address) -> bool:
     """
     return self.operatorApprovals[owner][operator]
 
+@external
+def setTransferHook(hook: address):
+    """
+    @dev Register a contract to be called after every balance change, or
+    empty(address) to stop. Only owner can set. The hook being replaced is
+    told through onTransferHookRemoved() (failures ignored), so a hub serving
+    gate checks from its cache stops trusting it.
+    """
+    assert msg.sender == self.owner, "ERC1155: only owner can set hook"
+    old: address = self.transferHook
+    self.transferHook = hook
+    if old != empty(address) and old != hook:
+        # Best effort: a hook without the callback must not block the change
+        if not raw_call(old, method_id("onTransferHookRemoved()"), revert_on_failure=False):
+            log TransferHookFailed(old)
+    log TransferHookUpdated(hook, msg.sender)
+
+@internal
+def _notifyHook(_from: address, to: address, ids: DynArray[uint256, MAX_BATCH]):
+    """
+    @dev Tell the transfer hook, if any, which balances changed. Runs after
+    balances are updated and before receiver callbacks. A reverting hook must
+    not stop token movement, so a failure is only logged (its cache is now
+    stale).
+    """
+    hook: address = self.transferHook
+    if hook == empty(address):
+        return
+    ok: bool = raw_call(
+        hook,
+        abi_encode(_from, to, ids, method_id=method_id("onTokenTransfer(address,address,uint256[])")),
+        revert_on_failure=False,
+    )
+    if not ok:
+        log TransferHookFailed(hook)
+
 @internal
 def _safeTransferFrom(_from: address, to: address, id: uint256, amount: uint256, data: Bytes[1024]):
     """
@@ -113,37 +245,44 @@ def _safeTransferFrom(_from: address, to: address, id: uint256, amount: uint256,
     """
     assert to != empty(address), "ERC1155: transfer to the zero address"
 
-    from_balance: uint256 = self.balances[id][_from]
-    assert from_balance >= amount, "ERC1155: insufficient balance for transfer"
-    self.balances[id][_from] = from_balance - amount
-    self.balances[id][to] += amount
+    self._debit(_from, id, amount)
+    self._credit(to, id, amount)
 
     log TransferSingle(msg.sender, _from, to, id, amount)
+    self._notifyHook(_from, to, [id])
 
     if to.is_contract:
         response: bytes4 = extcall IERC1155Receiver(to).onERC1155Received(msg.sender, _from, id, amount, data)
         assert response == ERC1155_RECEIVED, "ERC1155: ERC1155Receiver rejected tokens"
 
 @internal
-def _safeBatchTransferFrom(_from: address, to: address, ids: DynArray[uint256, 100], amounts: DynArray[uint256, 100], data: Bytes[1024]):
+def _safeBatchTransferFrom(_from: address, to: address, ids: DynArray[uint256, MAX_BATCH], amounts: DynArray[uint256, MAX_BATCH], data: Bytes[1024]):
     """
     @dev Transfers `amounts` tokens of token types `ids` from `from` to `to`.
     """
     assert to != empty(address), "ERC1155: transfer to the zero address"
-    assert len(ids) == len(amounts), "ERC1155: ids and amounts length mismatch"
-
-    for i: uint256 in range(100):
-        if i >= len(ids):
-            break
-        id: uint256 = ids[i]
-        amount: uint256 = amounts[i]
-
-        from_balance: uint256 = self.balances[id][_from]
-        assert from_balance >= amount, "ERC1155: insufficient balance for transfer"
-        self.balances[id][_from] = from_balance - amount
-        self.balances[id][to] += amount
+    n: uint256 = len(ids)
+    assert n == len(amounts), "ERC1155: ids and amounts length mismatch"
+
+    # A run of the same id (sorted batches group every repeat) moves its
+    # summed amount with one debit and one credit
+    if n > 0:
+        run_id: uint256 = ids[0]
+        total: uint256 = amounts[0]
+        for i: uint256 in range(1, n, bound=MAX_BATCH):
+            id: uint256 = ids[i]
+            if id == run_id:
+                total += amounts[i]
+                continue
+            self._debit(_from, run_id, total)
+            self._credit(to, run_id, total)
+            run_id = id
+            total = amounts[i]
+        self._debit(_from, run_id, total)
+        self._credit(to, run_id, total)
 
     log TransferBatch(msg.sender, _from, to, ids, amounts)
+    self._notifyHook(_from, to, ids)
 
     if to.is_contract:
         response: bytes4 = extcall IERC1155Receiver(to).onERC1155BatchReceived(msg.sender, _from, ids, amounts, data)
@@ -158,7 +297,7 @@ def safeTransferFrom(_from: address, to: address, id: uint256, amount: uint256,
     self._safeTransferFrom(_from, to, id, amount, data)
 
 @external
-def safeBatchTransferFrom(_from: address, to: address, ids: DynArray[uint256, 100], amounts: DynArray[uint256, 100], data: Bytes[1024]):
+def safeBatchTransferFrom(_from: address, to: address, ids: DynArray[uint256, MAX_BATCH], amounts: DynArray[uint256, MAX_BATCH], data: Bytes[1024]):
     """
     @dev See {IERC1155-safeBatchTransferFrom}.
     """
@@ -173,33 +312,62 @@ def mint(to: address, id: uint256, amount: uint256, data: Bytes[1024]):
     assert msg.sender == self.owner, "ERC1155: only owner can mint"
     assert to != empty(address), "ERC1155: mint to the zero address"
 
-    self.balances[id][to] += amount
+    self._credit(to, id, amount)
     log TransferSingle(msg.sender, empty(address), to, id, amount)
+    self._notifyHook(empty(address), to, [id])
 
     if to.is_contract:
         response: bytes4 = extcall IERC1155Receiver(to).onERC1155Received(msg.sender, empty(address), id, amount, data)
         assert response == ERC1155_RECEIVED, "ERC1155: ERC1155Receiver rejected tokens"
 
 @external
-def mintBatch(to: address, ids: DynArray[uint256, 100], amounts: DynArray[uint256, 100], data: Bytes[1024]):
+def mintBatch(to: address, ids: DynArray[uint256, MAX_BATCH], amounts: DynArray[uint256, MAX_BATCH], data: Bytes[1024]):
     """
     @dev Mint tokens in batch. Only owner can mint.
     """
     assert msg.sender == self.owner, "ERC1155: only owner can mint"
     assert to != empty(address), "ERC1155: mint to the zero address"
-    assert len(ids) == len(amounts), "ERC1155: ids and amounts length mismatch"
-
-    for i: uint256 in range(100):
-        if i >= len(ids):
-            break
-        self.balances[ids[i]][to] += amounts[i]
+    n: uint256 = len(ids)
+    assert n == len(amounts), "ERC1155: ids and amounts length mismatch"
+
+    # Same run grouping as _safeBatchTransferFrom: one credit per run of an id
+    if n > 0:
+        run_id: uint256 = ids[0]
+        total: uint256 = amounts[0]
+        for i: uint256 in range(1, n, bound=MAX_BATCH):
+            id: uint256 = ids[i]
+            if id == run_id:
+                total += amounts[i]
+                continue
+            self._credit(to, run_id, total)
+            run_id = id
+            total = amounts[i]
+        self._credit(to, run_id, total)
 
     log TransferBatch(msg.sender, empty(address), to, ids, amounts)
+    self._notifyHook(empty(address), to, ids)
 
     if to.is_contract:
         response: bytes4 = extcall IERC1155Receiver(to).onERC1155BatchReceived(msg.sender, empty(address), ids, amounts, data)
         assert response == ERC1155_BATCH_RECEIVED, "ERC1155: ERC1155Receiver rejected tokens"
 
+@external
+def mintToMany(recipients: DynArray[address, MAX_BATCH], id: uint256, amount: uint256, data: Bytes[1024]):
+    """
+    @dev Mint `amount` of `id` to each recipient (airdrop). Only owner can
+    mint. Same events, hook calls and receiver checks as one mint() per
+    recipient, without a transaction per recipient.
+    """
+    assert msg.sender == self.owner, "ERC1155: only owner can mint"
+    for to: address in recipients:
+        assert to != empty(address), "ERC1155: mint to the zero address"
+        self._credit(to, id, amount)
+        log TransferSingle(msg.sender, empty(address), to, id, amount)
+        self._notifyHook(empty(address), to, [id])
+        if to.is_contract:
+            response: bytes4 = extcall IERC1155Receiver(to).onERC1155Received(msg.sender, empty(address), id, amount, data)
+            assert response == ERC1155_RECEIVED, "ERC1155: ERC1155Receiver rejected tokens"
+
 @external
 @view
 def uri(id: uint256) -> String[256]:
@@ -209,12 +377,14 @@ def uri(id: uint256) -> String[256]:
     return self._uri
 
 @external
-def setURI(newuri: String[256]):
+def setURI(newuri: String[256], ids: DynArray[uint256, MAX_BATCH] = []):
     """
-    @dev Set the base URI for all token types. Only owner can set.
+    @dev Set the base URI for all token types. Only owner can set. Emits URI
+    for each of `ids` (the token types in use); with no ids, for id 0 only.
     """
     assert msg.sender == self.owner, "ERC1155: only owner can set URI"
     self._uri = newuri
-    # Note: In a full implementation, you might want to emit URI events for each token ID
-    # For simplicity, we're emitting for ID 0
-    log URI(newuri, 0)
+    if len(ids) == 0:
+        log URI(newuri, 0)
+    for id: uint256 in ids:
+        log URI(newuri, id)
@@ -8,6 +8,9 @@ GovernanceHub
 
 interface IERC1155:
     def balanceOf(owner: address, id: uint256) -> uint256: view
+    def balanceOfBatch(owners: DynArray[address, 100], ids: DynArray[uint256, 100]) -> DynArray[uint256, 100]: view
+    def transferHook() -> address: view
+    def balanceOfAt(owner: address, id: uint256, blockNumber: uint256) -> uint256: view
 
 interface IProposalTemplate:
     def initialize(
@@ -23,6 +26,7 @@ interface IProposalTemplate:
     def hubCastVote(_voter: address, support: bool, weight: uint256): nonpayable
     def voteStart() -> uint256: view
     def voteEnd() -> uint256: view
+    def votingWindow() -> (uint256, uint256): view
     def author() -> address: view
     def votesFor() -> uint256: view
     def votesAgainst() -> uint256: view
@@ -52,6 +56,12 @@ event StateChanged:
     newState: uint256
     by: indexed(address)
 
+event VotingWindowUpdated:
+    proposal: indexed(address)
+    voteStart: uint256
+    voteEnd: uint256
+    by: indexed(address)
+
 event CommentAdded:
     proposal: indexed(address)
     comment: indexed(address)
@@ -62,6 +72,42 @@ event CommentDeleted:
     comment: indexed(address)
     byAdmin: indexed(address)
 
+# Light comments: content lives only in this event (no clone, no content storage)
+event LightCommentAdded:
+    proposal: indexed(address)
+    commentId: indexed(uint256)
+    author: indexed(address)
+    sentiment: uint256
+    createdAt: uint256
+    content: String[1024]
+
+event LightCommentDeleted:
+    proposal: indexed(address)
+    commentId: indexed(uint256)
+    byAdmin: indexed(address)
+
+# Hashed body mode: the body is only in this event; the hub keeps its hash
+event ProposalBody:
+    proposal: indexed(address)
+    bodyHash: indexed(bytes32)
+    body: String[4096]
+
+event BodyModeUpdated:
+    mode: uint256
+    by: indexed(address)
+
+event WindowIndexUpdated:
+    enabled: bool
+    by: indexed(address)
+
+event GateCacheUpdated:
+    enabled: bool
+    by: indexed(address)
+
+event CommentModeUpdated:
+    mode: uint256
+    by: indexed(address)
+
 event TemplatesUpdated:
     proposalTemplate: address
     commentTemplate: address
@@ -86,6 +132,10 @@ event BobuChanged:
     oldBobu: indexed(address)
     newBobu: indexed(address)
 
+event VoteWeightModeUpdated:
+    mode: uint256
+    by: indexed(address)
+
 enum ProposalState:
     DRAFT
     OPEN
@@ -97,8 +147,95 @@ STATE_OPEN: constant(uint256) = 1
 STATE_ACTIVE: constant(uint256) = 2
 STATE_CLOSED: constant(uint256) = 3
 
-MAX_PROPOSALS: constant(uint256) = 10000
 PAGE_LIMIT: constant(uint256) = 100
+LEADERBOARD_SIZE: constant(uint256) = 10
+MAX_VOTE_BATCH: constant(uint256) = 50
+
+MAX_COMMENT_BATCH: constant(uint256) = 20
+MAX_SYNC_BATCH: constant(uint256) = 100
+
+# EIP-712
+EIP712_NAME: constant(String[13]) = "GovernanceHub"
+EIP712_VERSION: constant(String[1]) = "1"
+EIP712_DOMAIN_TYPEHASH: constant(bytes32) = keccak256(
+    "EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+VOTE_TYPEHASH: constant(bytes32) = keccak256(
+    "Vote(address voter,address proposal,bool support,uint256 nonce,uint256 deadline)"
+)
+COMMENT_TYPEHASH: constant(bytes32) = keccak256(
+    "Comment(address author,address proposal,string content,uint256 sentiment,uint256 nonce,uint256 deadline)"
+)
+SECP256K1_HALF_N: constant(uint256) = 57896044618658097711785492504343953926418782139537452191302581570759080747168
+
+struct SignedVote:
+    voter: address
+    proposal: address
+    support: bool
+    nonce: uint256
+    deadline: uint256
+    v: uint8
+    r: bytes32
+    s: bytes32
+
+struct SignedComment:
+    author: address
+    proposal: address
+    content: String[1024]
+    sentiment: uint256
+    nonce: uint256
+    deadline: uint256
+    v: uint8
+    r: bytes32
+    s: bytes32
+
+# Body modes
+BODY_MODE_STORED: constant(uint256) = 0  # body written to ProposalTemplate.body
+BODY_MODE_HASHED: constant(uint256) = 1  # keccak256(body) + length on the hub, body in ProposalBody
+
+# Comment modes
+COMMENT_MODE_CLONE: constant(uint256) = 0  # CommentTemplate clone per comment
+COMMENT_MODE_LIGHT: constant(uint256) = 1  # event + one packed storage word
+
+# Light comment record: author | createdAt << 160 | sentiment << 224 | deleted << 232
+LIGHT_CREATED_SHIFT: constant(uint256) = 160
+LIGHT_SENTIMENT_SHIFT: constant(uint256) = 224
+LIGHT_DELETED_BIT: constant(uint256) = 1 << 232
+ADDRESS_MASK: constant(uint256) = (1 << 160) - 1
+UINT64_MASK: constant(uint256) = (1 << 64) - 1
+
+# Gate cache entry: (balance + 1) | epoch << 128; 0 in the low half = unknown
+GATE_EPOCH_SHIFT: constant(uint256) = 128
+UINT128_MASK: constant(uint256) = (1 << 128) - 1
+MAX_GATE_REFRESH: constant(uint256) = 100  # also the hasTokenBatch bound
+MAX_TOKEN_BATCH: constant(uint256) = 500   # ERC1155.MAX_BATCH; ids per transfer hook call
+
+# Window boundary index: proposals bucketed by the hour their voteStart /
+# voteEnd falls in. Entry: proposal | timestamp << 160 | isEnd << 200
+WINDOW_BUCKET: constant(uint256) = 3600
+MAX_WINDOW_BUCKETS: constant(uint256) = 168  # one week of buckets per query
+MAX_WINDOW_SCAN: constant(uint256) = 512     # bucket entries read per query
+WINDOW_TS_SHIFT: constant(uint256) = 160
+WINDOW_END_BIT: constant(uint256) = 1 << 200
+UINT40_MASK: constant(uint256) = (1 << 40) - 1
+
+struct WindowBoundary:
+    proposal: address
+    timestamp: uint256
+    isEnd: bool
+    state: uint256
+
+struct LightComment:
+    id: uint256
+    author: address
+    createdAt: uint256
+    sentiment: uint256
+    deleted: bool
+
+# Vote weight modes
+VOTE_WEIGHT_ONE: constant(uint256) = 0      # 1 address = 1 vote
+VOTE_WEIGHT_BALANCE: constant(uint256) = 1  # weight = tokenContract1155 balance of tokenId1155
+VOTE_WEIGHT_SNAPSHOT: constant(uint256) = 2 # weight = that balance just before the proposal's creation block
 COMMENT_DELETE_WINDOW: constant(uint256) = 14 * 86400
 
 bobuMultisig: public(address)
@@ -113,15 +250,60 @@ tokenId1155: public(uint256)
 gateProposals: public(bool)
 gateComments: public(bool)
 gateVotes: public(bool)
-
-draftProposals: DynArray[address, MAX_PROPOSALS]
-openProposals: DynArray[address, MAX_PROPOSALS]
-activeProposals: DynArray[address, MAX_PROPOSALS]
-closedProposals: DynArray[address, MAX_PROPOSALS]
+voteWeightMode: public(uint256)
+# Block each proposal was created in; recorded only in VOTE_WEIGHT_SNAPSHOT mode
+createdBlock: public(HashMap[address, uint256])
+commentMode: public(uint256)
+bodyMode: public(uint256)
+
+# Token balance cache kept fresh by the bundled ERC1155's transfer hook.
+# Bumping _gateEpoch (token change / re-enable) invalidates every entry.
+gateCacheEnabled: public(bool)
+_gateEpoch: uint256
+_gateCache: HashMap[address, uint256]
+
+# Per-state proposal lists: state -> index -> proposal, plus a length per
+# state. Mapping-backed, so no state has a length cap; together with
+# indexByProposalPlusOne this keeps append and swap-and-pop removal O(1).
+_stateList: HashMap[uint256, HashMap[uint256, address]]
+_stateLength: HashMap[uint256, uint256]
 
 stateByProposalPlusOne: HashMap[address, uint256]
 indexByProposalPlusOne: HashMap[address, uint256]
 
+# --------------------------
+# Active leaderboard
+# --------------------------
+# Total votes (for + against) routed through castVote
+totalVotes: public(HashMap[address, uint256])
+# ACTIVE proposals ordered by totalVotes desc (ties: earliest entrant first).
+# Invariant: every ACTIVE proposal outside the board has totalVotes <= _outsideMax,
+# and a proposal only fills a free slot if it reaches that bound, so the board
+# is always the exact top of the active set.
+leaderboard: DynArray[address, LEADERBOARD_SIZE]
+leaderboardPosPlusOne: HashMap[address, uint256]
+_outsideMax: uint256
+
+# Hashed-mode body commitments (zero hash = body stored on the template)
+bodyHash: public(HashMap[address, bytes32])
+bodyLength: public(HashMap[address, uint256])
+
+# Light comments per proposal: id -> packed record (see LIGHT_* constants)
+_lightComments: HashMap[address, HashMap[uint256, uint256]]
+lightCommentCount: public(HashMap[address, uint256])
+
+# Window boundary index: hour bucket -> index -> packed entry (WINDOW_* constants).
+# Append-only; entries left behind by setVotingWindow are filtered on read.
+# Off by default: each indexed window costs two extra storage writes.
+windowIndexEnabled: public(bool)
+_windowBuckets: HashMap[uint256, HashMap[uint256, uint256]]
+windowBucketLength: public(HashMap[uint256, uint256])
+
+# Next EIP-712 nonce per signer (shared by votes and comments)
+nonces: public(HashMap[address, uint256])
+_cachedChainId: uint256
+_cachedDomainSeparator: bytes32
+
 # --------------------------
 # Metrics
 # --------------------------
@@ -157,6 +339,9 @@ def __init__(
     self.gateComments = False
     self.gateVotes = False
 
+    self._cachedChainId = chain.id
+    self._cachedDomainSeparator = self._buildDomainSeparator()
+
     log AdminsReset(bobuMultisig=self.bobuMultisig, creator=self.creator, elected1=_elected1, elected2=_elected2, elected3=_elected3)
     log TemplatesUpdated(proposalTemplate=_proposalTemplate, commentTemplate=_commentTemplate, by=msg.sender)
 
@@ -217,8 +402,14 @@ def setTemplates(_proposalTemplate: address, _commentTemplate: address):
 @external
 def setTokenRequirement(_token: address, _tokenId: uint256):
     assert msg.sender == self.bobuMultisig or msg.sender == self.creator, "bobu or creator"
+    if self.voteWeightMode == VOTE_WEIGHT_SNAPSHOT:
+        self._requireBalanceOfAt(_token, _tokenId)
     self.tokenContract1155 = _token
     self.tokenId1155 = _tokenId
+    self._gateEpoch += 1
+    if self.gateCacheEnabled:
+        self.gateCacheEnabled = False
+        log GateCacheUpdated(enabled=False, by=msg.sender)
 
 @external
 def setGating(_gateProposals: bool, _gateComments: bool, _gateVotes: bool):
@@ -231,18 +422,135 @@ def setGating(_gateProposals: bool, _gateComments: bool, _gateVotes: bool):
 @external
 @view
 def hasToken(user: address) -> bool:
+    return self._hasToken(user)
+
+@internal
+@view
+def _balancesOf(_users: DynArray[address, MAX_GATE_REFRESH]) -> DynArray[uint256, MAX_GATE_REFRESH]:
+    # One balanceOfBatch for the whole list, all against tokenId1155
+    ids: DynArray[uint256, MAX_GATE_REFRESH] = []
+    for _: address in _users:
+        ids.append(self.tokenId1155)
+    return staticcall IERC1155(self.tokenContract1155).balanceOfBatch(_users, ids)
+
+@external
+@view
+def hasTokenBatch(_users: DynArray[address, MAX_GATE_REFRESH]) -> DynArray[bool, MAX_GATE_REFRESH]:
+    """hasToken for up to MAX_GATE_REFRESH users in a single balanceOfBatch call."""
+    result: DynArray[bool, MAX_GATE_REFRESH] = []
     if self.tokenContract1155 == empty(address):
-        return False
-    bal: uint256 = staticcall IERC1155(self.tokenContract1155).balanceOf(user, self.tokenId1155)
-    return bal > 0
+        for _: address in _users:
+            result.append(False)
+        return result
+    bals: DynArray[uint256, MAX_GATE_REFRESH] = self._balancesOf(_users)
+    for bal: uint256 in bals:
+        result.append(bal > 0)
+    return result
+
+@external
+def setGateCache(_enabled: bool):
+    """
+    Serve gate/weight balances from the hub's cache instead of calling
+    balanceOf on every gated action. Requires the token to report this hub as
+    its transfer hook, so every balance change reaches the cache; the token
+    unhooking the hub (onTransferHookRemoved) disables it again. Enabling
+    starts from an empty cache; unknown users fall back to balanceOf until
+    they transfer or are warmed with refreshGateCache.
+    """
+    self._onlyBobu()
+    if _enabled:
+        assert self.tokenContract1155 != empty(address), "no token"
+        assert staticcall IERC1155(self.tokenContract1155).transferHook() == self, "hook not registered"
+        self._gateEpoch += 1
+    self.gateCacheEnabled = _enabled
+    log GateCacheUpdated(enabled=_enabled, by=msg.sender)
+
+@internal
+def _cacheBalance(user: address, bal: uint256):
+    self._gateCache[user] = (min(bal, UINT128_MASK - 1) + 1) | (self._gateEpoch << GATE_EPOCH_SHIFT)
+
+@external
+def onTokenTransfer(_from: address, _to: address, _ids: DynArray[uint256, MAX_TOKEN_BATCH]):
+    """
+    Transfer hook called by the bundled ERC1155 after balances change.
+    Re-reads the affected balances from the token, so it trusts nothing in
+    the arguments; calls from anything but tokenContract1155 are ignored.
+    """
+    token: address = self.tokenContract1155
+    if msg.sender != token or not self.gateCacheEnabled or self.tokenId1155 not in _ids:
+        return
+    if _from != empty(address):
+        self._cacheBalance(_from, staticcall IERC1155(token).balanceOf(_from, self.tokenId1155))
+    if _to != empty(address):
+        self._cacheBalance(_to, staticcall IERC1155(token).balanceOf(_to, self.tokenId1155))
+
+@external
+def onTransferHookRemoved():
+    """
+    Called by the bundled ERC1155 when this hub stops being its transfer
+    hook. Balance changes would no longer reach the cache, so it is disabled.
+    """
+    if msg.sender == self.tokenContract1155 and self.gateCacheEnabled:
+        self.gateCacheEnabled = False
+        log GateCacheUpdated(enabled=False, by=msg.sender)
+
+@external
+def refreshGateCache(_users: DynArray[address, MAX_GATE_REFRESH]):
+    """Warm the gate cache for holders that predate enabling it (permissionless)."""
+    assert self.gateCacheEnabled, "cache disabled"
+    bals: DynArray[uint256, MAX_GATE_REFRESH] = self._balancesOf(_users)
+    for i: uint256 in range(MAX_GATE_REFRESH):
+        if i >= len(_users):
+            break
+        self._cacheBalance(_users[i], bals[i])
 
 @internal
 @view
-def _hasToken(user: address) -> bool:
+def _requireBalanceOfAt(_token: address, _tokenId: uint256):
+    # Probe instead of trusting the interface: a token without balanceOfAt
+    # would make every snapshot-weighted vote revert
+    assert _token != empty(address), "no token"
+    ok: bool = False
+    res: Bytes[32] = b""
+    ok, res = raw_call(
+        _token,
+        abi_encode(self, _tokenId, block.number - 1, method_id=method_id("balanceOfAt(address,uint256,uint256)")),
+        max_outsize=32,
+        is_static_call=True,
+        revert_on_failure=False,
+    )
+    assert ok and len(res) == 32, "token lacks balanceOfAt"
+
+@external
+def setVoteWeightMode(_mode: uint256):
+    """
+    Switch how castVote weighs a voter. VOTE_WEIGHT_SNAPSHOT needs a token
+    with balanceOfAt (probed here) and only takes effect for proposals
+    created while it is on: createdBlock is recorded at creation, so
+    proposals that predate the switch keep weighing votes by live balance.
+    """
+    self._onlyBobu()
+    assert _mode <= VOTE_WEIGHT_SNAPSHOT, "bad mode"
+    if _mode == VOTE_WEIGHT_SNAPSHOT:
+        self._requireBalanceOfAt(self.tokenContract1155, self.tokenId1155)
+    self.voteWeightMode = _mode
+    log VoteWeightModeUpdated(mode=_mode, by=msg.sender)
+
+@internal
+@view
+def _tokenBalance(user: address) -> uint256:
     if self.tokenContract1155 == empty(address):
-        return False
-    bal: uint256 = staticcall IERC1155(self.tokenContract1155).balanceOf(user, self.tokenId1155)
-    return bal > 0
+        return 0
+    if self.gateCacheEnabled:
+        entry: uint256 = self._gateCache[user]
+        if entry & UINT128_MASK != 0 and entry >> GATE_EPOCH_SHIFT == self._gateEpoch:
+            return (entry & UINT128_MASK) - 1
+    return staticcall IERC1155(self.tokenContract1155).balanceOf(user, self.tokenId1155)
+
+@internal
+@view
+def _hasToken(user: address) -> bool:
+    return self._tokenBalance(user) > 0
 
 @internal
 @view
@@ -258,9 +566,38 @@ def _requireCommenter(user: address):
 
 @internal
 @view
-def _requireVoter(user: address):
+def _voteWeight(user: address) -> uint256:
+    # One balanceOf at most, shared by the gate and the weight.
+    # Snapshot weights depend on the proposal: 0 defers them to _castVote.
+    mode: uint256 = self.voteWeightMode
+    if not self.gateVotes and mode != VOTE_WEIGHT_BALANCE:
+        if mode == VOTE_WEIGHT_SNAPSHOT:
+            return 0
+        return 1
+    bal: uint256 = self._tokenBalance(user)
     if self.gateVotes:
-        assert self._hasToken(user), "token required to vote"
+        assert bal > 0, "token required to vote"
+    if mode == VOTE_WEIGHT_BALANCE:
+        assert bal > 0, "no voting weight"
+        return bal
+    if mode == VOTE_WEIGHT_SNAPSHOT:
+        return 0
+    return 1
+
+@internal
+@view
+def _snapshotWeight(user: address, p: address) -> uint256:
+    # Balance at the end of the block before p was created: fixed before
+    # voting can start, so tokens moved mid-vote carry no extra weight
+    created: uint256 = self.createdBlock[p]
+    bal: uint256 = 0
+    if created == 0:
+        # Created before snapshot mode was enabled: live balance
+        bal = self._tokenBalance(user)
+    elif self.tokenContract1155 != empty(address):
+        bal = staticcall IERC1155(self.tokenContract1155).balanceOfAt(user, self.tokenId1155, created - 1)
+    assert bal > 0, "no voting weight"
+    return bal
 
 @internal
 def _touchUser(u: address):
@@ -268,21 +605,103 @@ def _touchUser(u: address):
         self._seenUser[u] = True
         self.uniqueUsers += 1
 @internal
+def _indexBoundary(p: address, _ts: uint256, _isEnd: bool):
+    bucket: uint256 = _ts // WINDOW_BUCKET
+    n: uint256 = self.windowBucketLength[bucket]
+    entry: uint256 = convert(p, uint256) | (_ts << WINDOW_TS_SHIFT)
+    if _isEnd:
+        entry |= WINDOW_END_BIT
+    self._windowBuckets[bucket][n] = entry
+    self.windowBucketLength[bucket] = n + 1
+
+@internal
+def _indexWindow(p: address, _voteStart: uint256, _voteEnd: uint256):
+    if _voteStart == 0 or not self.windowIndexEnabled:
+        return
+    self._indexBoundary(p, _voteStart, False)
+    self._indexBoundary(p, _voteEnd, True)
+
+@internal
+def _boardBubbleUp(p: address):
+    pos: uint256 = self.leaderboardPosPlusOne[p] - 1
+    total: uint256 = self.totalVotes[p]
+    for _: uint256 in range(LEADERBOARD_SIZE):
+        if pos == 0:
+            break
+        above: address = self.leaderboard[pos - 1]
+        if self.totalVotes[above] >= total:
+            break
+        self.leaderboard[pos] = above
+        self.leaderboardPosPlusOne[above] = pos + 1
+        pos -= 1
+    self.leaderboard[pos] = p
+    self.leaderboardPosPlusOne[p] = pos + 1
+
+@internal
+def _boardOffer(p: address):
+    # p is ACTIVE and not on the board. Only voted proposals take a slot, so a
+    # first vote never has to bubble past a row of zero-vote entries.
+    total: uint256 = self.totalVotes[p]
+    if total == 0:
+        return
+    n: uint256 = len(self.leaderboard)
+    if n < LEADERBOARD_SIZE:
+        if total >= self._outsideMax:
+            self.leaderboard.append(p)
+            self.leaderboardPosPlusOne[p] = n + 1
+            self._boardBubbleUp(p)
+            if n + 1 == self._stateLength[STATE_ACTIVE]:
+                self._outsideMax = 0
+            return
+    elif total > self.totalVotes[self.leaderboard[n - 1]]:
+        evicted: address = self.leaderboard[n - 1]
+        self.leaderboardPosPlusOne[evicted] = 0
+        self._outsideMax = max(self._outsideMax, self.totalVotes[evicted])
+        self.leaderboard[n - 1] = p
+        self.leaderboardPosPlusOne[p] = n
+        self._boardBubbleUp(p)
+        return
+    self._outsideMax = max(self._outsideMax, total)
+
+@internal
+def _boardRemove(p: address):
+    pos_plus_one: uint256 = self.leaderboardPosPlusOne[p]
+    if pos_plus_one == 0:
+        return
+    n: uint256 = len(self.leaderboard)
+    for i: uint256 in range(pos_plus_one - 1, pos_plus_one - 1 + LEADERBOARD_SIZE, bound=LEADERBOARD_SIZE):
+        if i + 1 >= n:
+            break
+        nxt: address = self.leaderboard[i + 1]
+        self.leaderboard[i] = nxt
+        self.leaderboardPosPlusOne[nxt] = i + 1
+    self.leaderboard.pop()
+    self.leaderboardPosPlusOne[p] = 0
+
+@internal
+def _refillBoard():
+    # A leader left while a proposal outside the board may hold votes. If the
+    # whole active set fits in one bounded pass, rebuild the outside bound and
+    # offer every voted outsider (same as a complete refreshLeaderboard).
+    n: uint256 = self._stateLength[STATE_ACTIVE]
+    if n > PAGE_LIMIT:
+        return
+    self._outsideMax = 0
+    for i: uint256 in range(n, bound=PAGE_LIMIT):
+        p: address = self._stateList[STATE_ACTIVE][i]
+        if self.leaderboardPosPlusOne[p] == 0:
+            self._boardOffer(p)
+
+@internal
 def _appendToState(p: address, st: uint256):
     assert self.stateByProposalPlusOne[p] == 0, "already indexed"
-    if st == STATE_DRAFT:
-        self.draftProposals.append(p)
-        self.indexByProposalPlusOne[p] = len(self.draftProposals)
-    elif st == STATE_OPEN:
-        self.openProposals.append(p)
-        self.indexByProposalPlusOne[p] = len(self.openProposals)
-    elif st == STATE_ACTIVE:
-        self.activeProposals.append(p)
-        self.indexByProposalPlusOne[p] = len(self.activeProposals)
-    else:
-        self.closedProposals.append(p)
-        self.indexByProposalPlusOne[p] = len(self.closedProposals)
+    n: uint256 = self._stateLength[st]
+    self._stateList[st][n] = p
+    self._stateLength[st] = n + 1
+    self.indexByProposalPlusOne[p] = n + 1
     self.stateByProposalPlusOne[p] = st + 1
+    if st == STATE_ACTIVE:
+        self._boardOffer(p)
 
 @internal
 def _removeFromState(p: address):
@@ -293,37 +712,24 @@ def _removeFromState(p: address):
     idx: uint256 = pos_plus_one - 1
     st: uint256 = st_plus_one - 1
 
-    if st == STATE_DRAFT:
-        last_idx: uint256 = len(self.draftProposals) - 1
-        if idx != last_idx:
-            last_addr: address = self.draftProposals[last_idx]
-            self.draftProposals[idx] = last_addr
-            self.indexByProposalPlusOne[last_addr] = idx + 1
-        self.draftProposals.pop()
-    elif st == STATE_OPEN:
-        last_idx: uint256 = len(self.openProposals) - 1
-        if idx != last_idx:
-            last_addr: address = self.openProposals[last_idx]
-            self.openProposals[idx] = last_addr
-            self.indexByProposalPlusOne[last_addr] = idx + 1
-        self.openProposals.pop()
-    elif st == STATE_ACTIVE:
-        last_idx: uint256 = len(self.activeProposals) - 1
-        if idx != last_idx:
-            last_addr: address = self.activeProposals[last_idx]
-            self.activeProposals[idx] = last_addr
-            self.indexByProposalPlusOne[last_addr] = idx + 1
-        self.activeProposals.pop()
-    else:
-        last_idx: uint256 = len(self.closedProposals) - 1
-        if idx != last_idx:
-            last_addr: address = self.closedProposals[last_idx]
-            self.closedProposals[idx] = last_addr
-            self.indexByProposalPlusOne[last_addr] = idx + 1
-        self.closedProposals.pop()
+    last_idx: uint256 = self._stateLength[st] - 1
+    if idx != last_idx:
+        last_addr: address = self._stateList[st][last_idx]
+        self._stateList[st][idx] = last_addr
+        self.indexByProposalPlusOne[last_addr] = idx + 1
+    # The vacated tail slot is left dirty (like DynArray.pop): views only read
+    # below the length, and the next append there is a cheap non-zero write.
+    self._stateLength[st] = last_idx
 
     self.indexByProposalPlusOne[p] = 0
     self.stateByProposalPlusOne[p] = 0
+    if st == STATE_ACTIVE:
+        on_board: bool = self.leaderboardPosPlusOne[p] > 0
+        self._boardRemove(p)
+        if len(self.leaderboard) == last_idx:
+            self._outsideMax = 0
+        elif on_board and self._outsideMax > 0:
+            self._refillBoard()
 
 @internal
 def _moveState(p: address, new_st: uint256):
@@ -345,7 +751,10 @@ def createProposal(_title: String[128], _body: String[4096], _voteStart: uint256
     self._touchUser(msg.sender)
 
     p: address = create_minimal_proxy_to(self.proposalTemplate, revert_on_failure=True)
-    extcall IProposalTemplate(p).initialize(self, _title, msg.sender, _body, block.timestamp, _voteStart, _voteEnd)
+    if self.bodyMode == BODY_MODE_HASHED:
+        extcall IProposalTemplate(p).initialize(self, _title, msg.sender, "", block.timestamp, _voteStart, _voteEnd)
+    else:
+        extcall IProposalTemplate(p).initialize(self, _title, msg.sender, _body, block.timestamp, _voteStart, _voteEnd)
 
     target_state: uint256 = STATE_DRAFT
     if _voteStart > 0:
@@ -357,38 +766,170 @@ def createProposal(_title: String[128], _body: String[4096], _voteStart: uint256
             target_state = STATE_CLOSED
 
     self._appendToState(p, target_state)
+    self._indexWindow(p, _voteStart, _voteEnd)
+    if self.voteWeightMode == VOTE_WEIGHT_SNAPSHOT:
+        self.createdBlock[p] = block.number
     self.totalProposals += 1
     log ProposalCreated(proposal=p, author=msg.sender, title=_title)
+    if self.bodyMode == BODY_MODE_HASHED:
+        body_hash: bytes32 = keccak256(_body)
+        self.bodyHash[p] = body_hash
+        self.bodyLength[p] = len(_body)
+        log ProposalBody(proposal=p, bodyHash=body_hash, body=_body)
     return p
 
 @external
-def addComment(_proposal: address, _content: String[1024], _sentiment: uint256) -> address:
-    self._requireCommenter(msg.sender)
+def setBodyMode(_mode: uint256):
+    self._onlyBobu()
+    assert _mode <= BODY_MODE_HASHED, "bad mode"
+    self.bodyMode = _mode
+    log BodyModeUpdated(mode=_mode, by=msg.sender)
+
+@external
+def setWindowIndex(_enabled: bool):
+    """Windows set while enabled are indexed for getWindowBoundaries; earlier ones are not."""
+    self._onlyBobu()
+    self.windowIndexEnabled = _enabled
+    log WindowIndexUpdated(enabled=_enabled, by=msg.sender)
+
+@internal
+def _addComment(_author: address, _proposal: address, _content: String[1024], _sentiment: uint256) -> address:
+    self._requireCommenter(_author)
     st_plus_one: uint256 = self.stateByProposalPlusOne[_proposal]
     assert st_plus_one > 0, "unknown proposal"
     st: uint256 = st_plus_one - 1
     # Allow comments on all non-closed proposals (including DRAFT)
     assert st != STATE_CLOSED, "not commentable"
 
-    self._touchUser(msg.sender)
+    self._touchUser(_author)
+    self.totalComments += 1
+
+    if self.commentMode == COMMENT_MODE_LIGHT:
+        assert _sentiment >= 1 and _sentiment <= 4, "bad sentiment"
+        comment_id: uint256 = self.lightCommentCount[_proposal]
+        self._lightComments[_proposal][comment_id] = (
+            convert(_author, uint256)
+            | (block.timestamp << LIGHT_CREATED_SHIFT)
+            | (_sentiment << LIGHT_SENTIMENT_SHIFT)
+        )
+        self.lightCommentCount[_proposal] = comment_id + 1
+        log LightCommentAdded(proposal=_proposal, commentId=comment_id, author=_author, sentiment=_sentiment, createdAt=block.timestamp, content=_content)
+        return empty(address)
 
     c: address = create_minimal_proxy_to(self.commentTemplate, revert_on_failure=True)
-    extcall ICommentTemplate(c).initialize(self, _proposal, msg.sender, _content, block.timestamp, _sentiment)
+    extcall ICommentTemplate(c).initialize(self, _proposal, _author, _content, block.timestamp, _sentiment)
     extcall IProposalTemplate(_proposal).addCommentAddress(c)
-    self.totalComments += 1
-    log CommentAdded(proposal=_proposal, comment=c, author=msg.sender)
+    log CommentAdded(proposal=_proposal, comment=c, author=_author)
     return c
 
 @external
-def castVote(_proposal: address, support: bool):
-    self._requireVoter(msg.sender)
-    vs: uint256 = staticcall IProposalTemplate(_proposal).voteStart()
-    ve: uint256 = staticcall IProposalTemplate(_proposal).voteEnd()
+def addComment(_proposal: address, _content: String[1024], _sentiment: uint256) -> address:
+    """
+    Returns the comment clone, or the zero address in light mode (the id is
+    in LightCommentAdded and equals lightCommentCount(_proposal) - 1).
+    """
+    return self._addComment(msg.sender, _proposal, _content, _sentiment)
+
+@external
+def setCommentMode(_mode: uint256):
+    self._onlyBobu()
+    assert _mode <= COMMENT_MODE_LIGHT, "bad mode"
+    self.commentMode = _mode
+    log CommentModeUpdated(mode=_mode, by=msg.sender)
+
+@internal
+def _castVote(_voter: address, _proposal: address, support: bool, weight: uint256):
+    st_plus_one: uint256 = self.stateByProposalPlusOne[_proposal]
+    assert st_plus_one > 0, "unknown proposal"
+    vs: uint256 = 0
+    ve: uint256 = 0
+    vs, ve = staticcall IProposalTemplate(_proposal).votingWindow()
     assert vs > 0 and ve > 0, "no voting window"
     assert block.timestamp >= vs and block.timestamp <= ve, "not in window"
+    w: uint256 = weight
+    if w == 0:
+        w = self._snapshotWeight(_voter, _proposal)
+    extcall IProposalTemplate(_proposal).hubCastVote(_voter, support, w)
+    self.totalVotes[_proposal] += w
+    if st_plus_one == STATE_ACTIVE + 1:
+        if self.leaderboardPosPlusOne[_proposal] > 0:
+            self._boardBubbleUp(_proposal)
+        else:
+            self._boardOffer(_proposal)
+
+@external
+def castVote(_proposal: address, support: bool):
+    weight: uint256 = self._voteWeight(msg.sender)
     self._touchUser(msg.sender)
-    # 1 address = 1 vote (weight=1). If token-weighted is desired, wire in balance here.
-    extcall IProposalTemplate(_proposal).hubCastVote(msg.sender, support, 1)
+    self._castVote(msg.sender, _proposal, support, weight)
+
+@external
+def castVotes(_proposals: DynArray[address, MAX_VOTE_BATCH], _supports: DynArray[bool, MAX_VOTE_BATCH]):
+    """
+    Cast a whole ballot in one transaction. The gate/weight balance is read
+    once and applies to every vote (snapshot weights are looked up per
+    proposal); any invalid entry reverts the batch.
+    """
+    assert len(_proposals) == len(_supports), "length mismatch"
+    assert len(_proposals) > 0, "empty ballot"
+    weight: uint256 = self._voteWeight(msg.sender)
+    self._touchUser(msg.sender)
+    for i: uint256 in range(len(_proposals), bound=MAX_VOTE_BATCH):
+        self._castVote(msg.sender, _proposals[i], _supports[i], weight)
+
+# --------------------------
+# EIP-712 relayed votes / comments
+# --------------------------
+@internal
+@view
+def _domainSeparator() -> bytes32:
+    if chain.id == self._cachedChainId:
+        return self._cachedDomainSeparator
+    return self._buildDomainSeparator()
+
+@internal
+@view
+def _buildDomainSeparator() -> bytes32:
+    return keccak256(abi_encode(EIP712_DOMAIN_TYPEHASH, keccak256(EIP712_NAME), keccak256(EIP712_VERSION), chain.id, self))
+
+@external
+@view
+def DOMAIN_SEPARATOR() -> bytes32:
+    return self._domainSeparator()
+
+@internal
+def _useSignature(_signer: address, _structHash: bytes32, _nonce: uint256, _deadline: uint256, _v: uint8, _r: bytes32, _s: bytes32):
+    assert block.timestamp <= _deadline, "signature expired"
+    assert _nonce == self.nonces[_signer], "bad nonce"
+    assert convert(_s, uint256) <= SECP256K1_HALF_N, "bad signature"
+    digest: bytes32 = keccak256(concat(b"\x19\x01", self._domainSeparator(), _structHash))
+    recovered: address = ecrecover(digest, _v, _r, _s)
+    assert recovered != empty(address) and recovered == _signer, "bad signature"
+    self.nonces[_signer] = _nonce + 1
+
+@external
+def relayVotes(_votes: DynArray[SignedVote, MAX_VOTE_BATCH]):
+    """
+    Apply votes signed off-chain (EIP-712 `Vote`). Anyone may relay; each
+    entry must carry the signer's next nonce and an unexpired deadline, and
+    any invalid entry reverts the batch (relayers simulate before sending).
+    """
+    for sv: SignedVote in _votes:
+        struct_hash: bytes32 = keccak256(abi_encode(VOTE_TYPEHASH, sv.voter, sv.proposal, sv.support, sv.nonce, sv.deadline))
+        self._useSignature(sv.voter, struct_hash, sv.nonce, sv.deadline, sv.v, sv.r, sv.s)
+        weight: uint256 = self._voteWeight(sv.voter)
+        self._touchUser(sv.voter)
+        self._castVote(sv.voter, sv.proposal, sv.support, weight)
+
+@external
+def relayComments(_comments: DynArray[SignedComment, MAX_COMMENT_BATCH]):
+    """Create comments signed off-chain (EIP-712 `Comment`); see relayVotes."""
+    for sc: SignedComment in _comments:
+        struct_hash: bytes32 = keccak256(
+            abi_encode(COMMENT_TYPEHASH, sc.author, sc.proposal, keccak256(sc.content), sc.sentiment, sc.nonce, sc.deadline)
+        )
+        self._useSignature(sc.author, struct_hash, sc.nonce, sc.deadline, sc.v, sc.r, sc.s)
+        self._addComment(sc.author, sc.proposal, sc.content, sc.sentiment)
 
 @external
 def adminMoveState(_proposal: address, _newState: uint256):
@@ -449,46 +990,60 @@ def setVotingWindow(_proposal: address, _voteStart: uint256, _voteEnd: uint256):
 
     # Apply on the child template (hub-only function)
     extcall IProposalTemplate(_proposal).hubSetVotingWindow(_voteStart, _voteEnd)
+    log VotingWindowUpdated(proposal=_proposal, voteStart=_voteStart, voteEnd=_voteEnd, by=msg.sender)
+    self._indexWindow(_proposal, _voteStart, _voteEnd)
 
-    # Sync state to reflect new window immediately (inline to avoid external self-call)
-    vs_local: uint256 = _voteStart
-    ve_local: uint256 = _voteEnd
-    new_st: uint256 = old_st
-    if ve_local > 0 and block.timestamp > ve_local:
-        new_st = STATE_CLOSED
-    elif vs_local > 0 and block.timestamp >= vs_local and block.timestamp <= ve_local:
-        new_st = STATE_ACTIVE
-    elif vs_local > 0 and block.timestamp < vs_local:
-        new_st = STATE_OPEN
-    else:
-        new_st = STATE_DRAFT
-
+    # Sync state to reflect new window immediately
+    new_st: uint256 = self._windowState(_voteStart, _voteEnd)
     if new_st != old_st:
         self._moveState(_proposal, new_st)
         log StateChanged(proposal=_proposal, oldState=old_st, newState=new_st, by=msg.sender)
 
-@external
-def syncProposalState(_proposal: address):
+@internal
+@view
+def _windowState(_voteStart: uint256, _voteEnd: uint256) -> uint256:
+    # State a proposal with this voting window belongs in right now
+    if _voteEnd > 0 and block.timestamp > _voteEnd:
+        return STATE_CLOSED
+    elif _voteStart > 0 and block.timestamp >= _voteStart and block.timestamp <= _voteEnd:
+        return STATE_ACTIVE
+    elif _voteStart > 0 and block.timestamp < _voteStart:
+        return STATE_OPEN
+    return STATE_DRAFT
+
+@internal
+def _syncProposalState(_proposal: address) -> bool:
     old_plus_one: uint256 = self.stateByProposalPlusOne[_proposal]
     assert old_plus_one > 0, "unknown proposal"
     old_st: uint256 = old_plus_one - 1
 
-    vs: uint256 = staticcall IProposalTemplate(_proposal).voteStart()
-    ve: uint256 = staticcall IProposalTemplate(_proposal).voteEnd()
+    vs: uint256 = 0
+    ve: uint256 = 0
+    vs, ve = staticcall IProposalTemplate(_proposal).votingWindow()
 
-    new_st: uint256 = old_st
-    if ve > 0 and block.timestamp > ve:
-        new_st = STATE_CLOSED
-    elif vs > 0 and block.timestamp >= vs and block.timestamp <= ve:
-        new_st = STATE_ACTIVE
-    elif vs > 0 and block.timestamp < vs:
-        new_st = STATE_OPEN
-    else:
-        new_st = STATE_DRAFT
+    new_st: uint256 = self._windowState(vs, ve)
+    if new_st == old_st:
+        return False
+    self._moveState(_proposal, new_st)
+    log StateChanged(proposal=_proposal, oldState=old_st, newState=new_st, by=msg.sender)
+    return True
 
-    if new_st != old_st:
-        self._moveState(_proposal, new_st)
-        log StateChanged(proposal=_proposal, oldState=old_st, newState=new_st, by=msg.sender)
+@external
+def syncProposalState(_proposal: address):
+    self._syncProposalState(_proposal)
+
+@external
+def syncProposalStates(_proposals: DynArray[address, MAX_SYNC_BATCH]) -> uint256:
+    """
+    Batch syncProposalState for keepers: re-derive each proposal's state from
+    its voting window. Proposals already in the right state are no-ops.
+    Returns the number of proposals that moved.
+    """
+    moved: uint256 = 0
+    for p: address in _proposals:
+        if self._syncProposalState(p):
+            moved += 1
+    return moved
 
 @external
 def adminDeleteComment(_proposal: address, _comment: address):
@@ -499,88 +1054,221 @@ def adminDeleteComment(_proposal: address, _comment: address):
     extcall ICommentTemplate(_comment).markDeleted()
     log CommentDeleted(proposal=_proposal, comment=_comment, byAdmin=msg.sender)
 
+@external
+def adminDeleteLightComment(_proposal: address, _commentId: uint256):
+    self._onlyAdminOrBobu()
+    assert _commentId < self.lightCommentCount[_proposal], "unknown comment"
+    rec: uint256 = self._lightComments[_proposal][_commentId]
+    assert rec & LIGHT_DELETED_BIT == 0, "already deleted"
+    created: uint256 = (rec >> LIGHT_CREATED_SHIFT) & UINT64_MASK
+    assert block.timestamp <= created + COMMENT_DELETE_WINDOW, "window passed"
+    self._lightComments[_proposal][_commentId] = rec | LIGHT_DELETED_BIT
+    log LightCommentDeleted(proposal=_proposal, commentId=_commentId, byAdmin=msg.sender)
+
+@internal
+@view
+def _unpackLightComment(_proposal: address, _commentId: uint256) -> LightComment:
+    rec: uint256 = self._lightComments[_proposal][_commentId]
+    return LightComment(
+        id=_commentId,
+        author=convert(convert(rec & ADDRESS_MASK, uint160), address),
+        createdAt=(rec >> LIGHT_CREATED_SHIFT) & UINT64_MASK,
+        sentiment=(rec >> LIGHT_SENTIMENT_SHIFT) & 255,
+        deleted=(rec & LIGHT_DELETED_BIT) != 0
+    )
+
+@external
+@view
+def getLightComments(_proposal: address, _offset: uint256, _count: uint256, reverse: bool) -> DynArray[LightComment, PAGE_LIMIT]:
+    """Light comment records (content is in LightCommentAdded), paged like getProposals."""
+    result: DynArray[LightComment, PAGE_LIMIT] = []
+    n: uint256 = self.lightCommentCount[_proposal]
+    if _offset >= n:
+        return result
+    count: uint256 = min(min(_count, n - _offset), PAGE_LIMIT)
+    for i: uint256 in range(count, bound=PAGE_LIMIT):
+        idx: uint256 = _offset + i
+        if reverse:
+            idx = n - 1 - _offset - i
+        result.append(self._unpackLightComment(_proposal, idx))
+    return result
+
 @internal
 @view
 def _getProposalCountByState(_state: uint256) -> uint256:
     assert _state <= STATE_CLOSED, "bad state"
-    if _state == STATE_DRAFT:
-        return len(self.draftProposals)
-    elif _state == STATE_OPEN:
-        return len(self.openProposals)
-    elif _state == STATE_ACTIVE:
-        return len(self.activeProposals)
-    else:
-        return len(self.closedProposals)
+    return self._stateLength[_state]
 
 @external
 @view
 def getProposalCountByState(_state: uint256) -> uint256:
     return self._getProposalCountByState(_state)
 
+@external
+@view
+def getProposalState(_proposal: address) -> uint256:
+    st_plus_one: uint256 = self.stateByProposalPlusOne[_proposal]
+    assert st_plus_one > 0, "unknown proposal"
+    return st_plus_one - 1
+
 @external
 @view
 def getProposals(_state: uint256, _offset: uint256, _count: uint256, reverse: bool) -> DynArray[address, PAGE_LIMIT]:
     assert _state <= STATE_CLOSED, "bad state"
     result: DynArray[address, PAGE_LIMIT] = []
-    arr_len: uint256 = self._getProposalCountByState(_state)
-    if arr_len == 0:
+    arr_len: uint256 = self._stateLength[_state]
+    if _offset >= arr_len:
         return result
 
-    if not reverse:
-        if _offset >= arr_len:
-            return result
-        available: uint256 = arr_len - _offset
-        count: uint256 = min(min(_count, available), PAGE_LIMIT)
-        for i: uint256 in range(0, count, bound=PAGE_LIMIT):
-            if _state == STATE_DRAFT:
-                result.append(self.draftProposals[_offset + i])
-            elif _state == STATE_OPEN:
-                result.append(self.openProposals[_offset + i])
-            elif _state == STATE_ACTIVE:
-                result.append(self.activeProposals[_offset + i])
-            else:
-                result.append(self.closedProposals[_offset + i])
-    else:
-        if _offset >= arr_len:
-            return result
-        start_index: uint256 = arr_len - 1 - _offset
-        available: uint256 = start_index + 1
-        count: uint256 = min(min(_count, available), PAGE_LIMIT)
-        for i: uint256 in range(0, count, bound=PAGE_LIMIT):
-            idx: uint256 = start_index - i
-            if _state == STATE_DRAFT:
-                result.append(self.draftProposals[idx])
-            elif _state == STATE_OPEN:
-                result.append(self.openProposals[idx])
-            elif _state == STATE_ACTIVE:
-                result.append(self.activeProposals[idx])
-            else:
-                result.append(self.closedProposals[idx])
+    count: uint256 = min(min(_count, arr_len - _offset), PAGE_LIMIT)
+    for i: uint256 in range(0, count, bound=PAGE_LIMIT):
+        if reverse:
+            result.append(self._stateList[_state][arr_len - 1 - _offset - i])
+        else:
+            result.append(self._stateList[_state][_offset + i])
     return result
 
+@external
+@view
+def getProposalsByCursor(_state: uint256, _cursor: uint256, _count: uint256) -> (DynArray[address, PAGE_LIMIT], uint256):
+    """
+    Forward page of `_state` starting at list index `_cursor`, plus the cursor
+    for the next page (0 once the list is exhausted). Start with cursor 0.
+    Removals swap the last entry into the freed index, so a proposal that
+    changes state mid-walk can move an unvisited entry behind the cursor;
+    re-walk (or follow StateChanged) if an exact snapshot is needed.
+    """
+    assert _state <= STATE_CLOSED, "bad state"
+    result: DynArray[address, PAGE_LIMIT] = []
+    arr_len: uint256 = self._stateLength[_state]
+    if _cursor >= arr_len:
+        return result, 0
+
+    count: uint256 = min(min(_count, arr_len - _cursor), PAGE_LIMIT)
+    for i: uint256 in range(0, count, bound=PAGE_LIMIT):
+        result.append(self._stateList[_state][_cursor + i])
+    next_cursor: uint256 = _cursor + count
+    if next_cursor >= arr_len:
+        next_cursor = 0
+    return result, next_cursor
+
+
+@external
+@view
+def getWindowBoundaries(_from: uint256, _to: uint256, _cursor: uint256) -> (DynArray[WindowBoundary, PAGE_LIMIT], uint256):
+    """
+    Proposals whose current voteStart or voteEnd lies in [_from, _to], read
+    from the hour-bucket index (at most MAX_WINDOW_BUCKETS buckets per call).
+    Only windows set while windowIndexEnabled was on are covered.
+    Boundaries come back in bucket order, then insertion order within a
+    bucket. Returns the page and a cursor for the next call with the same
+    range (0 once the range is exhausted); start with cursor 0.
+    """
+    assert _from <= _to, "bad range"
+    first: uint256 = _from // WINDOW_BUCKET
+    last: uint256 = _to // WINDOW_BUCKET
+    assert last - first < MAX_WINDOW_BUCKETS, "range too wide"
+
+    result: DynArray[WindowBoundary, PAGE_LIMIT] = []
+    # The cursor counts index entries already consumed in this range
+    bucket: uint256 = first
+    idx: uint256 = _cursor
+    for _: uint256 in range(MAX_WINDOW_BUCKETS):
+        if bucket > last:
+            return result, 0
+        n: uint256 = self.windowBucketLength[bucket]
+        if idx < n:
+            break
+        idx -= n
+        bucket += 1
+
+    consumed: uint256 = _cursor
+    for _: uint256 in range(MAX_WINDOW_SCAN):
+        if bucket > last:
+            return result, 0
+        if idx >= self.windowBucketLength[bucket]:
+            bucket += 1
+            idx = 0
+            continue
+        if len(result) == PAGE_LIMIT:
+            return result, consumed
+        entry: uint256 = self._windowBuckets[bucket][idx]
+        idx += 1
+        consumed += 1
+
+        ts: uint256 = (entry >> WINDOW_TS_SHIFT) & UINT40_MASK
+        if ts < _from or ts > _to:
+            continue
+        p: address = convert(convert(entry & ADDRESS_MASK, uint160), address)
+        is_end: bool = entry & WINDOW_END_BIT != 0
+        # Skip entries superseded by a later setVotingWindow
+        vs: uint256 = 0
+        ve: uint256 = 0
+        vs, ve = staticcall IProposalTemplate(p).votingWindow()
+        if (is_end and ve != ts) or (not is_end and vs != ts):
+            continue
+        result.append(WindowBoundary(proposal=p, timestamp=ts, isEnd=is_end, state=self.stateByProposalPlusOne[p] - 1))
+    return result, consumed
 
 @external
 @view
 def getTopActiveProposal() -> address:
     """
     Return the active proposal with the highest total votes (for + against).
-    If there are no active proposals, returns the zero address.
+    If there are no active proposals, or none has a vote, returns the zero address.
+    Reverts if more than PAGE_LIMIT proposals are active and the board cannot
+    vouch for its head; `refreshLeaderboard` brings it back up to date.
     """
-    best: address = empty(address)
-    best_votes: uint256 = 0
-    count: uint256 = len(self.activeProposals)
+    top: address = empty(address)
+    if len(self.leaderboard) > 0:
+        top = self.leaderboard[0]
+    best_votes: uint256 = self.totalVotes[top]
+    # Every active proposal outside the board has at most _outsideMax votes
+    if best_votes >= self._outsideMax:
+        return top
+    n: uint256 = self._stateLength[STATE_ACTIVE]
+    assert n <= PAGE_LIMIT, "leaderboard stale"
+    for i: uint256 in range(n, bound=PAGE_LIMIT):
+        p: address = self._stateList[STATE_ACTIVE][i]
+        votes: uint256 = self.totalVotes[p]
+        if votes > best_votes:
+            best_votes = votes
+            top = p
+    return top
 
-    for i: uint256 in range(MAX_PROPOSALS):
-        if i >= count:
+@external
+@view
+def getTopActiveProposals(_count: uint256) -> DynArray[address, LEADERBOARD_SIZE]:
+    """
+    Up to `_count` active proposals with at least one vote, by total votes,
+    highest first. Free slots are refilled when a leader leaves ACTIVE; with
+    more than PAGE_LIMIT active proposals that pass is skipped and
+    `refreshLeaderboard` backfills them.
+    """
+    result: DynArray[address, LEADERBOARD_SIZE] = []
+    for i: uint256 in range(LEADERBOARD_SIZE):
+        if i >= _count or i >= len(self.leaderboard):
             break
-        p: address = self.activeProposals[i]
-        vf: uint256 = staticcall IProposalTemplate(p).votesFor()
-        va: uint256 = staticcall IProposalTemplate(p).votesAgainst()
-        total: uint256 = vf + va
-        if total > best_votes:
-            best_votes = total
-            best = p
-
-    return best
-
+        result.append(self.leaderboard[i])
+    return result
 
+@external
+def refreshLeaderboard(_candidates: DynArray[address, PAGE_LIMIT]):
+    """
+    Offer ACTIVE proposals for the leaderboard (permissionless keeper hook).
+    A candidate only takes a free slot if no active proposal left outside the
+    board can have more votes, so callers cannot distort the ranking. If the
+    candidates are every active proposal outside the board, sorted by address
+    ascending, the outside bound is recomputed and all free slots are refilled.
+    """
+    complete: bool = len(_candidates) == self._stateLength[STATE_ACTIVE] - len(self.leaderboard)
+    prev: address = empty(address)
+    for p: address in _candidates:
+        if self.stateByProposalPlusOne[p] != STATE_ACTIVE + 1 or self.leaderboardPosPlusOne[p] != 0 or convert(p, uint256) <= convert(prev, uint256):
+            complete = False
+        prev = p
+    if complete:
+        self._outsideMax = 0
+    for p: address in _candidates:
+        if self.stateByProposalPlusOne[p] == STATE_ACTIVE + 1 and self.leaderboardPosPlusOne[p] == 0:
+            self._boardOffer(p)
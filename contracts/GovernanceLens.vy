@@ -0,0 +1,71 @@
+# @version ^0.4.3
+
+"""
+GovernanceLens
+- Read-only companion for GovernanceHub
+- Resolves a page of proposals and their metadata in a single eth_call
+- Stateless: one deployment can serve any hub passed in as an argument
+"""
+
+PAGE_LIMIT: constant(uint256) = 100
+
+interface IGovernanceHub:
+    def getProposals(_state: uint256, _offset: uint256, _count: uint256, reverse: bool) -> DynArray[address, PAGE_LIMIT]: view
+
+interface IProposalTemplate:
+    def title() -> String[128]: view
+    def author() -> address: view
+    def createdAt() -> uint256: view
+    def voteStart() -> uint256: view
+    def voteEnd() -> uint256: view
+    def votesFor() -> uint256: view
+    def votesAgainst() -> uint256: view
+
+struct ProposalSummary:
+    proposal: address
+    title: String[128]
+    author: address
+    createdAt: uint256
+    voteStart: uint256
+    voteEnd: uint256
+    votesFor: uint256
+    votesAgainst: uint256
+
+@internal
+@view
+def _summarize(p: address) -> ProposalSummary:
+    return ProposalSummary(
+        proposal=p,
+        title=staticcall IProposalTemplate(p).title(),
+        author=staticcall IProposalTemplate(p).author(),
+        createdAt=staticcall IProposalTemplate(p).createdAt(),
+        voteStart=staticcall IProposalTemplate(p).voteStart(),
+        voteEnd=staticcall IProposalTemplate(p).voteEnd(),
+        votesFor=staticcall IProposalTemplate(p).votesFor(),
+        votesAgainst=staticcall IProposalTemplate(p).votesAgainst()
+    )
+
+@external
+@view
+def getProposalSummaries(_hub: address, _state: uint256, _offset: uint256, _count: uint256, reverse: bool) -> DynArray[ProposalSummary, PAGE_LIMIT]:
+    """
+    Same paging semantics as GovernanceHub.getProposals, but each entry carries
+    the proposal's title, author, timestamps, voting window and vote tallies.
+    """
+    result: DynArray[ProposalSummary, PAGE_LIMIT] = []
+    page: DynArray[address, PAGE_LIMIT] = staticcall IGovernanceHub(_hub).getProposals(_state, _offset, _count, reverse)
+    for p: address in page:
+        result.append(self._summarize(p))
+    return result
+
+@external
+@view
+def getSummaries(_proposals: DynArray[address, PAGE_LIMIT]) -> DynArray[ProposalSummary, PAGE_LIMIT]:
+    """
+    Summaries for an explicit list of proposal clones (e.g. a detail page or a
+    list assembled off-chain).
+    """
+    result: DynArray[ProposalSummary, PAGE_LIMIT] = []
+    for p: address in _proposals:
+        result.append(self._summarize(p))
+    return result
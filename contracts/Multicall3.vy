@@ -0,0 +1,47 @@
+# @version ^0.4.3
+
+"""
+Multicall3
+- Minimal Vyper port of the Multicall3 `aggregate3` read path
+- ABI-compatible with the canonical deployment at
+  0xcA11bde05977b3631167028862bE2a173976CA11, which is used on live networks;
+  this contract is only deployed where no Multicall3 exists (e.g. local test)
+- Calls are static: batching is for views only
+"""
+
+MAX_CALLS: constant(uint256) = 100
+# View inputs here are small; returns must fit ProposalTemplate.body
+# (String[4096]) plus ABI head/length words
+MAX_CALLDATA: constant(uint256) = 1024
+MAX_RETURN: constant(uint256) = 4352
+
+struct Call3:
+    target: address
+    allowFailure: bool
+    callData: Bytes[MAX_CALLDATA]
+
+struct Result:
+    success: bool
+    returnData: Bytes[MAX_RETURN]
+
+@external
+@view
+def aggregate3(calls: DynArray[Call3, MAX_CALLS]) -> DynArray[Result, MAX_CALLS]:
+    """
+    Execute each call and return (success, returnData) in order. Reverts if a
+    call with allowFailure=False fails.
+    """
+    results: DynArray[Result, MAX_CALLS] = []
+    for c: Call3 in calls:
+        success: bool = False
+        data: Bytes[MAX_RETURN] = b""
+        success, data = raw_call(
+            c.target,
+            c.callData,
+            max_outsize=MAX_RETURN,
+            is_static_call=True,
+            revert_on_failure=False
+        )
+        assert success or c.allowFailure, "Multicall3: call failed"
+        results.append(Result(success=success, returnData=data))
+    return results
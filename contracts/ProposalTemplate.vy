@@ -11,26 +11,96 @@ event Voted:
     support: bool
     weight: uint256
 
-ownerHub: public(address)
-initialized: public(bool)
+# Storage is packed by hand (Vyper gives every variable its own slot); the
+# accessors below keep the original public getters.
+#   _hubWindow:      ownerHub | voteStart << 160 | voteEnd << 200 | initialized << 240
+#   _authorCreated:  author | createdAt << 160
+#   _votes:          votesFor | votesAgainst << 128
+# The window shares the hub's slot so a hub vote (window check + hub-only
+# check) reads a single slot.
+_hubWindow: uint256
+_authorCreated: uint256
+_votes: uint256
 
 title: public(String[128])
-author: public(address)
 body: public(String[4096])
 
-createdAt: public(uint256)
-voteStart: public(uint256)
-voteEnd: public(uint256)
-
-votesFor: public(uint256)
-votesAgainst: public(uint256)
-
-MAX_COMMENTS: constant(uint256) = 1000
-comments: public(DynArray[address, MAX_COMMENTS])
+VOTE_START_SHIFT: constant(uint256) = 160
+VOTE_END_SHIFT: constant(uint256) = 200
+INITIALIZED_BIT: constant(uint256) = 1 << 240
+CREATED_SHIFT: constant(uint256) = 160
+AGAINST_SHIFT: constant(uint256) = 128
+ADDRESS_MASK: constant(uint256) = (1 << 160) - 1
+UINT40_MASK: constant(uint256) = (1 << 40) - 1
+UINT128_MASK: constant(uint256) = (1 << 128) - 1
+# Timestamps are stored in 40 bits (good until year 36812)
+MAX_TIMESTAMP: constant(uint256) = UINT40_MASK
+
+# Comment addresses by index (mapping-backed, no length cap)
+_comments: HashMap[uint256, address]
+commentCount: public(uint256)
 
 # guard for duplicate voting
 voted: HashMap[address, bool]
 
+@internal
+@pure
+def _addr(word: uint256) -> address:
+    return convert(convert(word & ADDRESS_MASK, uint160), address)
+
+@internal
+@pure
+def _packWindow(_hub: address, _voteStart: uint256, _voteEnd: uint256) -> uint256:
+    assert _voteStart <= MAX_TIMESTAMP and _voteEnd <= MAX_TIMESTAMP, "timestamp too large"
+    return convert(_hub, uint256) | (_voteStart << VOTE_START_SHIFT) | (_voteEnd << VOTE_END_SHIFT) | INITIALIZED_BIT
+
+@external
+@view
+def ownerHub() -> address:
+    return self._addr(self._hubWindow)
+
+@external
+@view
+def initialized() -> bool:
+    return self._hubWindow & INITIALIZED_BIT != 0
+
+@external
+@view
+def author() -> address:
+    return self._addr(self._authorCreated)
+
+@external
+@view
+def createdAt() -> uint256:
+    return self._authorCreated >> CREATED_SHIFT
+
+@external
+@view
+def voteStart() -> uint256:
+    return (self._hubWindow >> VOTE_START_SHIFT) & UINT40_MASK
+
+@external
+@view
+def voteEnd() -> uint256:
+    return (self._hubWindow >> VOTE_END_SHIFT) & UINT40_MASK
+
+@external
+@view
+def votingWindow() -> (uint256, uint256):
+    """(voteStart, voteEnd) from one slot read, for the hub's vote path."""
+    packed: uint256 = self._hubWindow
+    return (packed >> VOTE_START_SHIFT) & UINT40_MASK, (packed >> VOTE_END_SHIFT) & UINT40_MASK
+
+@external
+@view
+def votesFor() -> uint256:
+    return self._votes & UINT128_MASK
+
+@external
+@view
+def votesAgainst() -> uint256:
+    return self._votes >> AGAINST_SHIFT
+
 @external
 def initialize(
     _hub: address,
@@ -41,41 +111,51 @@ def initialize(
     _voteStart: uint256,
     _voteEnd: uint256
 ):
-    assert not self.initialized, "inited"
+    assert self._hubWindow & INITIALIZED_BIT == 0, "inited"
     assert _hub != empty(address), "hub required"
-    self.initialized = True
-    self.ownerHub = _hub
+    assert _createdAt <= MAX_TIMESTAMP, "timestamp too large"
+    self._hubWindow = self._packWindow(_hub, _voteStart, _voteEnd)
+    self._authorCreated = convert(_author, uint256) | (_createdAt << CREATED_SHIFT)
     self.title = _title
-    self.author = _author
     self.body = _body
-    self.createdAt = _createdAt
-    self.voteStart = _voteStart
-    self.voteEnd = _voteEnd
 
 @external
 def hubSetVotingWindow(_voteStart: uint256, _voteEnd: uint256):
     """
     Update the voting window. Callable only by the owning GovernanceHub.
     """
-    assert msg.sender == self.ownerHub, "hub only"
-    self.voteStart = _voteStart
-    self.voteEnd = _voteEnd
+    hub: address = self._addr(self._hubWindow)
+    assert msg.sender == hub, "hub only"
+    self._hubWindow = self._packWindow(hub, _voteStart, _voteEnd)
+
+@external
+@view
+def comments(_index: uint256) -> address:
+    assert _index < self.commentCount, "index out of range"
+    return self._comments[_index]
 
 @external
 def addCommentAddress(_comment: address):
-    assert msg.sender == self.ownerHub, "hub only"
-    self.comments.append(_comment)
+    assert msg.sender == self._addr(self._hubWindow), "hub only"
+    n: uint256 = self.commentCount
+    self._comments[n] = _comment
+    self.commentCount = n + 1
 
 @external
 def hubCastVote(_voter: address, support: bool, weight: uint256):
-    assert msg.sender == self.ownerHub, "hub only"
+    assert msg.sender == self._addr(self._hubWindow), "hub only"
     assert not self.voted[_voter], "already voted"
     assert weight > 0, "weight"
     self.voted[_voter] = True
+    packed: uint256 = self._votes
+    votes_for: uint256 = packed & UINT128_MASK
+    votes_against: uint256 = packed >> AGAINST_SHIFT
     if support:
-        self.votesFor += weight
+        votes_for += weight
     else:
-        self.votesAgainst += weight
+        votes_against += weight
+    assert votes_for <= UINT128_MASK and votes_against <= UINT128_MASK, "votes overflow"
+    self._votes = votes_for | (votes_against << AGAINST_SHIFT)
     log Voted(voter=_voter, support=support, weight=weight)
 
 PAGE_LIMIT: constant(uint256) = 100
@@ -84,26 +164,35 @@ PAGE_LIMIT: constant(uint256) = 100
 @view
 def getComments(_offset: uint256, _count: uint256, reverse: bool) -> DynArray[address, PAGE_LIMIT]:
     result: DynArray[address, PAGE_LIMIT] = []
-    arr_len: uint256 = len(self.comments)
-    if arr_len == 0:
+    arr_len: uint256 = self.commentCount
+    if _offset >= arr_len:
         return result
 
-    if not reverse:
-        if _offset >= arr_len:
-            return result
-        available: uint256 = arr_len - _offset
-        count: uint256 = min(min(_count, available), PAGE_LIMIT)
-        for i: uint256 in range(0, count, bound=PAGE_LIMIT):
-            result.append(self.comments[_offset + i])
-    else:
-        if _offset >= arr_len:
-            return result
-        start_index: uint256 = arr_len - 1 - _offset
-        available: uint256 = start_index + 1
-        count: uint256 = min(min(_count, available), PAGE_LIMIT)
-        for i: uint256 in range(0, count, bound=PAGE_LIMIT):
-            idx: uint256 = start_index - i
-            result.append(self.comments[idx])
+    count: uint256 = min(min(_count, arr_len - _offset), PAGE_LIMIT)
+    for i: uint256 in range(0, count, bound=PAGE_LIMIT):
+        if reverse:
+            result.append(self._comments[arr_len - 1 - _offset - i])
+        else:
+            result.append(self._comments[_offset + i])
     return result
 
-
+@external
+@view
+def getCommentsByCursor(_cursor: uint256, _count: uint256) -> (DynArray[address, PAGE_LIMIT], uint256):
+    """
+    Forward page of comments starting at index `_cursor`, plus the cursor for
+    the next page (0 once exhausted). Comments are append-only, so a walk
+    started at cursor 0 sees every comment exactly once.
+    """
+    result: DynArray[address, PAGE_LIMIT] = []
+    arr_len: uint256 = self.commentCount
+    if _cursor >= arr_len:
+        return result, 0
+
+    count: uint256 = min(min(_count, arr_len - _cursor), PAGE_LIMIT)
+    for i: uint256 in range(0, count, bound=PAGE_LIMIT):
+        result.append(self._comments[_cursor + i])
+    next_cursor: uint256 = _cursor + count
+    if next_cursor >= arr_len:
+        next_cursor = 0
+    return result, next_cursor
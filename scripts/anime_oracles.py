@@ -1,36 +1,102 @@
 # file: anime_pyth_cmc_loop_fixed.py
+"""
+Oracle price poller: Pyth Hermes (stable feed + EMA) next to CoinMarketCap,
+for any number of symbols (ANIME/USD by default).
+
+Each tick makes one Hermes request for every configured Pyth feed (`ids[]`
+repeated) and one CMC request for every symbol (`symbol=A,B,...`), so the
+number of HTTP calls per tick stays at two however many feeds are tracked.
+
+Every tick fetches all sources concurrently over one pooled aiohttp session,
+so a tick takes as long as the slowest source instead of the sum, and
+connections (and their TLS sessions) are kept alive between ticks. Each
+source has its own timeout and retries transient failures (connection
+errors, timeouts, 429/5xx) with jittered exponential backoff; a source that
+still fails shows up as NA in its columns and a warning on stderr, without
+holding up the others.
+
+With ORACLE_MODE=stream the Pyth columns come from Hermes' server-sent event
+stream instead: a row is emitted as soon as a feed publishes a new price
+(sub-second), the connection is re-opened with backoff whenever it drops
+(a 4xx other than 429 is fatal), and updates no newer than the last one
+seen for their feed are dropped, so a reconnect never replays a price twice. CMC has no stream; it keeps being
+polled every ORACLE_INTERVAL_SECONDS and stream rows carry its latest value.
+
+Usage
+-----
+    python anime_oracles.py
+    ORACLE_MODE=stream python anime_oracles.py
+
+Environment
+-----------
+- ORACLE_FEEDS            (default: ANIME=<ANIME/USD stable feed id>) comma-separated
+                          SYMBOL=PYTH_FEED_ID entries; a bare SYMBOL is tracked on CMC only
+- CMC_API_KEY             (optional) CoinMarketCap key; CMC column is NA without it
+- ORACLE_INTERVAL_SECONDS (default: 300) seconds between ticks (CMC polls in stream mode)
+- ORACLE_MODE             (default: poll) poll | stream
+- PYTH_URL / CMC_URL      (optional) override the API endpoints (e.g. a local stub)
+- PYTH_STREAM_URL         (optional) override the Hermes SSE endpoint
+- ORACLE_STORE_DIR        (optional) also keep every sample in an oracle_store directory
+                          (time-partitioned SQLite with 1m/1h/1d rollups)
+- ORACLE_ALERT_BPS        (optional) turn on the oracle_divergence monitor: alert when any
+                          price pair diverges by more than this many basis points
+- ORACLE_MAX_STALENESS    (default: 120) with the monitor: alert when Pyth's publish_time
+                          is older than this many seconds
+- ORACLE_STATS_WINDOW     (default: 3600) with the monitor: rolling window in seconds
+- ORACLE_ALERT_LOG        (optional) with the monitor: also append alerts to this JSONL file
+"""
+
+import asyncio
+import json
 import os
+import random
+import sys
 import time
-import requests
-import schedule
+from abc import ABC, abstractmethod
+from contextlib import aclosing, suppress
 from datetime import datetime
+
+import aiohttp
 from dotenv import load_dotenv
 
+from oracle_divergence import DivergenceMonitor, JsonlAlertSink, Thresholds, print_alert
+from oracle_store import OracleStore, StoreSink
+
 load_dotenv()
 
 # ---- Config ----
-PYTH_URL = "https://hermes.pyth.network/v2/updates/price/latest"
+PYTH_URL = os.getenv("PYTH_URL", "https://hermes.pyth.network/v2/updates/price/latest")
 PYTH_STABLE_ID = "45b75908a1965a86080a26d9f31ab69d045d4dda73d1394e0d3693ce00d40e6f"
+DEFAULT_FEEDS = f"ANIME={PYTH_STABLE_ID}"
+PYTH_STREAM_URL = os.getenv("PYTH_STREAM_URL", "https://hermes.pyth.network/v2/updates/price/stream")
 
-CMC_URL = "https://pro-api.coinmarketcap.com/v2/cryptocurrency/quotes/latest"
+CMC_URL = os.getenv("CMC_URL", "https://pro-api.coinmarketcap.com/v2/cryptocurrency/quotes/latest")
 CMC_API_KEY = os.getenv("CMC_API_KEY", "")
-CMC_SYMBOL = "ANIME"
 
 TIMEOUT = 10
+INTERVAL = 300
 UA = {"Accept": "application/json", "User-Agent": "anime-pyth-cmc/fixed-1.0"}
 
+# Retry policy for each source within a tick
+RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Hermes sends updates every ~400ms; a stream silent this long is treated as dead
+STREAM_IDLE_TIMEOUT = 30.0
+
 # ---- Fixed column spec (name, width, align) ----
 # timestamp is 19 chars (YYYY-MM-DD HH:MM:SS)
 COLS = [
     ("timestamp",          19, "<"),  # left
+    ("symbol",             10, "<"),
     ("Pyth_Stable",        14, ">"),  # right
     ("Pyth_EMA",           14, ">"),
     ("Pyth_publish_time",  14, ">"),
     ("CMC_price_USD",      14, ">"),
 ]
 
-header_printed = False
-
 
 def _fmt(v):
     try:
@@ -38,54 +104,382 @@ def _fmt(v):
         # 8 ondalık, kuyruğu kırp
         s = f"{f:.8f}".rstrip("0").rstrip(".")
         return s
-    except:
+    except (TypeError, ValueError):
         return "NA"
 
 
-def _ts():
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+def _ts(t: float) -> str:
+    return datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S")
 
 
-def fetch_pyth_stable(feed_id: str):
-    try:
-        r = requests.get(PYTH_URL, params=[("ids[]", feed_id)], headers=UA, timeout=TIMEOUT)
-        r.raise_for_status()
-        j = r.json()
-        parsed = j.get("parsed", [])
-        if not parsed:
-            return None, None, None
-        item = parsed[0]
+def _warn(msg: str):
+    print(f"[oracles] {msg}", file=sys.stderr, flush=True)
+
+
+def _scaled(raw, expo):
+    return float(raw) * (10 ** int(expo)) if raw is not None and expo is not None else None
+
+
+def _feed_key(feed_id: str) -> str:
+    return feed_id.lower().removeprefix("0x")
+
+
+def parse_feeds(spec: str) -> dict:
+    """{symbol: pyth feed id or None} from "SYM=ID,SYM2,..."."""
+    feeds = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        symbol, _, feed_id = entry.partition("=")
+        feeds[symbol.strip().upper()] = _feed_key(feed_id.strip()) or None
+    return feeds
+
+
+def parse_pyth(j: dict) -> dict:
+    """{feed id: (price, ema, publish_time)} from a Hermes price/latest response."""
+    out = {}
+    for item in j.get("parsed", []) or []:
         p = item.get("price", {}) or {}
         ep = item.get("ema_price", {}) or {}
-        price_raw, expo = p.get("price"), p.get("expo")
-        ema_raw, ema_expo = ep.get("price"), ep.get("expo")
-        pub_time = p.get("publish_time")
-        price = float(price_raw) * (10 ** int(expo)) if price_raw is not None and expo is not None else None
-        ema = float(ema_raw) * (10 ** int(ema_expo)) if ema_raw is not None and ema_expo is not None else None
-        return price, ema, pub_time
-    except:
-        return None, None, None
-
-
-def fetch_cmc_price(symbol: str):
-    if not CMC_API_KEY:
-        return None
-    try:
-        r = requests.get(
-            CMC_URL,
-            params={"symbol": symbol, "convert": "USD"},
-            headers={"X-CMC_PRO_API_KEY": CMC_API_KEY, **UA},
-            timeout=TIMEOUT,
+        out[_feed_key(item.get("id", ""))] = (
+            _scaled(p.get("price"), p.get("expo")),
+            _scaled(ep.get("price"), ep.get("expo")),
+            p.get("publish_time"),
         )
-        r.raise_for_status()
-        j = r.json()
-        arr = j.get("data", {}).get(symbol)
-        if isinstance(arr, list) and arr:
-            price = arr[0].get("quote", {}).get("USD", {}).get("price")
-            return float(price) if price is not None else None
-        return None
-    except:
-        return None
+    return out
+
+
+def parse_cmc(j: dict, symbol: str):
+    """USD price for `symbol` from a CMC quotes/latest response."""
+    arr = (j.get("data") or {}).get(symbol)
+    if isinstance(arr, list) and arr:
+        price = arr[0].get("quote", {}).get("USD", {}).get("price")
+        return float(price) if price is not None else None
+    return None
+
+
+class RetryableStatus(Exception):
+    """HTTP status worth retrying (rate limit / server error)."""
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP, rng=random) -> float:
+    """Exponential backoff with jitter: uniform in [d/2, d], d = min(cap, base * 2**attempt)."""
+    d = min(cap, base * (2 ** min(attempt, 32)))
+    return rng.uniform(d / 2, d)
+
+
+class Source(ABC):
+    """
+    One HTTP data source queried once per tick for all its symbols;
+    subclasses build the request and map the JSON to {symbol: columns}.
+    """
+
+    name = "source"
+    columns: tuple = ()
+
+    def __init__(self, url: str, timeout: float = TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+
+    def enabled(self) -> bool:
+        return True
+
+    @abstractmethod
+    def request(self) -> dict:
+        """aiohttp request kwargs (params, headers) for one fetch."""
+
+    @abstractmethod
+    def parse(self, j: dict) -> dict:
+        """{symbol: {column: value}} from the response JSON."""
+
+    @abstractmethod
+    def symbols(self) -> list:
+        """Symbols this source reports, in row order."""
+
+    def empty(self) -> dict:
+        return {sym: {c: None for c in self.columns} for sym in self.symbols()}
+
+
+class PythSource(Source):
+    name = "pyth"
+    columns = ("Pyth_Stable", "Pyth_EMA", "Pyth_publish_time")
+
+    def __init__(self, feeds: dict, url: str = PYTH_URL, timeout: float = TIMEOUT):
+        super().__init__(url, timeout)
+        # symbol -> feed id, for the symbols that have a Pyth feed
+        self.feeds = {sym: _feed_key(fid) for sym, fid in feeds.items() if fid}
+
+    def enabled(self) -> bool:
+        return bool(self.feeds)
+
+    def symbols(self) -> list:
+        return list(self.feeds)
+
+    def request(self) -> dict:
+        return {"params": [("ids[]", fid) for fid in self.feeds.values()], "headers": UA}
+
+    def parse(self, j: dict) -> dict:
+        by_id = parse_pyth(j)
+        return {sym: dict(zip(self.columns, by_id.get(fid, (None, None, None)))) for sym, fid in self.feeds.items()}
+
+
+class CmcSource(Source):
+    name = "cmc"
+    columns = ("CMC_price_USD",)
+
+    def __init__(self, symbols, api_key: str = CMC_API_KEY, url: str = CMC_URL, timeout: float = TIMEOUT):
+        super().__init__(url, timeout)
+        self._symbols = [s.upper() for s in symbols]
+        self.api_key = api_key
+
+    def enabled(self) -> bool:
+        return bool(self.api_key) and bool(self._symbols)
+
+    def symbols(self) -> list:
+        return list(self._symbols)
+
+    def request(self) -> dict:
+        return {
+            "params": {"symbol": ",".join(self._symbols), "convert": "USD"},
+            "headers": {"X-CMC_PRO_API_KEY": self.api_key, **UA},
+        }
+
+    def parse(self, j: dict) -> dict:
+        return {sym: {"CMC_price_USD": parse_cmc(j, sym)} for sym in self._symbols}
+
+
+class SseParser:
+    """Incremental text/event-stream decoder: feed() raw bytes, get back complete (event, data) pairs."""
+
+    def __init__(self):
+        self.last_event_id = None
+        self._buf = b""
+        self._event = "message"
+        self._data = []
+
+    def feed(self, chunk: bytes) -> list:
+        *lines, self._buf = (self._buf + chunk).split(b"\n")
+        events = []
+        for raw in lines:
+            line = raw.rstrip(b"\r").decode("utf-8", "replace")
+            if not line:
+                # Blank line dispatches the event built so far
+                if self._data:
+                    events.append((self._event, "\n".join(self._data)))
+                self._event, self._data = "message", []
+                continue
+            if line.startswith(":"):
+                continue  # comment / keep-alive
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "data":
+                self._data.append(value)
+            elif field == "event":
+                self._event = value
+            elif field == "id":
+                self.last_event_id = value
+        return events
+
+
+class PythStream:
+    """
+    Hermes SSE subscription for every configured Pyth feed. Remembers the
+    newest publish_time per feed so updates replayed after a reconnect (or
+    repeated by Hermes) are dropped.
+    """
+
+    name = "pyth-stream"
+    columns = PythSource.columns
+
+    def __init__(self, feeds: dict, url: str = PYTH_STREAM_URL, idle_timeout: float = STREAM_IDLE_TIMEOUT):
+        self.url = url
+        self.idle_timeout = idle_timeout
+        self.feeds = {sym: _feed_key(fid) for sym, fid in feeds.items() if fid}
+        self._symbol = {fid: sym for sym, fid in self.feeds.items()}
+        self.last_seen = {}  # feed id -> newest publish_time
+        self.last_event_id = None
+
+    def symbols(self) -> list:
+        return list(self.feeds)
+
+    def request(self) -> dict:
+        headers = {"Accept": "text/event-stream", "User-Agent": UA["User-Agent"]}
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+        return {"params": [("ids[]", fid) for fid in self.feeds.values()] + [("parsed", "true")], "headers": headers}
+
+    def updates(self, j: dict) -> list:
+        """[(symbol, columns)] for the feeds in one stream event that moved past what was already seen."""
+        out = []
+        for fid, (price, ema, publish_time) in parse_pyth(j).items():
+            sym = self._symbol.get(fid)
+            if sym is None or publish_time is None:
+                continue
+            seen = self.last_seen.get(fid)
+            # Not newer than the last emitted update: a replay or a repeat
+            if seen is not None and publish_time <= seen:
+                continue
+            self.last_seen[fid] = publish_time
+            out.append((sym, dict(zip(self.columns, (price, ema, publish_time)))))
+        return out
+
+
+class OracleEngine:
+    """Fetches every source concurrently per tick over one keep-alive connection pool."""
+
+    def __init__(self, sources, retries: int = RETRIES, backoff_base: float = BACKOFF_BASE,
+                 backoff_cap: float = BACKOFF_CAP, pool_size: int = 20):
+        self.sources = list(sources)
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.pool_size = pool_size
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300, keepalive_timeout=INTERVAL + 60)
+        self.session = aiohttp.ClientSession(connector=connector)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+        self.session = None
+
+    async def _get_json(self, source: Source) -> dict:
+        timeout = aiohttp.ClientTimeout(total=source.timeout)
+        async with self.session.get(source.url, timeout=timeout, **source.request()) as r:
+            if r.status in RETRY_STATUSES:
+                raise RetryableStatus(f"HTTP {r.status}")
+            r.raise_for_status()
+            return await r.json(content_type=None)
+
+    async def fetch(self, source: Source) -> dict:
+        """{symbol: columns} for one source; all None once retries are exhausted or on a permanent error."""
+        if not source.enabled():
+            return source.empty()
+        for attempt in range(self.retries + 1):
+            try:
+                return source.parse(await self._get_json(source))
+            except (RetryableStatus, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    _warn(f"{source.name}: giving up after {attempt + 1} attempts ({type(e).__name__}: {e})")
+                    break
+                await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_cap))
+            except (aiohttp.ClientResponseError, ValueError, TypeError, AttributeError) as e:
+                # 4xx other than 429, or a body we cannot read: retrying will not help
+                _warn(f"{source.name}: {type(e).__name__}: {e}")
+                break
+        return source.empty()
+
+    def _blank_row(self) -> dict:
+        blank = {"timestamp": time.time()}
+        for source in self.sources:
+            blank.update(dict.fromkeys(source.columns))
+        return blank
+
+    async def tick(self) -> list:
+        """One row per symbol (timestamp = Unix seconds), in the order symbols first appear in the sources."""
+        results = await asyncio.gather(*(self.fetch(s) for s in self.sources))
+        blank = self._blank_row()
+        rows = {}
+        for source, by_symbol in zip(self.sources, results):
+            for sym in source.symbols():
+                row = rows.setdefault(sym, {**blank, "symbol": sym})
+                row.update(by_symbol.get(sym) or {})
+        return list(rows.values())
+
+    async def run(self, interval: float = INTERVAL, on_row=None, ticks: int = None):
+        """Tick every `interval` seconds (first tick immediately) until cancelled; on_row gets each row."""
+        on_row = on_row or RowPrinter()
+        loop = asyncio.get_running_loop()
+        n = 0
+        while ticks is None or n < ticks:
+            started = loop.time()
+            for row in await self.tick():
+                on_row(row)
+            n += 1
+            if ticks is None or n < ticks:
+                await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+    async def _stream_events(self, stream: PythStream):
+        """Parsed JSON payloads from one Hermes SSE connection, until the server closes it."""
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=TIMEOUT, sock_read=stream.idle_timeout)
+        async with self.session.get(stream.url, timeout=timeout, **stream.request()) as r:
+            if r.status in RETRY_STATUSES:
+                raise RetryableStatus(f"HTTP {r.status}")
+            r.raise_for_status()
+            parser = SseParser()
+            async for chunk in r.content.iter_any():
+                for _, data in parser.feed(chunk):
+                    if parser.last_event_id is not None:
+                        stream.last_event_id = parser.last_event_id
+                    try:
+                        yield json.loads(data)
+                    except ValueError:
+                        _warn(f"{stream.name}: skipping undecodable event ({data[:80]!r})")
+
+    async def _poll(self, latest: dict, interval: float, skip: set, on_row):
+        """Refresh `latest` ({symbol: columns}) from the polled sources every `interval`; symbols not in `skip` also get a row."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            for row in await self.tick():
+                latest[row["symbol"]] = {k: v for k, v in row.items() if k not in ("timestamp", "symbol")}
+                if row["symbol"] not in skip:
+                    on_row(row)
+            await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+    async def stream(self, stream: PythStream, interval: float = INTERVAL, on_row=None, events: int = None):
+        """
+        Emit a row for every fresh Hermes stream update until cancelled (or
+        `events` rows). The engine's own sources (e.g. CMC) are still polled
+        every `interval` and their latest columns ride along on each stream
+        row. Dropped connections are re-opened with backoff; a 4xx other
+        than 429 is raised.
+        """
+        on_row = on_row or RowPrinter()
+        latest = {}
+        poller = asyncio.create_task(self._poll(latest, interval, set(stream.symbols()), on_row)) if self.sources else None
+        blank = {**self._blank_row(), **dict.fromkeys(stream.columns)}
+        n, attempt = 0, 0
+        try:
+            while True:
+                try:
+                    async with aclosing(self._stream_events(stream)) as payloads:
+                        async for payload in payloads:
+                            attempt = 0
+                            for sym, cols in stream.updates(payload):
+                                on_row({**blank, **latest.get(sym, {}), "timestamp": time.time(), "symbol": sym, **cols})
+                                n += 1
+                                if events is not None and n >= events:
+                                    return
+                    _warn(f"{stream.name}: closed by server, reconnecting")
+                except (RetryableStatus, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+                    _warn(f"{stream.name}: {type(e).__name__}: {e}; reconnecting")
+                except aiohttp.ClientResponseError as e:
+                    # 4xx other than 429 (e.g. an unknown feed id) will not clear on
+                    # its own; reconnecting would only hammer Hermes with the same request
+                    _warn(f"{stream.name}: HTTP {e.status} {e.message}; giving up")
+                    raise
+                await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_cap))
+                attempt += 1
+        finally:
+            if poller is not None:
+                poller.cancel()
+                with suppress(asyncio.CancelledError):
+                    await poller
+
+
+def format_row(row: dict) -> dict:
+    return {
+        "timestamp": _ts(row["timestamp"]),
+        "symbol": row.get("symbol", ""),
+        "Pyth_Stable": _fmt(row.get("Pyth_Stable")),
+        "Pyth_EMA": _fmt(row.get("Pyth_EMA")),
+        "Pyth_publish_time": row["Pyth_publish_time"] if row.get("Pyth_publish_time") is not None else "NA",
+        "CMC_price_USD": _fmt(row.get("CMC_price_USD")),
+    }
 
 
 def print_header():
@@ -110,32 +504,72 @@ def print_row(row_dict):
     print("|" + "|".join(parts) + "|", flush=True)
 
 
-def job():
-    global header_printed
-    pyth_price, pyth_ema, pyth_pub = fetch_pyth_stable(PYTH_STABLE_ID)
-    cmc_price = fetch_cmc_price(CMC_SYMBOL)
+class RowPrinter:
+    """Prints the table header once, then one formatted row per tick."""
 
-    row = {
-        "timestamp": _ts(),
-        "Pyth_Stable": _fmt(pyth_price),
-        "Pyth_EMA": _fmt(pyth_ema),
-        "Pyth_publish_time": pyth_pub if pyth_pub is not None else "NA",
-        "CMC_price_USD": _fmt(cmc_price),
-    }
+    def __init__(self):
+        self.header_printed = False
 
-    if not header_printed:
-        print_header()
-        header_printed = True
-    print_row(row)
+    def __call__(self, row: dict):
+        if not self.header_printed:
+            print_header()
+            self.header_printed = True
+        print_row(format_row(row))
+
+
+def build_sources(feeds: dict, mode: str = "poll") -> list:
+    # In stream mode Pyth arrives over SSE; only CMC is polled
+    return ([] if mode == "stream" else [PythSource(feeds)]) + [CmcSource(list(feeds))]
+
+
+def fan_out(*sinks):
+    """One on_row callback feeding every sink in order."""
+    def on_row(row: dict):
+        for sink in sinks:
+            sink(row)
+    return on_row
+
+
+def build_monitor():
+    """DivergenceMonitor from ORACLE_ALERT_BPS & co, or None when the monitor is off."""
+    bps = os.getenv("ORACLE_ALERT_BPS", "").strip()
+    if not bps:
+        return None
+    thresholds = Thresholds(max_divergence_bps=float(bps),
+                            max_staleness=float(os.getenv("ORACLE_MAX_STALENESS") or 120))
+    log = os.getenv("ORACLE_ALERT_LOG", "").strip()
+    sink = fan_out(print_alert, JsonlAlertSink(log)) if log else print_alert
+    return DivergenceMonitor(float(os.getenv("ORACLE_STATS_WINDOW") or 3600), thresholds, sink)
+
+
+async def _main(feeds: dict, interval: float, store_dir: str, mode: str = "poll", monitor=None):
+    sinks = [RowPrinter()]
+    store = OracleStore(store_dir) if store_dir else None
+    if store is not None:
+        sinks.append(StoreSink(store))
+    if monitor is not None:
+        sinks.append(monitor)
+    try:
+        async with OracleEngine(build_sources(feeds, mode)) as engine:
+            if mode == "stream":
+                await engine.stream(PythStream(feeds), interval, on_row=fan_out(*sinks))
+            else:
+                await engine.run(interval, on_row=fan_out(*sinks))
+    finally:
+        if store is not None:
+            store.close()
 
 
 def main():
-    job()  # immediate
-    schedule.every(5).minutes.do(job)
+    interval = float(os.getenv("ORACLE_INTERVAL_SECONDS") or INTERVAL)
+    feeds = parse_feeds(os.getenv("ORACLE_FEEDS") or DEFAULT_FEEDS)
+    if not feeds:
+        raise SystemExit("ORACLE_FEEDS has no symbols.")
+    mode = (os.getenv("ORACLE_MODE") or "poll").strip().lower()
+    if mode not in ("poll", "stream"):
+        raise SystemExit(f"ORACLE_MODE must be poll or stream, not {mode!r}.")
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+        asyncio.run(_main(feeds, interval, os.getenv("ORACLE_STORE_DIR", "").strip(), mode, build_monitor()))
     except KeyboardInterrupt:
         print("\nStopped.")
 
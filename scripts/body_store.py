@@ -0,0 +1,137 @@
+"""
+Content-addressed store for proposal bodies created in the hub's hashed body mode.
+
+In hashed mode (`GovernanceHub.setBodyMode(1)`) a proposal's body is not written
+to ProposalTemplate storage. The hub keeps `bodyHash(proposal)` =
+keccak256(body) and `bodyLength(proposal)`, and emits the body once in
+`ProposalBody`. This module keeps those bodies on local disk keyed by their hash:
+
+- put() writes atomically under <root>/<hash[:2]>/<hash>
+- get() re-hashes what it reads and raises BodyIntegrityError on mismatch,
+  so a corrupted or tampered file is never served
+- read_proposal_body() is the read path: one lookup by the on-chain hash,
+  falling back to the ProposalBody event (verified the same way) on a miss
+
+HubIndexer(blob_store=...) fills the store while it indexes; `main` backfills
+it from ProposalBody events directly.
+
+Usage
+-----
+    GOVERNANCE_HUB=0x... ape run body_store --network ethereum:sepolia:alchemy
+
+Environment
+-----------
+- GOVERNANCE_HUB    (required) hub whose ProposalBody events are stored
+- BODY_STORE_DIR    (default: proposal_bodies) store root directory
+- HUB_START_BLOCK   (default: 0) first block to scan for ProposalBody events
+"""
+
+import os
+import tempfile
+
+from eth_utils import keccak
+
+ZERO_HASH = "0x" + "00" * 32
+
+
+class BodyIntegrityError(ValueError):
+    """Stored or fetched body does not hash to the expected commitment."""
+
+
+def body_hash(body: str) -> str:
+    """keccak256 of the UTF-8 body, as GovernanceHub computes it."""
+    return "0x" + keccak(body.encode()).hex()
+
+
+def _normalize(h) -> str:
+    h = h.hex() if isinstance(h, (bytes, bytearray)) else str(h)
+    h = h.lower()
+    return h if h.startswith("0x") else "0x" + h
+
+
+class BlobStore:
+    """Filesystem blob store keyed by keccak256 of the content."""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, h: str) -> str:
+        h = _normalize(h)
+        return os.path.join(self.root, h[2:4], h[2:])
+
+    def has(self, h) -> bool:
+        return os.path.exists(self._path(h))
+
+    def put(self, body: str, expected_hash=None) -> str:
+        h = body_hash(body)
+        if expected_hash is not None and _normalize(expected_hash) != h:
+            raise BodyIntegrityError(f"body hashes to {h}, expected {_normalize(expected_hash)}")
+        path = self._path(h)
+        if os.path.exists(path):
+            return h
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(body.encode())
+        os.replace(tmp, path)
+        return h
+
+    def get(self, h) -> str | None:
+        """Return the verified body for `h`, or None if it is not stored."""
+        h = _normalize(h)
+        try:
+            with open(self._path(h), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if "0x" + keccak(data).hex() != h:
+            raise BodyIntegrityError(f"stored blob {h} is corrupted")
+        return data.decode()
+
+
+def read_proposal_body(hub, proposal: str, store: BlobStore | None = None, start_block: int = 0) -> str:
+    """
+    Body of `proposal`, verified against the hub's on-chain commitment.
+
+    Stored-mode proposals read ProposalTemplate.body. Hashed-mode proposals
+    are one blob-store lookup; on a miss the ProposalBody event is fetched,
+    verified and cached.
+    """
+    from ape import chain, project
+
+    committed = _normalize(hub.bodyHash(proposal))
+    if committed == ZERO_HASH:
+        return project.ProposalTemplate.at(proposal).body()
+    if store is not None:
+        body = store.get(committed)
+        if body is not None:
+            return body
+    for log in hub.ProposalBody.range(start_block, chain.blocks.height + 1, search_topics={"proposal": proposal}):
+        if _normalize(log.bodyHash) == committed and body_hash(log.body) == committed:
+            if store is not None:
+                store.put(log.body)
+            return log.body
+    raise BodyIntegrityError(f"no body matching {committed} found for {proposal}")
+
+
+def main():
+    from ape import chain, project
+
+    hub_address = os.environ.get("GOVERNANCE_HUB", "").strip()
+    if not hub_address:
+        raise SystemExit("Set GOVERNANCE_HUB.")
+    root = os.environ.get("BODY_STORE_DIR", "").strip() or "proposal_bodies"
+    start_block = int(os.environ.get("HUB_START_BLOCK") or 0)
+
+    hub = project.GovernanceHub.at(hub_address)
+    store = BlobStore(root)
+    stored = 0
+    for log in hub.ProposalBody.range(start_block, chain.blocks.height + 1):
+        store.put(log.body, expected_hash=log.bodyHash)
+        stored += 1
+    print(f"Stored {stored} bodies under {root}")
+
+
+if __name__ == "__main__":
+    main()
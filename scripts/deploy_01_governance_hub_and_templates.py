@@ -1,6 +1,7 @@
 """
-Deploy GovernanceHub + its ProposalTemplate and CommentTemplate using Ape,
-then auto-update the frontend config with the deployed GovernanceHub address.
+Deploy GovernanceHub + its ProposalTemplate and CommentTemplate (plus the
+read-only GovernanceLens) using Ape, then auto-update the frontend config with
+the deployed GovernanceHub and GovernanceLens addresses.
 
 Script order: 01
 File name    : deploy_01_governance_hub_and_templates.py
@@ -26,7 +27,8 @@ Environment overrides (optional)
 
 After deployment
 ----------------
-- Writes GovernanceHub address into app/src/config/contracts.ts for the active env (testnet/mainnet).
+- Writes GovernanceHub and GovernanceLens addresses into app/src/config/contracts.ts
+  for the active env (testnet/mainnet).
 - Syncs ABIs into app/src/abis/*.json.
 """
 
@@ -58,10 +60,11 @@ def _get_env(name: str) -> str | None:
   return None
 
 
-def _update_frontend_governance_hub(env_key: str, hub_address: str) -> None:
+def _update_frontend_address(env_key: str, entry: str, address: str) -> None:
   """
   Patch `app/src/config/contracts.ts` so the correct env entry
-  (`testnet` or `mainnet`) uses the freshly deployed GovernanceHub address.
+  (`testnet` or `mainnet`) uses the freshly deployed address for `entry`
+  (e.g. `governanceHub`, `governanceLens`).
   """
   repo_root = Path(__file__).resolve().parents[1]
   ts_path = repo_root / "app" / "src" / "config" / "contracts.ts"
@@ -72,22 +75,22 @@ def _update_frontend_governance_hub(env_key: str, hub_address: str) -> None:
 
   content = ts_path.read_text(encoding="utf-8")
 
-  # Replace only governanceHub.address within the target env block
-  pattern = rf"({env_key}:\s*{{[\s\S]*?governanceHub:\s*{{[\s\S]*?address:\s*')0x[0-9a-fA-F]{{40}}(')"
+  # Replace only <entry>.address within the target env block
+  pattern = rf"({env_key}:\s*{{[\s\S]*?{entry}:\s*{{[\s\S]*?address:\s*')0x[0-9a-fA-F]{{40}}(')"
 
   def _repl(match):
     prefix = match.group(1)
     suffix = match.group(2)
-    return f"{prefix}{hub_address}{suffix}"
+    return f"{prefix}{address}{suffix}"
 
   new_content, count = re.subn(pattern, _repl, content, flags=re.DOTALL)
 
   if count == 0:
-    print(f"[WARN] Did not find governanceHub.address for env '{env_key}' in contracts.ts.")
+    print(f"[WARN] Did not find {entry}.address for env '{env_key}' in contracts.ts.")
     return
 
   ts_path.write_text(new_content, encoding="utf-8")
-  print(f"[OK] Updated frontend contracts.ts for env '{env_key}' with GovernanceHub address {hub_address}")
+  print(f"[OK] Updated frontend contracts.ts for env '{env_key}' with {entry} address {address}")
 
 
 def main():
@@ -164,9 +167,14 @@ def main():
   hub_address = hub.address
   print(f"[OK] GovernanceHub deployed at: {hub_address}")
 
+  print("Deploying GovernanceLens...")
+  lens = deployer.deploy(project.GovernanceLens)
+  print(f"[OK] GovernanceLens deployed at: {lens.address}")
+
   if env_key:
     try:
-      _update_frontend_governance_hub(env_key, hub_address)
+      _update_frontend_address(env_key, "governanceHub", hub_address)
+      _update_frontend_address(env_key, "governanceLens", lens.address)
     except Exception as exc:  # noqa: BLE001
       print(f"[WARN] Failed to update frontend contracts.ts: {exc!r}")
 
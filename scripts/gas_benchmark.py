@@ -0,0 +1,210 @@
+"""
+Gas benchmark suite for GovernanceHub and its templates.
+
+For each backlog size (number of proposals already in the hub) a fresh hub is
+deployed on the local test chain, filled with a mix of DRAFT / OPEN / ACTIVE /
+CLOSED proposals, and every entry point is measured once:
+
+- createProposal at several title/body sizes (stored and hashed body mode)
+- addComment (clone and light mode), castVote (first / later voter), castVotes
+- adminMoveState, setVotingWindow, syncProposalState
+- views via eth_estimateGas: getTopActiveProposal, getTopActiveProposals,
+  getProposals (full page)
+- ERC1155 mintBatch / safeBatchTransferFrom with each id repeated in a run
+
+Results are written as JSON ({size: {benchmark: gas}}). In compare mode the run
+is checked against a baseline and every benchmark that got more than
+`threshold` (relative) more expensive is reported; the exit status is non-zero
+if any regressed.
+
+Usage
+-----
+    ape run gas_benchmark --network ethereum:local:test
+    GAS_BENCH_MODE=record ape run gas_benchmark --network ethereum:local:test
+
+Environment
+-----------
+- GAS_BENCH_SIZES             (default: 10,1000) comma-separated backlog sizes
+                              (the lists are mapping-backed, so past a full
+                              page of each state nothing depends on the backlog
+                              and larger sizes record the 1000 numbers again)
+- GAS_BENCH_MODE              (default: compare) "record" overwrites the baseline
+- GAS_BASELINE                (default: benchmarks/gas_baseline.json)
+- GAS_REGRESSION_THRESHOLD    (default: 0.05) allowed relative increase
+"""
+
+import json
+import os
+import sys
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "gas_baseline.json")
+DEFAULT_THRESHOLD = 0.05
+
+STATE_DRAFT = 0
+STATE_OPEN = 1
+STATE_ACTIVE = 2
+STATE_CLOSED = 3
+
+# (title bytes, body bytes)
+CREATE_SIZES = ((8, 0), (128, 1024), (128, 4096))
+FAR_FUTURE = 10**10
+HOUR = 3600
+
+# `ape run` does not put scripts/ on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from local_hub import deploy_hub  # noqa: E402
+
+
+def populate(hub, author, chain, count: int) -> None:
+    """Create `count` proposals spread round-robin over the four states."""
+    now = chain.pending_timestamp
+    windows = ((0, 0), (FAR_FUTURE, FAR_FUTURE + 1), (now, FAR_FUTURE), (1, 2))
+    for i in range(count):
+        vs, ve = windows[i % 4]
+        hub.createProposal(f"Backlog {i}", "Body", vs, ve, sender=author)
+
+
+def _latest(hub, state: int) -> str:
+    return hub.getProposals(state, 0, 1, True)[0]
+
+
+def measure(hub, bobu, accounts, chain) -> dict[str, int]:
+    """Run every benchmark once against a populated hub."""
+    author = accounts[5]
+    voters = accounts[6:15]
+    gas: dict[str, int] = {}
+    # Start just after an hour boundary so every window written below lands in
+    # the same hour bucket of the hub's window index on every run
+    chain.mine(timestamp=(chain.pending_timestamp // HOUR + 1) * HOUR + 60)
+
+    for title_len, body_len in CREATE_SIZES:
+        tx = hub.createProposal("t" * title_len, "b" * body_len, 0, 0, sender=author)
+        gas[f"createProposal title={title_len} body={body_len}"] = tx.gas_used
+    hub.setBodyMode(1, sender=bobu)
+    tx = hub.createProposal("t" * 128, "b" * 4096, 0, 0, sender=author)
+    gas["createProposal title=128 body=4096 hashed"] = tx.gas_used
+    hub.setBodyMode(0, sender=bobu)
+
+    draft = _latest(hub, STATE_DRAFT)
+    hub.addComment(draft, "warm", 1, sender=voters[0])
+    gas["addComment clone 256B"] = hub.addComment(draft, "c" * 256, 1, sender=voters[1]).gas_used
+    hub.setCommentMode(1, sender=bobu)
+    hub.addComment(draft, "warm", 1, sender=voters[0])
+    gas["addComment light 256B"] = hub.addComment(draft, "c" * 256, 1, sender=voters[1]).gas_used
+    hub.setCommentMode(0, sender=bobu)
+
+    now = chain.pending_timestamp
+    hub.createProposal("Vote here", "Body", now, FAR_FUTURE, sender=author)
+    active = _latest(hub, STATE_ACTIVE)
+    gas["castVote first voter"] = hub.castVote(active, True, sender=voters[0]).gas_used
+    gas["castVote later voter"] = hub.castVote(active, False, sender=voters[1]).gas_used
+    ballot = []
+    for i in range(10):
+        hub.createProposal(f"Ballot {i}", "Body", now, FAR_FUTURE, sender=author)
+        ballot.append(_latest(hub, STATE_ACTIVE))
+    gas["castVotes x10"] = hub.castVotes(ballot, [True] * 10, sender=voters[2]).gas_used
+
+    gas["adminMoveState DRAFT->OPEN"] = hub.adminMoveState(draft, STATE_OPEN, sender=bobu).gas_used
+    gas["adminMoveState ACTIVE->CLOSED"] = hub.adminMoveState(active, STATE_CLOSED, sender=bobu).gas_used
+
+    hub.createProposal("Window", "Body", 0, 0, sender=author)
+    windowed = _latest(hub, STATE_DRAFT)
+    now = chain.pending_timestamp
+    gas["setVotingWindow DRAFT->ACTIVE"] = hub.setVotingWindow(windowed, now, now + 100, sender=author).gas_used
+    chain.mine(timestamp=now + 101)
+    gas["syncProposalState ACTIVE->CLOSED"] = hub.syncProposalState(windowed, sender=author).gas_used
+
+    gas["view getTopActiveProposal"] = hub.getTopActiveProposal.estimate_gas_cost()
+    gas["view getTopActiveProposals(10)"] = hub.getTopActiveProposals.estimate_gas_cost(10)
+    gas["view getProposals ACTIVE page=100"] = hub.getProposals.estimate_gas_cost(STATE_ACTIVE, 0, 100, False)
+
+    # Gate token batches where each id repeats in a run (runs share one write)
+    from ape import project
+
+    token = accounts[0].deploy(project.ERC1155)
+    ids = list(range(1, 11))
+    runs = [i for i in ids for _ in range(5)]
+    token.mintBatch(voters[3], ids, [100] * 10, b"", sender=accounts[0])
+    gas["ERC1155 mintBatch 50 items / 10 ids"] = token.mintBatch(voters[3], runs, [1] * 50, b"", sender=accounts[0]).gas_used
+    gas["ERC1155 safeBatchTransferFrom 50 items / 10 ids"] = token.safeBatchTransferFrom(
+        voters[3], voters[4], runs, [1] * 50, b"", sender=voters[3]
+    ).gas_used
+    return gas
+
+
+def run(sizes, accounts, chain) -> dict[str, dict[str, int]]:
+    results = {}
+    for size in sizes:
+        hub, bobu = deploy_hub(accounts)
+        populate(hub, accounts[5], chain, size)
+        results[str(size)] = measure(hub, bobu, accounts, chain)
+    return results
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """Benchmarks whose gas grew by more than `threshold` relative to the baseline."""
+    regressions = []
+    for size, results in current.items():
+        for name, gas in results.items():
+            before = baseline.get(size, {}).get(name)
+            if before is None or before == 0:
+                continue
+            change = (gas - before) / before
+            if change > threshold:
+                regressions.append({"size": size, "benchmark": name, "baseline": before, "current": gas, "change": change})
+    return regressions
+
+
+def format_report(baseline: dict, current: dict) -> str:
+    lines = [f"{'size':>6}  {'benchmark':<40} {'baseline':>10} {'current':>10} {'change':>8}"]
+    for size, results in current.items():
+        for name, gas in results.items():
+            before = baseline.get(size, {}).get(name)
+            change = "new" if not before else f"{(gas - before) / before:+.1%}"
+            lines.append(f"{size:>6}  {name:<40} {before or '-':>10} {gas:>10} {change:>8}")
+    return "\n".join(lines)
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: dict) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main():
+    from ape import accounts, chain
+
+    sizes = [int(s) for s in (os.environ.get("GAS_BENCH_SIZES") or "10,1000").split(",") if s.strip()]
+    mode = (os.environ.get("GAS_BENCH_MODE") or "compare").strip().lower()
+    path = os.environ.get("GAS_BASELINE", "").strip() or DEFAULT_BASELINE
+    threshold = float(os.environ.get("GAS_REGRESSION_THRESHOLD") or DEFAULT_THRESHOLD)
+
+    current = run(sizes, accounts.test_accounts, chain)
+    baseline = load_baseline(path)
+    print(format_report(baseline, current))
+
+    if mode == "record":
+        merged = {**baseline, **current}
+        save_baseline(path, merged)
+        print(f"\nBaseline written to {path}")
+        return
+
+    regressions = compare(baseline, current, threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {threshold:.0%}:")
+        for r in regressions:
+            print(f"  [{r['size']}] {r['benchmark']}: {r['baseline']} -> {r['current']} ({r['change']:+.1%})")
+        sys.exit(1)
+    print(f"\nNo regressions above {threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
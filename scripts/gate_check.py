@@ -0,0 +1,111 @@
+"""
+Bulk token-gate eligibility check against a GovernanceHub.
+
+Reads holder addresses from a CSV, asks the hub about them 100 at a time
+through `GovernanceHub.hasTokenBatch` (one `balanceOfBatch` on the gate token
+per chunk), and writes `address,eligible` rows to an output CSV. Input is
+streamed, so lists of any length run in constant memory; tens of thousands
+of addresses take a few hundred eth_calls instead of one per address.
+
+The input may have a header row. Addresses are taken from the `address`
+column when there is one, otherwise from the first column; blank lines are
+skipped and invalid addresses are written out with `eligible` = `invalid`.
+
+Usage
+-----
+    GOVERNANCE_HUB=0x... GATE_CHECK_INPUT=holders.csv ape run gate_check --network ethereum:sepolia:alchemy
+
+Environment
+-----------
+- GOVERNANCE_HUB      (required) hub whose token gate is checked
+- GATE_CHECK_INPUT    (required) CSV of addresses
+- GATE_CHECK_OUTPUT   (default: <input>.eligibility.csv) results CSV
+"""
+
+import csv
+import os
+from typing import Iterable, Iterator
+
+from eth_utils import is_address, to_checksum_address
+
+# GovernanceHub.MAX_GATE_REFRESH, the hasTokenBatch bound
+CHUNK_SIZE = 100
+
+
+def read_addresses(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the address cell of every non-empty CSV row. The first row is a
+    header only if its first cell is not hex-like; a malformed address there
+    is yielded (and reported invalid) like any other row.
+    """
+    reader = csv.reader(lines)
+    column = 0
+    for i, row in enumerate(reader):
+        cells = [c.strip() for c in row]
+        if not any(cells):
+            continue
+        if i == 0 and not cells[0].lower().startswith("0x"):
+            lowered = [c.lower() for c in cells]
+            column = lowered.index("address") if "address" in lowered else 0
+            continue
+        yield cells[column] if column < len(cells) else ""
+
+
+def chunked(items: Iterable[str], size: int = CHUNK_SIZE) -> Iterator[list[str]]:
+    chunk: list[str] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def check_eligibility(hub, addresses: Iterable[str], chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, str]]:
+    """Yield (address, "true" | "false" | "invalid") in input order."""
+    chunk_size = max(1, min(chunk_size, CHUNK_SIZE))
+    for chunk in chunked(addresses, chunk_size):
+        valid = [to_checksum_address(a) for a in chunk if is_address(a)]
+        flags = iter(hub.hasTokenBatch(valid) if valid else [])
+        for a in chunk:
+            if is_address(a):
+                yield to_checksum_address(a), "true" if next(flags) else "false"
+            else:
+                yield a, "invalid"
+
+
+def run(hub, input_path: str, output_path: str, chunk_size: int = CHUNK_SIZE) -> dict:
+    counts = {"true": 0, "false": 0, "invalid": 0}
+    with open(input_path, newline="") as src, open(output_path, "w", newline="") as dst:
+        writer = csv.writer(dst)
+        writer.writerow(["address", "eligible"])
+        for address, eligible in check_eligibility(hub, read_addresses(src), chunk_size):
+            writer.writerow([address, eligible])
+            counts[eligible] += 1
+    return counts
+
+
+def main():
+    import time
+
+    from ape import project
+
+    hub_address = os.environ.get("GOVERNANCE_HUB", "").strip()
+    input_path = os.environ.get("GATE_CHECK_INPUT", "").strip()
+    if not hub_address or not input_path:
+        raise SystemExit("Set GOVERNANCE_HUB and GATE_CHECK_INPUT.")
+    output_path = os.environ.get("GATE_CHECK_OUTPUT", "").strip() or f"{os.path.splitext(input_path)[0]}.eligibility.csv"
+
+    started = time.monotonic()
+    counts = run(project.GovernanceHub.at(hub_address), input_path, output_path)
+    elapsed = time.monotonic() - started
+    total = sum(counts.values())
+    print(
+        f"Checked {total} addresses in {elapsed:.1f}s: eligible={counts['true']} "
+        f"not_eligible={counts['false']} invalid={counts['invalid']} -> {output_path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
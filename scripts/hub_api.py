@@ -0,0 +1,333 @@
+"""
+Read-only HTTP/JSON API over the hub_indexer SQLite database.
+
+Serves the pages the frontend otherwise assembles from many RPC reads:
+per-state proposal lists, proposal detail (body + first comment page + vote
+tally), comment pages and votes. Nothing here talks to the chain; run
+hub_indexer (HUB_INDEX_FOLLOW=1) next to it to keep the database fresh.
+
+Routes (all GET)
+----------------
+- /health                                  indexed block + per-state counts
+- /proposals?state=&offset=&count=&reverse=  ordered by state entry; offsets differ from GovernanceHub.getProposals
+- /proposals/<address>                     detail incl. body, tally, first comment page
+- /proposals/<address>/comments?offset=&count=&reverse=  same paging as getComments
+- /proposals/<address>/votes               tally + individual votes
+- /proposals/<address>/body                body + bodyHash (keccak256 commitment in hashed body mode)
+
+Responses are cached in-process (LRU, bounded by size and TTL). Cache keys
+carry the store's data version, so a sync or reorg rollback invalidates them
+without waiting for the TTL. Every response has a strong ETag; requests with a
+matching If-None-Match get 304 Not Modified.
+
+Usage
+-----
+    python scripts/hub_api.py
+
+Environment
+-----------
+- HUB_INDEX_DB        (default: hub_index.sqlite) database written by hub_indexer
+- HUB_API_HOST        (default: 127.0.0.1)
+- HUB_API_PORT        (default: 8787)
+- HUB_API_CACHE_SIZE  (default: 512) max cached responses
+- HUB_API_CACHE_TTL   (default: 5) seconds a cached response may be served
+- HUB_API_CORS_ORIGIN (default: *) Access-Control-Allow-Origin value
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from eth_utils import is_address, to_checksum_address
+
+from hub_indexer import PAGE_LIMIT, STATE_NAMES, HubStore
+
+
+class ApiError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ResponseCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds."""
+
+    def __init__(self, max_entries: int = 512, ttl: float = 5.0, clock=time.monotonic):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self.clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# --------------------------
+# JSON shapes
+# --------------------------
+def _proposal_json(row: dict, with_body: bool = False) -> dict:
+    out = {
+        "address": row["address"],
+        "title": row["title"],
+        "author": row["author"],
+        "state": row["state"],
+        "createdAt": row["created_at"],
+        "voteStart": row["vote_start"],
+        "voteEnd": row["vote_end"],
+        "votesFor": row["votes_for"],
+        "votesAgainst": row["votes_against"],
+        "commentCount": row["comment_count"],
+    }
+    if with_body:
+        out["body"] = row["body"]
+        out["bodyHash"] = row["body_hash"]
+    return out
+
+
+def _comment_json(row: dict) -> dict:
+    return {
+        "address": row["address"],
+        "author": row["author"],
+        "content": row["content"],
+        "createdAt": row["created_at"],
+        "sentiment": row["sentiment"],
+        "deleted": bool(row["deleted"]),
+    }
+
+
+def _vote_json(row: dict) -> dict:
+    return {"voter": row["voter"], "support": bool(row["support"]), "weight": row["weight"]}
+
+
+# --------------------------
+# Query parsing
+# --------------------------
+def _int_param(query: dict, name: str, default: int, lo: int = 0, hi: int | None = None) -> int:
+    raw = query.get(name, [None])[0]
+    if raw in (None, ""):
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer")
+    if value < lo:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be >= {lo}")
+    return value if hi is None else min(value, hi)
+
+
+def _bool_param(query: dict, name: str) -> bool:
+    return query.get(name, ["false"])[0].strip().lower() in ("1", "true", "yes")
+
+
+def _address(raw: str) -> str:
+    if not is_address(raw):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"invalid address: {raw}")
+    return to_checksum_address(raw)
+
+
+class HubApi:
+    """Routes requests to the store and caches the encoded responses."""
+
+    def __init__(self, store: HubStore, cache: ResponseCache | None = None):
+        self.store = store
+        self.cache = cache if cache is not None else ResponseCache()
+        # One sqlite connection is shared by the server's worker threads
+        self._db_lock = threading.Lock()
+
+    def handle(self, path: str, query: dict) -> tuple[bytes, str]:
+        """Return (json body, etag) for a GET, raising ApiError for 4xx."""
+        parts = [p for p in path.split("/") if p]
+        if parts == ["health"]:
+            key = ("health",)
+        elif parts == ["proposals"]:
+            state = _int_param(query, "state", 0)
+            if state not in STATE_NAMES:
+                raise ApiError(HTTPStatus.BAD_REQUEST, "state must be 0..3")
+            key = (
+                "proposals",
+                state,
+                _int_param(query, "offset", 0),
+                _int_param(query, "count", PAGE_LIMIT, hi=PAGE_LIMIT),
+                _bool_param(query, "reverse"),
+            )
+        elif len(parts) == 2 and parts[0] == "proposals":
+            key = ("proposal", _address(parts[1]))
+        elif len(parts) == 3 and parts[0] == "proposals" and parts[2] == "comments":
+            key = (
+                "comments",
+                _address(parts[1]),
+                _int_param(query, "offset", 0),
+                _int_param(query, "count", PAGE_LIMIT, hi=PAGE_LIMIT),
+                _bool_param(query, "reverse"),
+            )
+        elif len(parts) == 3 and parts[0] == "proposals" and parts[2] == "votes":
+            key = ("votes", _address(parts[1]))
+        elif len(parts) == 3 and parts[0] == "proposals" and parts[2] == "body":
+            key = ("body", _address(parts[1]))
+        else:
+            raise ApiError(HTTPStatus.NOT_FOUND, "no such route")
+
+        with self._db_lock:
+            version = self.store.data_version
+            cached = self.cache.get((version, key))
+            if cached is not None:
+                return cached
+            payload = self._render(key)
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        self.cache.put((version, key), (body, etag))
+        return body, etag
+
+    def _require(self, address: str) -> dict:
+        row = self.store.get_proposal(address)
+        if row is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"unknown proposal: {address}")
+        return row
+
+    def _render(self, key: tuple) -> dict:
+        kind = key[0]
+        if kind == "health":
+            counts = self.store.count_by_state()
+            return {
+                "lastBlock": self.store.last_block,
+                "counts": {STATE_NAMES[st]: n for st, n in counts.items()},
+            }
+        if kind == "proposals":
+            _, state, offset, count, reverse = key
+            rows = self.store.list_proposals(state, offset, count, reverse)
+            return {
+                "state": state,
+                "offset": offset,
+                "count": count,
+                "reverse": reverse,
+                "total": self.store.count_by_state()[state],
+                "items": [_proposal_json(r) for r in rows],
+            }
+        if kind == "proposal":
+            row = self._require(key[1])
+            out = _proposal_json(row, with_body=True)
+            out["tally"] = self.store.vote_tally(key[1])
+            out["comments"] = [_comment_json(c) for c in self.store.list_comments(key[1])]
+            return out
+        if kind == "comments":
+            _, address, offset, count, reverse = key
+            row = self._require(address)
+            return {
+                "proposal": address,
+                "offset": offset,
+                "count": count,
+                "reverse": reverse,
+                "total": row["comment_count"],
+                "items": [_comment_json(c) for c in self.store.list_comments(address, offset, count, reverse)],
+            }
+        if kind == "body":
+            row = self._require(key[1])
+            return {"proposal": key[1], "body": row["body"], "bodyHash": row["body_hash"]}
+        # votes
+        self._require(key[1])
+        return {
+            "proposal": key[1],
+            "tally": self.store.vote_tally(key[1]),
+            "items": [_vote_json(v) for v in self.store.list_votes(key[1])],
+        }
+
+
+def make_handler(api: HubApi, cors_origin: str = "*"):
+    class HubApiHandler(BaseHTTPRequestHandler):
+        server_version = "HubApi/1.0"
+
+        def _send(self, status: HTTPStatus, body: bytes = b"", etag: str | None = None):
+            self.send_response(status)
+            self.send_header("Access-Control-Allow-Origin", cors_origin)
+            self.send_header("Access-Control-Expose-Headers", "ETag")
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            if status != HTTPStatus.NOT_MODIFIED:
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if body and status != HTTPStatus.NOT_MODIFIED:
+                self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            try:
+                body, etag = api.handle(url.path, parse_qs(url.query))
+            except ApiError as e:
+                self._send(e.status, json.dumps({"error": e.message}).encode())
+                return
+            client_tags = {t.strip() for t in self.headers.get("If-None-Match", "").split(",")}
+            if etag in client_tags or "*" in client_tags:
+                self._send(HTTPStatus.NOT_MODIFIED, etag=etag)
+            else:
+                self._send(HTTPStatus.OK, body, etag)
+
+        def do_OPTIONS(self):
+            self.send_response(HTTPStatus.NO_CONTENT)
+            self.send_header("Access-Control-Allow-Origin", cors_origin)
+            self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "If-None-Match")
+            self.end_headers()
+
+    return HubApiHandler
+
+
+def serve(store: HubStore, host: str = "127.0.0.1", port: int = 8787, cache: ResponseCache | None = None, cors_origin: str = "*") -> ThreadingHTTPServer:
+    """Create (but do not start) a threaded server; call serve_forever() on it."""
+    return ThreadingHTTPServer((host, port), make_handler(HubApi(store, cache), cors_origin))
+
+
+def main():
+    db_path = os.environ.get("HUB_INDEX_DB", "").strip() or "hub_index.sqlite"
+    host = os.environ.get("HUB_API_HOST", "").strip() or "127.0.0.1"
+    port = int(os.environ.get("HUB_API_PORT") or 8787)
+    cache = ResponseCache(
+        max_entries=int(os.environ.get("HUB_API_CACHE_SIZE") or 512),
+        ttl=float(os.environ.get("HUB_API_CACHE_TTL") or 5),
+    )
+    cors_origin = os.environ.get("HUB_API_CORS_ORIGIN", "").strip() or "*"
+
+    store = HubStore(db_path)
+    server = serve(store, host, port, cache, cors_origin)
+    print(f"Serving {db_path} on http://{host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        server.server_close()
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
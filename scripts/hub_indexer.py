@@ -0,0 +1,808 @@
+"""
+Event-sourced SQLite index of a GovernanceHub.
+
+Follows the hub's `ProposalCreated`, `StateChanged`, `VotingWindowUpdated`,
+`CommentAdded`/`CommentDeleted` and `LightCommentAdded`/`LightCommentDeleted`
+events plus `Voted` from every ProposalTemplate clone, and materializes
+proposals, comments, votes and the per-state lists into a local SQLite
+database. Listing and searching proposals then reads the database instead of
+paging `getProposals` for every state on chain.
+
+- Logs are fetched with block-range `eth_getLogs` pages: the hub's events
+  filtered by the hub address, then `Voted` by topic alone, keeping only logs
+  from proposals known so far (including ones created in the same page).
+  Each page costs two requests however many proposals exist. The range
+  shrinks when the provider rejects a request with a range/result cap or a
+  page is too dense, and grows again while pages stay sparse; any other
+  provider error is raised.
+- The last indexed block is checkpointed in the same SQLite transaction as the
+  rows it produced, so a restart resumes exactly where it stopped.
+- Fields not carried by events (body, window, createdAt, comment content, ...)
+  are hydrated in bulk through Multicall3 (see multicall_reader.py).
+- Reorgs: block hashes inside the confirmation window (the last N blocks) are
+  kept as checkpoints. Each sync first re-checks them; if the chain diverged,
+  every row written from an orphaned block is rolled back and the surviving
+  proposals it touched are re-read from the canonical chain before syncing
+  forward again. Blocks deeper than N are treated as final and only their
+  boundary hash is kept, so a re-sync touches at most the last N blocks.
+
+Usage
+-----
+    GOVERNANCE_HUB=0x... ape run hub_indexer --network ethereum:sepolia:alchemy
+
+Environment
+-----------
+- GOVERNANCE_HUB          (required) hub to index
+- HUB_INDEX_DB            (default: hub_index.sqlite) database path
+- HUB_START_BLOCK         (default: 0) first block to scan on an empty database
+- HUB_INDEX_FOLLOW        (default: 0) when "1", keep polling for new blocks
+- HUB_INDEX_POLL_SECONDS  (default: 12) poll interval in follow mode
+- HUB_CONFIRMATIONS       (default: 64) reorg window / confirmation depth in blocks
+- BODY_STORE_DIR          (optional) also write hashed-mode bodies to this blob store
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from typing import Iterable, Sequence
+
+from eth_utils import keccak, to_checksum_address
+from hexbytes import HexBytes
+
+# `ape run` does not put scripts/ on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from body_store import BlobStore, body_hash  # noqa: E402
+
+STATE_DRAFT = 0
+STATE_OPEN = 1
+STATE_ACTIVE = 2
+STATE_CLOSED = 3
+STATE_NAMES = {STATE_DRAFT: "DRAFT", STATE_OPEN: "OPEN", STATE_ACTIVE: "ACTIVE", STATE_CLOSED: "CLOSED"}
+
+PAGE_LIMIT = 100
+
+HUB_EVENTS = (
+    "ProposalCreated",
+    "StateChanged",
+    "VotingWindowUpdated",
+    "CommentAdded",
+    "CommentDeleted",
+    "LightCommentAdded",
+    "LightCommentDeleted",
+    "ProposalBody",
+)
+PROPOSAL_EVENTS = ("Voted",)
+
+DEFAULT_RANGE = 2_000
+MIN_RANGE = 1
+MAX_RANGE = 100_000
+# Pages denser than this are split next time; sparser ones let the range grow
+TARGET_LOGS_PER_PAGE = 2_000
+# Two epochs on Ethereum PoS; blocks older than this are treated as final
+DEFAULT_CONFIRMATIONS = 64
+# How providers word a rejected eth_getLogs range / result cap (lower-case)
+RANGE_ERROR_HINTS = (
+    "-32005",  # Infura / Alchemy "limit exceeded"
+    "query returned more than",
+    "response size",
+    "block range",
+    "max range",
+    "range limit",
+    "range too",
+    "range is too",
+    "is limited to",
+    "too many results",
+    "logs matched",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS proposals (
+    address        TEXT PRIMARY KEY,
+    author         TEXT NOT NULL,
+    title          TEXT NOT NULL,
+    body           TEXT NOT NULL DEFAULT '',
+    -- keccak256 commitment for hashed-mode bodies (NULL when stored on the template)
+    body_hash      TEXT,
+    created_at     INTEGER NOT NULL DEFAULT 0,
+    vote_start     INTEGER NOT NULL DEFAULT 0,
+    vote_end       INTEGER NOT NULL DEFAULT 0,
+    state          INTEGER NOT NULL,
+    -- (block, logIndex) of the event that moved the proposal into `state`;
+    -- orders the per-state lists the way the hub appends to them
+    state_seq      INTEGER NOT NULL,
+    votes_for      INTEGER NOT NULL DEFAULT 0,
+    votes_against  INTEGER NOT NULL DEFAULT 0,
+    comment_count  INTEGER NOT NULL DEFAULT 0,
+    block_number   INTEGER NOT NULL,
+    log_index      INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_proposals_state ON proposals (state, state_seq);
+CREATE INDEX IF NOT EXISTS idx_proposals_author ON proposals (author);
+CREATE INDEX IF NOT EXISTS idx_proposals_window ON proposals (vote_start, vote_end);
+-- keeper schedule: OPEN proposals by start, ACTIVE proposals by end
+CREATE INDEX IF NOT EXISTS idx_proposals_state_start ON proposals (state, vote_start);
+CREATE INDEX IF NOT EXISTS idx_proposals_state_end ON proposals (state, vote_end);
+
+CREATE TABLE IF NOT EXISTS state_changes (
+    proposal      TEXT NOT NULL,
+    old_state     INTEGER NOT NULL,
+    new_state     INTEGER NOT NULL,
+    actor         TEXT NOT NULL,
+    block_number  INTEGER NOT NULL,
+    log_index     INTEGER NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS idx_state_changes_proposal ON state_changes (proposal, block_number, log_index);
+
+CREATE TABLE IF NOT EXISTS window_updates (
+    proposal      TEXT NOT NULL,
+    vote_start    INTEGER NOT NULL,
+    vote_end      INTEGER NOT NULL,
+    actor         TEXT NOT NULL,
+    block_number  INTEGER NOT NULL,
+    log_index     INTEGER NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS idx_window_updates_proposal ON window_updates (proposal);
+
+-- Hash checkpoints for the unfinalized tail of the chain (reorg detection)
+CREATE TABLE IF NOT EXISTS blocks (
+    number  INTEGER PRIMARY KEY,
+    hash    TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS comments (
+    address        TEXT PRIMARY KEY,
+    proposal       TEXT NOT NULL,
+    author         TEXT NOT NULL,
+    content        TEXT NOT NULL DEFAULT '',
+    created_at     INTEGER NOT NULL DEFAULT 0,
+    sentiment      INTEGER NOT NULL DEFAULT 0,
+    deleted        INTEGER NOT NULL DEFAULT 0,
+    deleted_by     TEXT,
+    deleted_block  INTEGER,
+    block_number   INTEGER NOT NULL,
+    log_index      INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_comments_proposal ON comments (proposal, block_number, log_index);
+CREATE INDEX IF NOT EXISTS idx_comments_author ON comments (author);
+
+CREATE TABLE IF NOT EXISTS votes (
+    proposal      TEXT NOT NULL,
+    voter         TEXT NOT NULL,
+    support       INTEGER NOT NULL,
+    weight        INTEGER NOT NULL,
+    block_number  INTEGER NOT NULL,
+    log_index     INTEGER NOT NULL,
+    PRIMARY KEY (proposal, voter)
+);
+CREATE INDEX IF NOT EXISTS idx_votes_voter ON votes (voter);
+"""
+
+
+def light_comment_key(proposal: str, comment_id: int) -> str:
+    """Row key for event-only comments, which have no contract address."""
+    return f"{proposal}#{comment_id}"
+
+
+def is_range_error(exc: Exception) -> bool:
+    """True if a provider error means "ask for fewer blocks", not a real failure."""
+    text = str(exc).lower()
+    return "rate limit" not in text and any(hint in text for hint in RANGE_ERROR_HINTS)
+
+
+def _seq(block_number: int, log_index: int) -> int:
+    return block_number * 1_000_000 + log_index
+
+
+class HubStore:
+    """SQLite-backed read model of one GovernanceHub."""
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        # Shared with the read API's worker threads; writes stay on one thread
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        # Columns added after the first schema; CREATE TABLE IF NOT EXISTS skips them
+        columns = {r["name"] for r in self.conn.execute("PRAGMA table_info(proposals)")}
+        if "body_hash" not in columns:
+            self.conn.execute("ALTER TABLE proposals ADD COLUMN body_hash TEXT")
+
+    def close(self):
+        self.conn.close()
+
+    # --------------------------
+    # Checkpoint / metadata
+    # --------------------------
+    def get_meta(self, key: str, default: str | None = None) -> str | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    def set_meta(self, key: str, value) -> None:
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value)),
+        )
+
+    @property
+    def last_block(self) -> int | None:
+        value = self.get_meta("last_block")
+        return int(value) if value is not None else None
+
+    @property
+    def data_version(self) -> str:
+        """Changes whenever indexed data changes; rollbacks bump the generation
+        so a re-synced block number never reuses an old version."""
+        rows = dict(self.conn.execute("SELECT key, value FROM meta WHERE key IN ('last_block', 'generation')").fetchall())
+        return f"{rows.get('generation', '0')}:{rows.get('last_block', '-')}"
+
+    # --------------------------
+    # Writes (called inside the indexer's transaction)
+    # --------------------------
+    def has_proposal(self, address: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM proposals WHERE address = ?", (address,)).fetchone() is not None
+
+    def insert_proposal(self, address, author, title, fields: dict, block_number: int, log_index: int):
+        self.conn.execute(
+            """
+            INSERT OR IGNORE INTO proposals
+                (address, author, title, body, created_at, vote_start, vote_end,
+                 state, state_seq, block_number, log_index)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                address,
+                author,
+                title,
+                fields.get("body") or "",
+                int(fields.get("createdAt") or 0),
+                int(fields.get("voteStart") or 0),
+                int(fields.get("voteEnd") or 0),
+                int(fields.get("state", STATE_DRAFT)),
+                _seq(block_number, log_index),
+                block_number,
+                log_index,
+            ),
+        )
+
+    def set_body(self, proposal, body: str, body_hash: str) -> None:
+        self.conn.execute("UPDATE proposals SET body = ?, body_hash = ? WHERE address = ?", (body, body_hash, proposal))
+
+    def apply_state_change(self, proposal, old_state, new_state, actor, block_number, log_index, set_state=True):
+        """Record a StateChanged event; `set_state=False` keeps an already-current hydrated state."""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO state_changes VALUES (?, ?, ?, ?, ?, ?)",
+            (proposal, old_state, new_state, actor, block_number, log_index),
+        )
+        if set_state:
+            self.conn.execute(
+                "UPDATE proposals SET state = ?, state_seq = ? WHERE address = ?",
+                (new_state, _seq(block_number, log_index), proposal),
+            )
+        else:
+            self.conn.execute(
+                "UPDATE proposals SET state_seq = ? WHERE address = ?",
+                (_seq(block_number, log_index), proposal),
+            )
+
+    def apply_window(self, proposal, vote_start, vote_end, actor, block_number, log_index, set_window=True):
+        self.conn.execute(
+            "INSERT OR IGNORE INTO window_updates VALUES (?, ?, ?, ?, ?, ?)",
+            (proposal, vote_start, vote_end, actor, block_number, log_index),
+        )
+        if set_window:
+            self.conn.execute(
+                "UPDATE proposals SET vote_start = ?, vote_end = ? WHERE address = ?",
+                (vote_start, vote_end, proposal),
+            )
+
+    def insert_comment(self, address, proposal, author, fields: dict, block_number: int, log_index: int):
+        cur = self.conn.execute(
+            """
+            INSERT OR IGNORE INTO comments
+                (address, proposal, author, content, created_at, sentiment, block_number, log_index)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                address,
+                proposal,
+                author,
+                fields.get("content") or "",
+                int(fields.get("createdAt") or 0),
+                int(fields.get("sentiment") or 0),
+                block_number,
+                log_index,
+            ),
+        )
+        if cur.rowcount:
+            self.conn.execute("UPDATE proposals SET comment_count = comment_count + 1 WHERE address = ?", (proposal,))
+
+    def mark_comment_deleted(self, comment, by, block_number):
+        self.conn.execute(
+            "UPDATE comments SET deleted = 1, deleted_by = ?, deleted_block = ? WHERE address = ?",
+            (by, block_number, comment),
+        )
+
+    def insert_vote(self, proposal, voter, support: bool, weight: int, block_number: int, log_index: int):
+        cur = self.conn.execute(
+            "INSERT OR IGNORE INTO votes VALUES (?, ?, ?, ?, ?, ?)",
+            (proposal, voter, int(bool(support)), int(weight), block_number, log_index),
+        )
+        if cur.rowcount:
+            column = "votes_for" if support else "votes_against"
+            self.conn.execute(f"UPDATE proposals SET {column} = {column} + ? WHERE address = ?", (int(weight), proposal))
+
+    # --------------------------
+    # Reorg checkpoints / rollback
+    # --------------------------
+    def record_block(self, number: int, block_hash: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO blocks (number, hash) VALUES (?, ?)", (number, block_hash))
+
+    def prune_blocks(self, below: int) -> None:
+        self.conn.execute("DELETE FROM blocks WHERE number < ?", (below,))
+
+    def checkpoints(self) -> list[tuple[int, str]]:
+        """Stored (number, hash) pairs, newest first."""
+        return [(r["number"], r["hash"]) for r in self.conn.execute("SELECT number, hash FROM blocks ORDER BY number DESC")]
+
+    def rollback_after(self, block_number: int) -> set[str]:
+        """
+        Delete everything written from blocks > `block_number` and repair the
+        denormalized counters. Returns surviving proposals whose state or window
+        was changed by a rolled-back event (their current values must be re-read).
+        """
+        c = self.conn
+        touched = {
+            r[0]
+            for r in c.execute(
+                """
+                SELECT proposal FROM state_changes WHERE block_number > ?1
+                UNION SELECT proposal FROM window_updates WHERE block_number > ?1
+                UNION SELECT proposal FROM votes WHERE block_number > ?1
+                UNION SELECT proposal FROM comments WHERE block_number > ?1 OR deleted_block > ?1
+                """,
+                (block_number,),
+            )
+        }
+        c.execute("DELETE FROM proposals WHERE block_number > ?", (block_number,))
+        c.execute("DELETE FROM state_changes WHERE block_number > ?", (block_number,))
+        c.execute("DELETE FROM window_updates WHERE block_number > ?", (block_number,))
+        c.execute("DELETE FROM votes WHERE block_number > ?", (block_number,))
+        c.execute("DELETE FROM comments WHERE block_number > ?", (block_number,))
+        c.execute(
+            "UPDATE comments SET deleted = 0, deleted_by = NULL, deleted_block = NULL WHERE deleted_block > ?",
+            (block_number,),
+        )
+        c.execute("DELETE FROM blocks WHERE number > ?", (block_number,))
+
+        survivors = {p for p in touched if self.has_proposal(p)}
+        for p in survivors:
+            c.execute(
+                """
+                UPDATE proposals SET
+                    votes_for = (SELECT COALESCE(SUM(weight), 0) FROM votes WHERE proposal = ?1 AND support = 1),
+                    votes_against = (SELECT COALESCE(SUM(weight), 0) FROM votes WHERE proposal = ?1 AND support = 0),
+                    comment_count = (SELECT COUNT(*) FROM comments WHERE proposal = ?1),
+                    state_seq = COALESCE(
+                        (SELECT MAX(block_number * 1000000 + log_index) FROM state_changes WHERE proposal = ?1),
+                        block_number * 1000000 + log_index
+                    )
+                WHERE address = ?1
+                """,
+                (p,),
+            )
+        self.set_meta("last_block", block_number)
+        self.set_meta("generation", int(self.get_meta("generation", "0")) + 1)
+        return survivors
+
+    # --------------------------
+    # Reads
+    # --------------------------
+    def count_by_state(self) -> dict[int, int]:
+        counts = {st: 0 for st in STATE_NAMES}
+        for row in self.conn.execute("SELECT state, COUNT(*) AS n FROM proposals GROUP BY state"):
+            counts[row["state"]] = row["n"]
+        return counts
+
+    def list_proposals(self, state: int, offset: int = 0, count: int = PAGE_LIMIT, reverse: bool = False) -> list[dict]:
+        """
+        Page of `state` ordered by when each proposal entered it (count capped
+        at PAGE_LIMIT). Not interchangeable with GovernanceHub.getProposals
+        offsets: the hub's swap-and-pop removals reorder its lists, so page a
+        listing from one source only (counts from count_by_state()).
+        """
+        order = "DESC" if reverse else "ASC"
+        rows = self.conn.execute(
+            f"SELECT * FROM proposals WHERE state = ? ORDER BY state_seq {order} LIMIT ? OFFSET ?",
+            (state, max(0, min(count, PAGE_LIMIT)), max(0, offset)),
+        )
+        return [dict(r) for r in rows]
+
+    def get_proposal(self, address: str) -> dict | None:
+        row = self.conn.execute("SELECT * FROM proposals WHERE address = ?", (address,)).fetchone()
+        return dict(row) if row else None
+
+    def search_proposals(self, text: str, state: int | None = None, limit: int = PAGE_LIMIT) -> list[dict]:
+        """Case-insensitive substring search over title and body, newest first."""
+        pattern = f"%{text}%"
+        sql = "SELECT * FROM proposals WHERE (title LIKE ? OR body LIKE ?)"
+        params: list = [pattern, pattern]
+        if state is not None:
+            sql += " AND state = ?"
+            params.append(state)
+        sql += " ORDER BY block_number DESC, log_index DESC LIMIT ?"
+        params.append(limit)
+        return [dict(r) for r in self.conn.execute(sql, params)]
+
+    def due_transitions(self, now: int, limit: int = PAGE_LIMIT) -> list[str]:
+        """
+        OPEN proposals whose window has started and ACTIVE proposals whose
+        window has ended as of `now`, earliest boundary first: the proposals a
+        syncProposalStates call would move.
+        """
+        rows = self.conn.execute(
+            """
+            SELECT address, due FROM (
+                SELECT address, vote_start AS due FROM proposals
+                WHERE state = ? AND vote_start > 0 AND vote_start <= ?
+                UNION ALL
+                SELECT address, vote_end + 1 AS due FROM proposals
+                WHERE state = ? AND vote_end > 0 AND vote_end < ?
+            ) ORDER BY due, address LIMIT ?
+            """,
+            (STATE_OPEN, now, STATE_ACTIVE, now, limit),
+        )
+        return [r["address"] for r in rows]
+
+    def next_transition(self, now: int) -> int | None:
+        """Earliest timestamp after `now` at which an indexed proposal becomes due."""
+        row = self.conn.execute(
+            """
+            SELECT MIN(due) FROM (
+                SELECT MIN(vote_start) AS due FROM proposals WHERE state = ? AND vote_start > ?
+                UNION ALL
+                SELECT MIN(vote_end) + 1 AS due FROM proposals WHERE state = ? AND vote_end >= ?
+            )
+            """,
+            (STATE_OPEN, now, STATE_ACTIVE, now),
+        ).fetchone()
+        return row[0]
+
+    def list_comments(self, proposal: str, offset: int = 0, count: int = PAGE_LIMIT, reverse: bool = False) -> list[dict]:
+        """Same paging semantics as ProposalTemplate.getComments."""
+        order = "DESC" if reverse else "ASC"
+        rows = self.conn.execute(
+            f"SELECT * FROM comments WHERE proposal = ? ORDER BY block_number {order}, log_index {order} LIMIT ? OFFSET ?",
+            (proposal, max(0, min(count, PAGE_LIMIT)), max(0, offset)),
+        )
+        return [dict(r) for r in rows]
+
+    def list_votes(self, proposal: str) -> list[dict]:
+        rows = self.conn.execute(
+            "SELECT * FROM votes WHERE proposal = ? ORDER BY block_number, log_index",
+            (proposal,),
+        )
+        return [dict(r) for r in rows]
+
+    def vote_tally(self, proposal: str) -> dict | None:
+        row = self.conn.execute(
+            "SELECT votes_for, votes_against FROM proposals WHERE address = ?",
+            (proposal,),
+        ).fetchone()
+        if row is None:
+            return None
+        voters = self.conn.execute("SELECT COUNT(*) FROM votes WHERE proposal = ?", (proposal,)).fetchone()[0]
+        return {"votesFor": row["votes_for"], "votesAgainst": row["votes_against"], "voters": voters}
+
+
+class ReorgTooDeep(RuntimeError):
+    """The chain diverged below every stored block hash checkpoint."""
+
+
+class HubIndexer:
+    """Incrementally sync a GovernanceHub's events into a HubStore."""
+
+    def __init__(
+        self,
+        hub_address: str,
+        store: HubStore,
+        reader=None,
+        start_block: int = 0,
+        range_size: int = DEFAULT_RANGE,
+        max_range: int = MAX_RANGE,
+        target_logs: int = TARGET_LOGS_PER_PAGE,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+        blob_store=None,
+    ):
+        from ape import chain, project
+
+        self.hub_address = to_checksum_address(hub_address)
+        self.store = store
+        self.chain = chain
+        self.provider = chain.provider
+        self.ecosystem = self.provider.network.ecosystem
+        self.start_block = start_block
+        self.range_size = max(MIN_RANGE, range_size)
+        self.max_range = max_range
+        self.target_logs = target_logs
+        self.confirmations = max(0, confirmations)
+        # Optional body_store.BlobStore that receives hashed-mode bodies
+        self.blob_store = blob_store
+
+        if reader is None:
+            from multicall_reader import MulticallReader, get_multicall
+
+            reader = MulticallReader(get_multicall())
+        self.reader = reader
+
+        hub_events = project.GovernanceHub.contract_type.events
+        proposal_events = project.ProposalTemplate.contract_type.events
+        self.event_abis = [hub_events[name] for name in HUB_EVENTS] + [proposal_events[name] for name in PROPOSAL_EVENTS]
+        topics = ["0x" + keccak(text=abi.selector).hex() for abi in self.event_abis]
+        self.hub_topics = topics[: len(HUB_EVENTS)]
+        self.proposal_topics = topics[len(HUB_EVENTS):]
+        self.created_topic = self.hub_topics[HUB_EVENTS.index("ProposalCreated")]
+
+        known_hub = store.get_meta("hub_address")
+        if known_hub and known_hub != self.hub_address:
+            raise ValueError(f"Database indexes hub {known_hub}, not {self.hub_address}")
+
+    # --------------------------
+    # Log fetching
+    # --------------------------
+    def _get_logs(self, from_block: int, to_block: int) -> list:
+        get_logs = self.provider.web3.eth.get_logs
+        span = {"fromBlock": from_block, "toBlock": to_block}
+        logs = list(get_logs({**span, "address": self.hub_address, "topics": [self.hub_topics]}))
+        # Votes are emitted by the proposal clones. Filtering them by address
+        # would mean one request per batch of every proposal ever created, so
+        # fetch the topic once and keep logs from known proposals (including
+        # ones created in this page).
+        created = {
+            to_checksum_address(HexBytes(log["topics"][1])[-20:])
+            for log in logs
+            if HexBytes(log["topics"][0]).to_0x_hex() == self.created_topic
+        }
+        for log in get_logs({**span, "topics": [self.proposal_topics]}):
+            address = to_checksum_address(log["address"])
+            if address in created or self.store.has_proposal(address):
+                logs.append(log)
+        return logs
+
+    def _fetch_range(self, start: int, head: int) -> tuple[int, list]:
+        """
+        Fetch logs from `start` with the current adaptive range. Returns the last
+        block covered and the raw logs.
+        """
+        while True:
+            end = min(start + self.range_size - 1, head)
+            try:
+                logs = self._get_logs(start, end)
+            except Exception as e:  # noqa: BLE001 - web3 / provider error classes vary; matched by message
+                if end == start or not is_range_error(e):
+                    raise
+                self.range_size = max(MIN_RANGE, (end - start + 1) // 2)
+                continue
+            if len(logs) > self.target_logs and end > start:
+                # Keep this page, but split the next one
+                self.range_size = max(MIN_RANGE, (end - start + 1) // 2)
+            elif len(logs) < self.target_logs // 4:
+                self.range_size = min(self.max_range, self.range_size * 2)
+            return end, logs
+
+    # --------------------------
+    # Applying events
+    # --------------------------
+    def _hydrate(self, decoded: Sequence) -> tuple[dict, dict]:
+        new_proposals = [str(log.proposal) for log in decoded if log.event_name == "ProposalCreated"]
+        new_comments = [str(log.comment) for log in decoded if log.event_name == "CommentAdded"]
+        proposal_fields = {}
+        if new_proposals:
+            from ape import project
+            from multicall_reader import view_call
+
+            rows = self.reader.read_proposals(new_proposals, ("body", "createdAt", "voteStart", "voteEnd"))
+            states = self.reader.read(
+                view_call(project.GovernanceHub, self.hub_address, "getProposalState", p) for p in new_proposals
+            )
+            for row, st in zip(rows, states):
+                row["state"] = STATE_DRAFT if st is None else int(st)
+                proposal_fields[row["address"]] = row
+        comment_fields = {}
+        if new_comments:
+            for row in self.reader.read_comments(new_comments, ("content", "createdAt", "sentiment")):
+                comment_fields[row["address"]] = row
+        return proposal_fields, comment_fields
+
+    def _apply(self, decoded: Sequence) -> int:
+        proposal_fields, comment_fields = self._hydrate(decoded)
+        # Hydrated state is the state at sync time; replaying later StateChanged
+        # events of the same page would only move it backwards.
+        created_here = set(proposal_fields)
+        applied = 0
+        for log in decoded:
+            name = log.event_name
+            block_number, log_index = int(log.block_number), int(log.log_index)
+            source = to_checksum_address(str(log.contract_address))
+
+            if name == "Voted":
+                proposal = source
+                if not self.store.has_proposal(proposal):
+                    continue
+                self.store.insert_vote(proposal, str(log.voter), log.support, int(log.weight), block_number, log_index)
+            elif source != self.hub_address:
+                continue
+            elif name == "ProposalCreated":
+                p = str(log.proposal)
+                self.store.insert_proposal(p, str(log.author), log.title, proposal_fields.get(p, {}), block_number, log_index)
+            elif name == "StateChanged":
+                p = str(log.proposal)
+                self.store.apply_state_change(
+                    p,
+                    int(log.oldState),
+                    int(log.newState),
+                    str(log.by),
+                    block_number,
+                    log_index,
+                    set_state=p not in created_here,
+                )
+            elif name == "VotingWindowUpdated":
+                p = str(log.proposal)
+                self.store.apply_window(
+                    p,
+                    int(log.voteStart),
+                    int(log.voteEnd),
+                    str(log.by),
+                    block_number,
+                    log_index,
+                    set_window=p not in created_here,
+                )
+            elif name == "CommentAdded":
+                c = str(log.comment)
+                self.store.insert_comment(c, str(log.proposal), str(log.author), comment_fields.get(c, {}), block_number, log_index)
+            elif name == "CommentDeleted":
+                self.store.mark_comment_deleted(str(log.comment), str(log.byAdmin), block_number)
+            elif name == "ProposalBody":
+                h = HexBytes(log.bodyHash).to_0x_hex()
+                if body_hash(log.body) != h:
+                    continue
+                self.store.set_body(str(log.proposal), log.body, h)
+                if self.blob_store is not None:
+                    self.blob_store.put(log.body)
+            elif name == "LightCommentAdded":
+                p = str(log.proposal)
+                fields = {"content": log.content, "createdAt": int(log.createdAt), "sentiment": int(log.sentiment)}
+                self.store.insert_comment(light_comment_key(p, int(log.commentId)), p, str(log.author), fields, block_number, log_index)
+            elif name == "LightCommentDeleted":
+                key = light_comment_key(str(log.proposal), int(log.commentId))
+                self.store.mark_comment_deleted(key, str(log.byAdmin), block_number)
+            else:
+                continue
+            applied += 1
+        return applied
+
+    def _decode(self, raw_logs: Iterable) -> list:
+        decoded = list(self.ecosystem.decode_logs(list(raw_logs), *self.event_abis))
+        decoded.sort(key=lambda log: (int(log.block_number), int(log.log_index)))
+        return decoded
+
+    # --------------------------
+    # Reorg handling
+    # --------------------------
+    def _block_hash(self, number: int, head: int) -> str | None:
+        if number > head:
+            return None
+        return HexBytes(self.provider.get_block(number).hash).hex()
+
+    def _record_hashes(self, start: int, end: int, head: int, decoded: Sequence) -> None:
+        # Only the unfinalized tail needs checkpoints; log entries carry their
+        # block hash already, so most blocks with activity cost no extra call.
+        floor = max(start, head - self.confirmations)
+        from_logs = {int(log.block_number): HexBytes(log.block_hash).hex() for log in decoded}
+        for number in range(floor, end + 1):
+            self.store.record_block(number, from_logs.get(number) or self._block_hash(number, head))
+        self.store.prune_blocks(head - self.confirmations)
+
+    def _rehydrate(self, proposals: set[str]) -> None:
+        from ape import project
+        from multicall_reader import view_call
+
+        targets = sorted(proposals)
+        rows = self.reader.read_proposals(targets, ("voteStart", "voteEnd"))
+        states = self.reader.read(
+            view_call(project.GovernanceHub, self.hub_address, "getProposalState", p) for p in targets
+        )
+        for row, st in zip(rows, states):
+            self.store.conn.execute(
+                "UPDATE proposals SET vote_start = ?, vote_end = ?, state = COALESCE(?, state) WHERE address = ?",
+                (int(row["voteStart"] or 0), int(row["voteEnd"] or 0), None if st is None else int(st), row["address"]),
+            )
+
+    def check_reorg(self, head: int | None = None) -> int | None:
+        """
+        Compare stored checkpoints with the canonical chain. On divergence, roll
+        back to the newest common block and return it; otherwise return None.
+        """
+        head = self.chain.blocks.height if head is None else head
+        checkpoints = self.store.checkpoints()
+        if not checkpoints:
+            return None
+        ancestor = None
+        for number, stored_hash in checkpoints:
+            if self._block_hash(number, head) == stored_hash:
+                ancestor = number
+                break
+        if ancestor is None:
+            raise ReorgTooDeep(
+                f"Chain diverged below block {checkpoints[-1][0]} (confirmation window {self.confirmations}); "
+                "re-index from an earlier block."
+            )
+        if ancestor == checkpoints[0][0]:
+            return None
+        with self.store.conn:
+            touched = self.store.rollback_after(ancestor)
+            if touched:
+                self._rehydrate(touched)
+        return ancestor
+
+    def sync(self, to_block: int | None = None) -> int:
+        """Index up to `to_block` (default: chain head). Returns events applied."""
+        head = self.chain.blocks.height if to_block is None else to_block
+        self.check_reorg(head)
+        last = self.store.last_block
+        start = self.start_block if last is None else last + 1
+        applied = 0
+        while start <= head:
+            end, raw = self._fetch_range(start, head)
+            decoded = self._decode(raw)
+            with self.store.conn:
+                applied += self._apply(decoded)
+                self._record_hashes(start, end, head, decoded)
+                self.store.set_meta("hub_address", self.hub_address)
+                self.store.set_meta("last_block", end)
+            start = end + 1
+        return applied
+
+
+def main():
+    hub_address = os.environ.get("GOVERNANCE_HUB", "").strip()
+    if not hub_address:
+        raise SystemExit("Set GOVERNANCE_HUB.")
+    db_path = os.environ.get("HUB_INDEX_DB", "").strip() or "hub_index.sqlite"
+    start_block = int(os.environ.get("HUB_START_BLOCK") or 0)
+    follow = os.environ.get("HUB_INDEX_FOLLOW", "").strip() == "1"
+    poll = float(os.environ.get("HUB_INDEX_POLL_SECONDS") or 12)
+    confirmations = int(os.environ.get("HUB_CONFIRMATIONS") or DEFAULT_CONFIRMATIONS)
+    body_dir = os.environ.get("BODY_STORE_DIR", "").strip()
+
+    blob_store = BlobStore(body_dir) if body_dir else None
+    store = HubStore(db_path)
+    indexer = HubIndexer(hub_address, store, start_block=start_block, confirmations=confirmations, blob_store=blob_store)
+    try:
+        while True:
+            applied = indexer.sync()
+            counts = store.count_by_state()
+            summary = ", ".join(f"{STATE_NAMES[st]}={n}" for st, n in counts.items())
+            print(f"[sync] block={store.last_block} applied={applied} {summary}", flush=True)
+            if not follow:
+                break
+            time.sleep(poll)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
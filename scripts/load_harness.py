@@ -0,0 +1,219 @@
+"""
+Scale harness: fill a GovernanceHub far past its old hard caps on the local test chain.
+
+GovernanceHub used to keep each state in a `DynArray[address, 10000]` and every
+ProposalTemplate its comments in a `DynArray[address, 1000]`; both are now
+mapping-backed lists with no cap. This harness fills one state list and one
+proposal's comment list to (by default) those old limits. Transactions are
+sent one at a time, rotating round-robin over all configured test accounts
+(15 in ape-config.yaml), so the lists hold entries from many authors; the
+local test chain mines each one before the next is sent. At each checkpoint
+depth it records:
+
+- getProposals / getComments: wall-clock latency of the first page, the
+  deepest forward page and the first reverse page, the time to walk every
+  page, and the eth_estimateGas cost of the deepest page
+- state moves through _removeFromState's swap-and-pop: adminMoveState gas
+  when the moved proposal is at the head of the list (swap with last) and
+  when it is the tail (plain pop)
+
+Once a list reaches the old cap, one more append is attempted and
+`ceiling_reverts` records whether it was rejected (it must not be any more).
+The report is printed and written as JSON. Timings depend on the machine, so
+the report is gitignored rather than kept next to the gas baseline.
+
+Usage
+-----
+    ape run load_harness --network ethereum:local:test
+    LOAD_PROPOSALS=2000 LOAD_COMMENTS=200 ape run load_harness --network ethereum:local:test
+
+Environment
+-----------
+- LOAD_PROPOSALS     (default: 10001) proposals to create (all DRAFT, one list)
+- LOAD_COMMENTS      (default: 1001) comments to add to a single proposal
+- LOAD_CHECKPOINTS   (default: 100,1000,5000,10000) depths to measure at; the
+                     final fill size is always measured
+- LOAD_REPORT        (default: benchmarks/load_report.json) JSON output path
+"""
+
+import json
+import os
+import sys
+import time
+from itertools import cycle
+
+# `ape run` does not put scripts/ on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from gas_benchmark import FAR_FUTURE  # noqa: E402
+from local_hub import deploy_hub  # noqa: E402
+
+PAGE_LIMIT = 100
+# Former GovernanceHub.MAX_PROPOSALS / ProposalTemplate.MAX_COMMENTS
+MAX_PROPOSALS = 10000
+MAX_COMMENTS = 1000
+STATE_DRAFT = 0
+STATE_OPEN = 1
+DEFAULT_CHECKPOINTS = (100, 1000, 5000, 10000)
+DEFAULT_REPORT = os.path.join("benchmarks", "load_report.json")
+
+
+def _checkpoints(target: int, requested) -> list[int]:
+    return sorted({d for d in requested if 0 < d <= target} | {target}) if target > 0 else []
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+def _pagination(view, depth: int, args_for) -> dict:
+    """Latency/gas of reading a list of `depth` entries through a paged view."""
+    deepest = max(0, depth - PAGE_LIMIT)
+    first, first_ms = _timed(view, *args_for(0, False))
+    _, deep_ms = _timed(view, *args_for(deepest, False))
+    _, rev_ms = _timed(view, *args_for(0, True))
+    walk_start = time.perf_counter()
+    seen = 0
+    for offset in range(0, depth, PAGE_LIMIT):
+        seen += len(view(*args_for(offset, False)))
+    walk_ms = (time.perf_counter() - walk_start) * 1000.0
+    assert seen == depth, f"paged {seen} of {depth} entries"
+    return {
+        "depth": depth,
+        "first_page_ms": round(first_ms, 2),
+        "deepest_page_ms": round(deep_ms, 2),
+        "reverse_page_ms": round(rev_ms, 2),
+        "full_walk_ms": round(walk_ms, 2),
+        "full_walk_pages": -(-depth // PAGE_LIMIT),
+        "deepest_page_gas": view.estimate_gas_cost(*args_for(deepest, False)),
+        "first_page_len": len(first),
+    }
+
+
+def _state_moves(hub, bobu, depth: int) -> dict:
+    """Gas of moving the head (swap-and-pop) and the tail (pop) out of DRAFT."""
+    head = hub.getProposals(STATE_DRAFT, 0, 1, False)[0]
+    head_gas = hub.adminMoveState(head, STATE_OPEN, sender=bobu).gas_used
+    hub.adminMoveState(head, STATE_DRAFT, sender=bobu)
+    # The head went back on the end of the list, so it is now the tail
+    tail_gas = hub.adminMoveState(head, STATE_OPEN, sender=bobu).gas_used
+    hub.adminMoveState(head, STATE_DRAFT, sender=bobu)
+    return {"depth": depth, "move_head_gas": head_gas, "move_tail_gas": tail_gas}
+
+
+def _ceiling_reverts(send) -> bool:
+    from ape.exceptions import ContractLogicError
+
+    try:
+        send()
+    except ContractLogicError:
+        return True
+    return False
+
+
+def fill_proposals(hub, bobu, senders, target: int, checkpoints, check_cap: bool = True) -> dict:
+    rotation = cycle(senders)
+    pages, moves = [], []
+    created = hub.getProposalCountByState(STATE_DRAFT)
+    fill_start = time.perf_counter()
+    for depth in checkpoints:
+        while created < depth:
+            hub.createProposal(f"Load {created}", "Body", 0, 0, sender=next(rotation))
+            created += 1
+        pages.append(_pagination(hub.getProposals, depth, lambda off, rev: (STATE_DRAFT, off, PAGE_LIMIT, rev)))
+        moves.append(_state_moves(hub, bobu, depth))
+    report = {
+        "target": target,
+        "fill_seconds": round(time.perf_counter() - fill_start, 1),
+        "senders": len(senders),
+        "pagination": pages,
+        "state_moves": moves,
+    }
+    if check_cap:
+        report["ceiling_reverts"] = _ceiling_reverts(lambda: hub.createProposal("Over", "Body", 0, 0, sender=next(rotation)))
+    return report
+
+
+def fill_comments(hub, proposal, senders, target: int, checkpoints, check_cap: bool = True) -> dict:
+    from ape import project
+
+    template = project.ProposalTemplate.at(proposal)
+    rotation = cycle(senders)
+    pages = []
+    added = 0
+    fill_start = time.perf_counter()
+    for depth in checkpoints:
+        while added < depth:
+            hub.addComment(proposal, f"Comment {added}", 1, sender=next(rotation))
+            added += 1
+        pages.append(_pagination(template.getComments, depth, lambda off, rev: (off, PAGE_LIMIT, rev)))
+    report = {
+        "target": target,
+        "fill_seconds": round(time.perf_counter() - fill_start, 1),
+        "senders": len(senders),
+        "pagination": pages,
+    }
+    if check_cap:
+        report["ceiling_reverts"] = _ceiling_reverts(lambda: hub.addComment(proposal, "Over", 1, sender=next(rotation)))
+    return report
+
+
+def run(accounts, proposals: int, comments: int, checkpoints=DEFAULT_CHECKPOINTS) -> dict:
+    """Deploy a fresh hub and fill it. The ceiling is only probed when a fill reaches its cap."""
+    hub, bobu = deploy_hub(accounts)
+    senders = list(accounts)
+    report = {"hub": hub.address}
+    # The comment target lives in OPEN, outside the DRAFT list being measured
+    hub.createProposal("Comment load", "Body", FAR_FUTURE, FAR_FUTURE + 1, sender=senders[0])
+    target = hub.getProposals(STATE_OPEN, 0, 1, False)[0]
+    report["proposals"] = fill_proposals(
+        hub, bobu, senders, proposals, _checkpoints(proposals, checkpoints), proposals >= MAX_PROPOSALS
+    )
+    if comments > 0:
+        report["comments"] = fill_comments(
+            hub, target, senders, comments, _checkpoints(comments, checkpoints), comments >= MAX_COMMENTS
+        )
+    return report
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    for section in ("proposals", "comments"):
+        if section not in report:
+            continue
+        data = report[section]
+        lines.append(f"{section}: {data['target']} via {data['senders']} senders in {data['fill_seconds']}s")
+        lines.append(f"  {'depth':>6} {'first ms':>9} {'deep ms':>9} {'rev ms':>9} {'walk ms':>10} {'deep gas':>10}")
+        for p in data["pagination"]:
+            lines.append(
+                f"  {p['depth']:>6} {p['first_page_ms']:>9} {p['deepest_page_ms']:>9} {p['reverse_page_ms']:>9}"
+                f" {p['full_walk_ms']:>10} {p['deepest_page_gas']:>10}"
+            )
+        for m in data.get("state_moves", []):
+            lines.append(f"  move @{m['depth']:>6}: head {m['move_head_gas']} gas, tail {m['move_tail_gas']} gas")
+        if "ceiling_reverts" in data:
+            lines.append(f"  append past cap reverts: {data['ceiling_reverts']}")
+    return "\n".join(lines)
+
+
+def main():
+    from ape import accounts
+
+    proposals = int(os.environ.get("LOAD_PROPOSALS") or MAX_PROPOSALS + 1)
+    comments = int(os.environ.get("LOAD_COMMENTS") or MAX_COMMENTS + 1)
+    raw = os.environ.get("LOAD_CHECKPOINTS", "").strip()
+    checkpoints = [int(s) for s in raw.split(",") if s.strip()] if raw else DEFAULT_CHECKPOINTS
+    path = os.environ.get("LOAD_REPORT", "").strip() or DEFAULT_REPORT
+
+    report = run(accounts.test_accounts, proposals, comments, checkpoints)
+    print(format_report(report))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print(f"\nReport written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Deploy a GovernanceHub with fresh templates using the standard test-account
+roles: accounts[0] deploys, accounts[1] is the bobu multisig and
+accounts[2:5] are the elected admins.
+
+Shared by the test fixtures (tests/conftest.py), the gas benchmark and the
+load harness so they all measure the same deployment.
+"""
+
+
+def deploy_hub(accounts):
+    """Deploy a hub and its templates; returns (hub, bobu)."""
+    from ape import project
+
+    deployer, bobu = accounts[0], accounts[1]
+    hub = deployer.deploy(
+        project.GovernanceHub,
+        bobu.address,
+        deployer.deploy(project.ProposalTemplate).address,
+        deployer.deploy(project.CommentTemplate).address,
+        accounts[2].address,
+        accounts[3].address,
+        accounts[4].address,
+    )
+    return hub, bobu
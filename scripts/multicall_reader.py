@@ -0,0 +1,214 @@
+"""
+Batch GovernanceHub / ProposalTemplate / CommentTemplate view calls through
+Multicall3 `aggregate3`.
+
+Reading clone fields one `eth_call` at a time does not scale to thousands of
+proposals and comments. `MulticallReader` encodes arbitrary view calls with the
+project ABIs, packs them into `aggregate3` chunks, dispatches chunks
+concurrently and decodes the results back into Python values.
+
+Multicall3 resolution
+---------------------
+- MULTICALL3_ADDRESS env var, if set
+- the canonical deployment (0xcA11bde05977b3631167028862bE2a173976CA11) when it
+  has code on the connected chain
+- otherwise (local networks, e.g. `ethereum:local:test`) `contracts/Multicall3.vy`
+  is deployed once per chain and reused
+
+Usage
+-----
+    GOVERNANCE_HUB=0x... ape run multicall_reader --network ethereum:sepolia:alchemy
+
+Environment
+-----------
+- GOVERNANCE_HUB          (required for `main`) hub to hydrate
+- MULTICALL3_ADDRESS      (optional) explicit Multicall3 address
+- MULTICALL_CHUNK_SIZE    (default: 100) calls per aggregate3 request
+- MULTICALL_WORKERS       (default: 4) concurrent aggregate3 requests
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import os
+from typing import Any, Iterable, Sequence
+
+from hexbytes import HexBytes
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_WORKERS = 4
+# Bound of the Vyper port's `calls` DynArray (contracts/Multicall3.vy)
+LOCAL_MAX_CALLS = 100
+
+PROPOSAL_FIELDS = ("title", "author", "body", "createdAt", "voteStart", "voteEnd", "votesFor", "votesAgainst")
+COMMENT_FIELDS = ("proposal", "author", "content", "createdAt", "deleted", "sentiment")
+
+# chain_id -> locally deployed Multicall3 address
+_local_deployments: dict[int, str] = {}
+
+
+@dataclass(frozen=True)
+class ViewCall:
+    target: str
+    abi: Any  # ethpm_types MethodABI
+    args: tuple = ()
+    allow_failure: bool = True
+
+
+def _contract_type(source):
+    # Accept a ContractContainer (project.X), a ContractInstance or a ContractType
+    return getattr(source, "contract_type", source)
+
+
+def _method_abi(source, method: str, arg_count: int):
+    for abi in _contract_type(source).view_methods:
+        if abi.name == method and len(abi.inputs) == arg_count:
+            return abi
+    raise ValueError(f"No view method {method!r} taking {arg_count} args")
+
+
+def view_call(source, target: str, method: str, *args, allow_failure: bool = True) -> ViewCall:
+    """Describe `source.method(*args)` evaluated against the contract at `target`."""
+    return ViewCall(str(target), _method_abi(source, method, len(args)), tuple(args), allow_failure)
+
+
+def get_multicall(deployer=None):
+    """Return a Multicall3 instance for the connected chain, deploying one if needed."""
+    from ape import accounts, chain, project
+
+    override = os.environ.get("MULTICALL3_ADDRESS", "").strip()
+    if override:
+        return project.Multicall3.at(override)
+
+    provider = chain.provider
+    if provider.get_code(MULTICALL3_ADDRESS):
+        return project.Multicall3.at(MULTICALL3_ADDRESS)
+
+    # Compare runtime code, not just presence: after a local snapshot revert the
+    # cached address can be reused by an unrelated deployment.
+    cached = _local_deployments.get(chain.chain_id)
+    expected = project.Multicall3.contract_type.get_runtime_bytecode()
+    if cached and HexBytes(provider.get_code(cached)) == HexBytes(expected):
+        return project.Multicall3.at(cached)
+
+    if deployer is None:
+        if provider.network.name != "local":
+            raise RuntimeError(
+                f"No Multicall3 on {provider.network.name}; set MULTICALL3_ADDRESS or pass a deployer."
+            )
+        deployer = accounts.test_accounts[0]
+    multicall = deployer.deploy(project.Multicall3)
+    _local_deployments[chain.chain_id] = multicall.address
+    return multicall
+
+
+class MulticallReader:
+    """
+    Batch view calls into `aggregate3` requests.
+
+    Failed calls (allow_failure=True) decode to None instead of raising.
+    """
+
+    def __init__(self, multicall, chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: int = DEFAULT_WORKERS):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if multicall.address != MULTICALL3_ADDRESS:
+            chunk_size = min(chunk_size, LOCAL_MAX_CALLS)
+        self.multicall = multicall
+        self.chunk_size = chunk_size
+        self.max_workers = max(1, max_workers)
+        self._ecosystem = multicall.provider.network.ecosystem
+
+    def _encode(self, call: ViewCall) -> tuple:
+        selector = self._ecosystem.get_method_selector(call.abi)
+        data = bytes(selector) + bytes(self._ecosystem.encode_calldata(call.abi, *call.args))
+        return (call.target, call.allow_failure, data)
+
+    def _decode(self, call: ViewCall, success: bool, data: bytes):
+        # Empty returndata for a method with outputs means the target has no code
+        if not success or (call.abi.outputs and not data):
+            return None
+        try:
+            values = self._ecosystem.decode_returndata(call.abi, bytes(data))
+        except Exception:  # noqa: BLE001 - undecodable output counts as a failed call
+            return None
+        return values[0] if len(values) == 1 else values
+
+    def _dispatch(self, chunk: Sequence[ViewCall]) -> list:
+        results = self.multicall.aggregate3([self._encode(c) for c in chunk])
+        return [self._decode(c, r.success, r.returnData) for c, r in zip(chunk, results)]
+
+    def read(self, calls: Iterable[ViewCall]) -> list:
+        """Evaluate `calls` and return decoded values in the same order."""
+        calls = list(calls)
+        chunks = [calls[i : i + self.chunk_size] for i in range(0, len(calls), self.chunk_size)]
+        if len(chunks) <= 1 or self.max_workers == 1:
+            pages = [self._dispatch(c) for c in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                pages = list(pool.map(self._dispatch, chunks))
+        return [value for page in pages for value in page]
+
+    def read_fields(self, source, targets: Sequence[str], fields: Sequence[str]) -> list[dict]:
+        """Read the no-arg getters `fields` from every clone in `targets`."""
+        calls = [view_call(source, t, f) for t in targets for f in fields]
+        values = self.read(calls)
+        width = len(fields)
+        return [
+            {"address": str(t), **dict(zip(fields, values[i * width : (i + 1) * width]))}
+            for i, t in enumerate(targets)
+        ]
+
+    def read_proposals(self, targets: Sequence[str], fields: Sequence[str] = PROPOSAL_FIELDS) -> list[dict]:
+        from ape import project
+
+        return self.read_fields(project.ProposalTemplate, targets, fields)
+
+    def read_comments(self, targets: Sequence[str], fields: Sequence[str] = COMMENT_FIELDS) -> list[dict]:
+        from ape import project
+
+        return self.read_fields(project.CommentTemplate, targets, fields)
+
+
+def list_hub_proposals(reader: MulticallReader, hub, page_size: int = 100) -> dict[int, list[str]]:
+    """Every proposal address per state, using batched getProposals pages."""
+    from ape import project
+
+    hub_type = project.GovernanceHub
+    counts = reader.read(view_call(hub_type, hub.address, "getProposalCountByState", st) for st in range(4))
+    pages = [
+        (st, off)
+        for st, count in enumerate(counts)
+        for off in range(0, int(count or 0), page_size)
+    ]
+    results = reader.read(
+        view_call(hub_type, hub.address, "getProposals", st, off, page_size, False) for st, off in pages
+    )
+    by_state: dict[int, list[str]] = {st: [] for st in range(4)}
+    for (st, _), addrs in zip(pages, results):
+        by_state[st].extend(str(a) for a in (addrs or []))
+    return by_state
+
+
+def main():
+    from ape import project
+
+    hub_address = os.environ.get("GOVERNANCE_HUB", "").strip()
+    if not hub_address:
+        raise SystemExit("Set GOVERNANCE_HUB.")
+    chunk_size = int(os.environ.get("MULTICALL_CHUNK_SIZE") or DEFAULT_CHUNK_SIZE)
+    workers = int(os.environ.get("MULTICALL_WORKERS") or DEFAULT_WORKERS)
+
+    reader = MulticallReader(get_multicall(), chunk_size=chunk_size, max_workers=workers)
+    hub = project.GovernanceHub.at(hub_address)
+    by_state = list_hub_proposals(reader, hub)
+    addresses = [a for st in range(4) for a in by_state[st]]
+    proposals = reader.read_proposals(addresses, ("title", "author", "votesFor", "votesAgainst"))
+    print(f"=== {len(proposals)} proposals via Multicall3 at {reader.multicall.address} ===")
+    for p in proposals:
+        print(f"{p['address']}  for={p['votesFor']}  against={p['votesAgainst']}  {p['title']}")
+
+
+if __name__ == "__main__":
+    main()
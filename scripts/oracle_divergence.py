@@ -0,0 +1,223 @@
+"""
+Rolling divergence statistics and threshold alerts over the anime_oracles
+row stream (poll ticks or Hermes stream updates alike).
+
+DivergenceMonitor is an on_row sink, like oracle_store.StoreSink. For every
+symbol it tracks:
+
+- each configured pair of price columns (by default Pyth stable vs CMC,
+  Pyth stable vs Pyth EMA, Pyth EMA vs CMC) as a divergence in basis
+  points, (a - b) / b * 10_000;
+- "staleness": row timestamp minus the newest Pyth publish_time seen, so a
+  feed that stops publishing (or a source that keeps failing) shows up.
+
+Each series lives in a RollingWindow: a ring of fixed-width time buckets
+holding count / sum / sum of squares / max |value|, with running totals
+over the ring. Adding a sample is O(1) (amortised over expired buckets),
+mean and stddev are O(1) reads, max scans the ring's buckets, and memory
+per series is fixed however fast rows arrive or however many feeds are
+tracked.
+
+Alerts are raised when a threshold is crossed and cleared when the value
+comes back, not repeated on every row. They go to any callable sink:
+print_alert (stderr) by default, JsonlAlertSink to append them to a file,
+or fan several together.
+"""
+
+import json
+import math
+import sys
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Optional
+
+PAIRS = (
+    ("Pyth_Stable", "CMC_price_USD"),
+    ("Pyth_Stable", "Pyth_EMA"),
+    ("Pyth_EMA", "CMC_price_USD"),
+)
+STALENESS = "staleness"
+
+
+def pair_name(a: str, b: str) -> str:
+    return f"{a}/{b}"
+
+
+def divergence_bps(a, b) -> Optional[float]:
+    if a is None or b is None or b == 0:
+        return None
+    return (a - b) / b * 10_000
+
+
+class RollingWindow:
+    """Stats over the last `seconds` of samples, kept in `buckets` time buckets (fixed memory)."""
+
+    def __init__(self, seconds: float, buckets: int = 60):
+        self.seconds = seconds
+        self.width = seconds / buckets
+        self.buckets = buckets
+        # slot -> [count, sum, sum of squares, max |value|] for a live bucket, else None
+        self._ring = [None] * buckets
+        self._head = None  # newest bucket index seen
+        self.count = 0
+        self.sum = 0.0
+        self.sumsq = 0.0
+        self.last = None
+
+    def _advance(self, ts: float) -> int:
+        idx = int(ts // self.width)
+        if self._head is None or idx > self._head:
+            # Expire every slot the window slid past (at most one full lap)
+            start = idx - self.buckets + 1 if self._head is None else max(self._head + 1, idx - self.buckets + 1)
+            for i in range(start, idx + 1):
+                self._drop(i % self.buckets)
+            self._head = idx
+        return max(idx, self._head - self.buckets + 1)  # late samples land in the oldest live bucket
+
+    def _drop(self, slot: int):
+        old = self._ring[slot]
+        if old is not None:
+            self.count -= old[0]
+            self.sum -= old[1]
+            self.sumsq -= old[2]
+            self._ring[slot] = None
+
+    def add(self, ts: float, value: float):
+        idx = self._advance(ts)
+        slot = idx % self.buckets
+        b = self._ring[slot]
+        if b is None:
+            b = self._ring[slot] = [0, 0.0, 0.0, 0.0]
+        b[0] += 1
+        b[1] += value
+        b[2] += value * value
+        b[3] = max(b[3], abs(value))
+        self.count += 1
+        self.sum += value
+        self.sumsq += value * value
+        self.last = value
+
+    def expire(self, ts: float):
+        """Slide the window to `ts` without adding a sample."""
+        self._advance(ts)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    @property
+    def stddev(self) -> Optional[float]:
+        if self.count < 2:
+            return None
+        var = (self.sumsq - self.sum * self.sum / self.count) / (self.count - 1)
+        return math.sqrt(max(var, 0.0))
+
+    @property
+    def max_abs(self) -> Optional[float]:
+        live = [b[3] for b in self._ring if b is not None]
+        return max(live) if live else None
+
+    def snapshot(self) -> dict:
+        return {"count": self.count, "mean": self.mean, "stddev": self.stddev, "max_abs": self.max_abs, "last": self.last}
+
+
+@dataclass(frozen=True)
+class Thresholds:
+    max_divergence_bps: Optional[float] = 200.0  # |latest divergence| of any pair
+    max_zscore: Optional[float] = None  # latest divergence vs the window's mean / stddev
+    max_staleness: Optional[float] = 120.0  # seconds since the newest Pyth publish_time
+    min_samples: int = 30  # z-score needs this many samples in the window
+
+
+@dataclass(frozen=True)
+class Alert:
+    ts: float
+    symbol: str
+    metric: str  # a pair name ("Pyth_Stable/CMC_price_USD") or "staleness"
+    kind: str  # "divergence" | "zscore" | "staleness"
+    value: float
+    threshold: float
+    active: bool  # True when raised, False when cleared
+
+    def message(self) -> str:
+        state = "ALERT" if self.active else "clear"
+        return f"{state} {self.symbol} {self.metric} {self.kind}={self.value:.2f} (threshold {self.threshold:g})"
+
+
+def print_alert(alert: Alert):
+    print(f"[oracles] {alert.message()}", file=sys.stderr, flush=True)
+
+
+class JsonlAlertSink:
+    """Appends each alert as one JSON line to `path`."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, alert: Alert):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(alert)) + "\n")
+
+
+class DivergenceMonitor:
+    """anime_oracles on_row sink keeping rolling divergence / staleness stats per symbol and raising alerts."""
+
+    def __init__(self, window: float = 3600.0, thresholds: Thresholds = Thresholds(),
+                 sink: Callable[[Alert], None] = print_alert, pairs: Iterable[tuple] = PAIRS, buckets: int = 60):
+        self.window = window
+        self.thresholds = thresholds
+        self.sink = sink
+        self.pairs = tuple(pairs)
+        self.buckets = buckets
+        self._series = {}  # (symbol, metric) -> RollingWindow
+        self._published = {}  # symbol -> newest Pyth publish_time
+        self._active = set()  # (symbol, metric, kind) currently alerting
+
+    def _window(self, symbol: str, metric: str) -> RollingWindow:
+        w = self._series.get((symbol, metric))
+        if w is None:
+            w = self._series[(symbol, metric)] = RollingWindow(self.window, self.buckets)
+        return w
+
+    def __call__(self, row: dict):
+        ts, symbol = row["timestamp"], row["symbol"]
+        t = self.thresholds
+        for a, b in self.pairs:
+            metric = pair_name(a, b)
+            w = self._window(symbol, metric)
+            w.expire(ts)
+            value = divergence_bps(row.get(a), row.get(b))
+            if value is None:
+                continue
+            # z-score against the window as it stood before this sample
+            mean, std, n = w.mean, w.stddev, w.count
+            w.add(ts, value)
+            self._check(ts, symbol, metric, "divergence", abs(value), t.max_divergence_bps)
+            if t.max_zscore is not None and n >= t.min_samples and std:
+                self._check(ts, symbol, metric, "zscore", abs(value - mean) / std, t.max_zscore)
+
+        publish_time = row.get("Pyth_publish_time")
+        if publish_time is not None:
+            self._published[symbol] = max(publish_time, self._published.get(symbol, publish_time))
+        if symbol in self._published:
+            staleness = max(0.0, ts - self._published[symbol])
+            self._window(symbol, STALENESS).add(ts, staleness)
+            self._check(ts, symbol, STALENESS, "staleness", staleness, t.max_staleness)
+
+    def _check(self, ts: float, symbol: str, metric: str, kind: str, value: float, threshold: Optional[float]):
+        if threshold is None:
+            return
+        key = (symbol, metric, kind)
+        breached = value > threshold
+        if breached != (key in self._active):
+            (self._active.add if breached else self._active.discard)(key)
+            self.sink(Alert(ts, symbol, metric, kind, value, threshold, breached))
+
+    def symbols(self) -> list:
+        return list(dict.fromkeys(symbol for symbol, _ in self._series))
+
+    def stats(self, symbol: str) -> dict:
+        """{metric: {count, mean, stddev, max_abs, last}} over the current window for one symbol."""
+        return {metric: w.snapshot() for (sym, metric), w in self._series.items() if sym == symbol}
+
+    def active_alerts(self) -> list:
+        return sorted(self._active)
@@ -0,0 +1,339 @@
+"""
+Append-only time-series store for oracle samples (see anime_oracles.py).
+
+Samples are (ts, symbol, source, price, ema, publish_time) with `source` one
+of "pyth" / "cmc". They are kept in time-partitioned SQLite files under one
+root directory, one directory per resolution tier:
+
+    <root>/raw/YYYYMMDD.sqlite   every sample           (kept 7 days)
+    <root>/1m/YYYYMMDD.sqlite    1-minute bars          (kept 30 days)
+    <root>/1h/YYYYMM.sqlite      1-hour bars            (kept ~1 year)
+    <root>/1d/YYYY.sqlite        1-day bars             (kept forever)
+
+- Tables are WITHOUT ROWID with (symbol, source, time) as the primary key, so
+  a range query for one series is an index seek inside each partition it
+  overlaps, and only those partition files are opened.
+- rollup() folds closed buckets up one tier at a time (raw -> 1m -> 1h -> 1d).
+  Bars keep open/high/low/close, sum and count of the price, the last EMA and
+  the newest publish_time, so coarser bars are built from finer bars exactly.
+- prune() deletes whole partition files past their tier's retention, which
+  keeps disk use bounded without VACUUM.
+- Per-tier rollup watermarks live in <root>/meta.sqlite; a sample that
+  arrives after its bucket was rolled up (beyond `grace`) stays in raw only.
+
+Times are Unix seconds (floats allowed) at the API; raw samples are stored
+with millisecond resolution, bars by bucket start in seconds.
+"""
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
+
+DAY = 86400
+
+
+@dataclass(frozen=True)
+class Tier:
+    name: str
+    seconds: int  # bucket width; 0 for raw samples
+    partition: str  # strftime pattern (UTC) naming the partition files
+    retention: Optional[int]  # seconds; None keeps everything
+
+
+TIERS = (
+    Tier("raw", 0, "%Y%m%d", 7 * DAY),
+    Tier("1m", 60, "%Y%m%d", 30 * DAY),
+    Tier("1h", 3600, "%Y%m", 366 * DAY),
+    Tier("1d", DAY, "%Y", None),
+)
+TIER_BY_NAME = {t.name: t for t in TIERS}
+
+RAW_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    symbol        TEXT NOT NULL,
+    source        TEXT NOT NULL,
+    ts            INTEGER NOT NULL,  -- milliseconds
+    price         REAL,
+    ema           REAL,
+    publish_time  INTEGER,
+    PRIMARY KEY (symbol, source, ts)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_samples_ts ON samples (ts);
+"""
+
+BAR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol        TEXT NOT NULL,
+    source        TEXT NOT NULL,
+    start         INTEGER NOT NULL,  -- bucket start, seconds
+    open          REAL,
+    high          REAL,
+    low           REAL,
+    close         REAL,
+    sum           REAL NOT NULL,
+    count         INTEGER NOT NULL,
+    ema           REAL,
+    publish_time  INTEGER,
+    PRIMARY KEY (symbol, source, start)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_bars_start ON bars (start);
+"""
+
+META_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    tier   TEXT PRIMARY KEY,
+    value  INTEGER NOT NULL  -- seconds; buckets before this are rolled up
+);
+"""
+
+BAR_FIELDS = ("symbol", "source", "start", "open", "high", "low", "close", "sum", "count", "ema", "publish_time")
+SAMPLE_FIELDS = ("symbol", "source", "ts", "price", "ema", "publish_time")
+
+
+def samples_from_row(row: dict) -> list[tuple]:
+    """anime_oracles row -> (ts, symbol, source, price, ema, publish_time) per source with a price."""
+    out = []
+    ts, symbol = row["timestamp"], row["symbol"]
+    if row.get("Pyth_Stable") is not None:
+        out.append((ts, symbol, "pyth", row["Pyth_Stable"], row.get("Pyth_EMA"), row.get("Pyth_publish_time")))
+    if row.get("CMC_price_USD") is not None:
+        out.append((ts, symbol, "cmc", row["CMC_price_USD"], None, None))
+    return out
+
+
+class OracleStore:
+    def __init__(self, root: str, tiers: Iterable[Tier] = TIERS, grace: float = 30.0):
+        self.root = root
+        self.tiers = tuple(tiers)
+        self.grace = grace
+        for tier in self.tiers:
+            os.makedirs(os.path.join(root, tier.name), exist_ok=True)
+        self._conns: dict[str, sqlite3.Connection] = {}
+        self.meta = self._open(os.path.join(root, "meta.sqlite"), META_SCHEMA)
+
+    # ---- partitions ----
+    @staticmethod
+    def _open(path: str, schema: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(schema)
+        return conn
+
+    def _key(self, tier: Tier, t: float) -> str:
+        return datetime.fromtimestamp(t, tz=timezone.utc).strftime(tier.partition)
+
+    def _path(self, tier: Tier, key: str) -> str:
+        return os.path.join(self.root, tier.name, f"{key}.sqlite")
+
+    def _conn(self, tier: Tier, key: str) -> sqlite3.Connection:
+        path = self._path(tier, key)
+        conn = self._conns.get(path)
+        if conn is None:
+            conn = self._open(path, RAW_SCHEMA if tier.seconds == 0 else BAR_SCHEMA)
+            self._conns[path] = conn
+        return conn
+
+    def partitions(self, tier: Tier) -> list[str]:
+        names = os.listdir(os.path.join(self.root, tier.name))
+        return sorted(n[: -len(".sqlite")] for n in names if n.endswith(".sqlite"))
+
+    def _overlapping(self, tier: Tier, start: float, end: float) -> list[str]:
+        lo, hi = self._key(tier, start), self._key(tier, max(start, end - 1e-3))
+        return [k for k in self.partitions(tier) if lo <= k <= hi]
+
+    def close(self):
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+        self.meta.close()
+
+    # ---- writes ----
+    def append(self, samples: Iterable[tuple]) -> int:
+        """
+        Store (ts, symbol, source, price, ema, publish_time) samples. A repeat
+        of the same (symbol, source, ts) replaces the earlier sample.
+        """
+        raw = TIER_BY_NAME["raw"]
+        by_partition: dict[str, list[tuple]] = {}
+        for ts, symbol, source, price, ema, publish_time in samples:
+            by_partition.setdefault(self._key(raw, ts), []).append(
+                (symbol, source, int(round(ts * 1000)), price, ema, publish_time)
+            )
+        n = 0
+        for key, rows in by_partition.items():
+            conn = self._conn(raw, key)
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?, ?, ?)", rows)
+            n += len(rows)
+        return n
+
+    # ---- reads ----
+    def query(self, symbol: str, source: str, start: float, end: float, resolution: str = "raw") -> list[dict]:
+        """Samples (raw) or bars (1m/1h/1d) for one series with time in [start, end), oldest first."""
+        tier = TIER_BY_NAME[resolution]
+        out = []
+        for key in self._overlapping(tier, start, end):
+            conn = self._conn(tier, key)
+            if tier.seconds == 0:
+                rows = conn.execute(
+                    "SELECT * FROM samples WHERE symbol = ? AND source = ? AND ts >= ? AND ts < ? ORDER BY ts",
+                    (symbol, source, int(start * 1000), int(end * 1000)),
+                )
+                out.extend({**dict(r), "ts": r["ts"] / 1000} for r in rows)
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM bars WHERE symbol = ? AND source = ? AND start >= ? AND start < ? ORDER BY start",
+                    (symbol, source, int(start), int(end)),
+                )
+                out.extend(dict(r) for r in rows)
+        return out
+
+    def _scan(self, tier: Tier, start: int, end: int) -> Iterator[tuple]:
+        """(symbol, source, seconds, price|open, high, low, close, sum, count, ema, publish_time) in [start, end)."""
+        for key in self._overlapping(tier, start, end):
+            conn = self._conn(tier, key)
+            if tier.seconds == 0:
+                rows = conn.execute(
+                    "SELECT symbol, source, ts, price, ema, publish_time FROM samples "
+                    "WHERE ts >= ? AND ts < ? AND price IS NOT NULL ORDER BY symbol, source, ts",
+                    (start * 1000, end * 1000),
+                )
+                for symbol, source, ts, price, ema, pub in rows:
+                    yield symbol, source, ts / 1000, price, price, price, price, price, 1, ema, pub
+            else:
+                rows = conn.execute(
+                    "SELECT symbol, source, start, open, high, low, close, sum, count, ema, publish_time FROM bars "
+                    "WHERE start >= ? AND start < ? ORDER BY symbol, source, start",
+                    (start, end),
+                )
+                yield from (tuple(r) for r in rows)
+
+    # ---- rollups ----
+    def _watermark(self, tier: Tier) -> Optional[int]:
+        row = self.meta.execute("SELECT value FROM watermarks WHERE tier = ?", (tier.name,)).fetchone()
+        return row[0] if row else None
+
+    def _earliest(self, tier: Tier) -> Optional[int]:
+        for key in self.partitions(tier):
+            conn = self._conn(tier, key)
+            if tier.seconds == 0:
+                v = conn.execute("SELECT MIN(ts) FROM samples").fetchone()[0]
+                v = None if v is None else v // 1000
+            else:
+                v = conn.execute("SELECT MIN(start) FROM bars").fetchone()[0]
+            if v is not None:
+                return v
+        return None
+
+    def rollup(self, now: Optional[float] = None) -> dict:
+        """Fold every closed bucket into the next tier up. Returns bars written per tier."""
+        now = time.time() if now is None else now
+        written = {}
+        for src, dst in zip(self.tiers, self.tiers[1:]):
+            width = dst.seconds
+            # A bucket is closed once its end (plus grace for late raw samples) has passed
+            closed = int((now - self.grace) // width * width)
+            begin = self._watermark(dst)
+            if begin is None:
+                earliest = self._earliest(src)
+                if earliest is None:
+                    continue
+                begin = earliest // width * width
+            if begin >= closed:
+                continue
+            bars = self._aggregate(self._scan(src, begin, closed), width)
+            by_partition: dict[str, list[tuple]] = {}
+            for bar in bars:
+                by_partition.setdefault(self._key(dst, bar[2]), []).append(bar)
+            for key, rows in by_partition.items():
+                conn = self._conn(dst, key)
+                with conn:
+                    conn.executemany(f"INSERT OR REPLACE INTO bars VALUES ({', '.join('?' * len(BAR_FIELDS))})", rows)
+            with self.meta:
+                self.meta.execute("INSERT OR REPLACE INTO watermarks VALUES (?, ?)", (dst.name, closed))
+            written[dst.name] = sum(len(r) for r in by_partition.values())
+        return written
+
+    @staticmethod
+    def _aggregate(rows: Iterable[tuple], width: int) -> list[tuple]:
+        """Merge time-ordered rows of each series into `width`-second bars."""
+        bars = []
+        cur = None
+        for symbol, source, t, o, h, lo, c, s, n, ema, pub in rows:
+            start = int(t // width * width)
+            if cur is not None and (cur[0], cur[1], cur[2]) == (symbol, source, start):
+                cur[4] = max(cur[4], h)
+                cur[5] = min(cur[5], lo)
+                cur[6] = c
+                cur[7] += s
+                cur[8] += n
+                if ema is not None:
+                    cur[9] = ema
+                if pub is not None:
+                    cur[10] = pub if cur[10] is None else max(cur[10], pub)
+                continue
+            if cur is not None:
+                bars.append(tuple(cur))
+            cur = [symbol, source, start, o, h, lo, c, s, n, ema, pub]
+        if cur is not None:
+            bars.append(tuple(cur))
+        return bars
+
+    # ---- retention ----
+    def prune(self, now: Optional[float] = None) -> list[str]:
+        """Delete partition files wholly older than their tier's retention. Returns removed paths."""
+        now = time.time() if now is None else now
+        removed = []
+        for tier in self.tiers:
+            if tier.retention is None:
+                continue
+            # Partition keys sort by time; keep the partition holding the cutoff
+            cutoff = self._key(tier, now - tier.retention)
+            for key in self.partitions(tier):
+                if key >= cutoff:
+                    break
+                path = self._path(tier, key)
+                conn = self._conns.pop(path, None)
+                if conn is not None:
+                    conn.close()
+                for suffix in ("", "-wal", "-shm"):
+                    if os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+                removed.append(path)
+        return removed
+
+    def disk_usage(self) -> int:
+        total = 0
+        for dirpath, _, files in os.walk(self.root):
+            total += sum(os.path.getsize(os.path.join(dirpath, f)) for f in files)
+        return total
+
+
+class StoreSink:
+    """
+    anime_oracles on_row callback: appends each row's samples, then rolls up
+    closed buckets once a minute and prunes expired partitions once an hour.
+    """
+
+    def __init__(self, store: OracleStore, rollup_every: float = 60.0, prune_every: float = 3600.0, clock=time.time):
+        self.store = store
+        self.rollup_every = rollup_every
+        self.prune_every = prune_every
+        self.clock = clock
+        self._next_rollup = 0.0
+        self._next_prune = 0.0
+
+    def __call__(self, row: dict):
+        self.store.append(samples_from_row(row))
+        now = self.clock()
+        if now >= self._next_rollup:
+            self.store.rollup(now)
+            self._next_rollup = now + self.rollup_every
+        if now >= self._next_prune:
+            self.store.prune(now)
+            self._next_prune = now + self.prune_every
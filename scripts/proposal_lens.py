@@ -0,0 +1,130 @@
+"""
+Read a page of GovernanceHub proposals through GovernanceLens in one eth_call.
+
+`GovernanceHub.getProposals` only returns clone addresses, so listing a page
+used to cost one call for the page plus seven per proposal (title, author,
+createdAt, voteStart, voteEnd, votesFor, votesAgainst). GovernanceLens does the
+fan-out on-chain and returns packed `ProposalSummary` structs; this module turns
+them into plain Python objects.
+
+Usage
+-----
+    ape run proposal_lens --network ethereum:sepolia:alchemy
+
+Environment
+-----------
+- GOVERNANCE_HUB   (required) GovernanceHub address
+- GOVERNANCE_LENS  (required) GovernanceLens address
+- LENS_STATE       (default: 2 / ACTIVE) 0=DRAFT, 1=OPEN, 2=ACTIVE, 3=CLOSED
+- LENS_OFFSET      (default: 0)
+- LENS_COUNT       (default: 100, capped at PAGE_LIMIT on chain)
+- LENS_REVERSE     (default: 1) newest first when "1"
+"""
+
+from dataclasses import dataclass
+import os
+
+from eth_abi import decode as abi_decode
+from eth_utils import to_checksum_address
+
+PAGE_LIMIT = 100
+
+STATE_NAMES = {0: "DRAFT", 1: "OPEN", 2: "ACTIVE", 3: "CLOSED"}
+
+# ABI tuple layout of GovernanceLens.ProposalSummary
+SUMMARY_TUPLE = "(address,string,address,uint256,uint256,uint256,uint256,uint256)"
+
+
+@dataclass(frozen=True)
+class ProposalSummary:
+    proposal: str
+    title: str
+    author: str
+    created_at: int
+    vote_start: int
+    vote_end: int
+    votes_for: int
+    votes_against: int
+
+    @property
+    def total_votes(self) -> int:
+        return self.votes_for + self.votes_against
+
+    @classmethod
+    def from_tuple(cls, raw) -> "ProposalSummary":
+        proposal, title, author, created, vs, ve, vf, va = raw
+        return cls(
+            proposal=to_checksum_address(proposal),
+            title=str(title),
+            author=to_checksum_address(author),
+            created_at=int(created),
+            vote_start=int(vs),
+            vote_end=int(ve),
+            votes_for=int(vf),
+            votes_against=int(va),
+        )
+
+
+def decode_summaries(returndata: bytes) -> list[ProposalSummary]:
+    """Decode raw `getProposalSummaries` / `getSummaries` return data."""
+    (items,) = abi_decode([f"{SUMMARY_TUPLE}[]"], bytes(returndata))
+    return [ProposalSummary.from_tuple(item) for item in items]
+
+
+def _from_ape_struct(item) -> ProposalSummary:
+    # Ape returns struct outputs as objects that also unpack like tuples.
+    return ProposalSummary.from_tuple(tuple(item))
+
+
+def fetch_proposal_summaries(
+    lens,
+    hub: str,
+    state: int,
+    offset: int = 0,
+    count: int = PAGE_LIMIT,
+    reverse: bool = True,
+) -> list[ProposalSummary]:
+    """One `getProposalSummaries` call for a state/offset/count page."""
+    items = lens.getProposalSummaries(hub, state, offset, min(count, PAGE_LIMIT), reverse)
+    return [_from_ape_struct(item) for item in items]
+
+
+def fetch_summaries(lens, proposals: list[str]) -> list[ProposalSummary]:
+    """Summaries for explicit clone addresses, chunked by PAGE_LIMIT."""
+    out: list[ProposalSummary] = []
+    for i in range(0, len(proposals), PAGE_LIMIT):
+        items = lens.getSummaries(proposals[i : i + PAGE_LIMIT])
+        out.extend(_from_ape_struct(item) for item in items)
+    return out
+
+
+def _get_env(name: str) -> str | None:
+    value = os.environ.get(name)
+    if value:
+        value = value.strip()
+        return value or None
+    return None
+
+
+def main():
+    from ape import project
+
+    hub_address = _get_env("GOVERNANCE_HUB")
+    lens_address = _get_env("GOVERNANCE_LENS")
+    if not hub_address or not lens_address:
+        raise SystemExit("Set GOVERNANCE_HUB and GOVERNANCE_LENS.")
+
+    state = int(_get_env("LENS_STATE") or 2)
+    offset = int(_get_env("LENS_OFFSET") or 0)
+    count = int(_get_env("LENS_COUNT") or PAGE_LIMIT)
+    reverse = (_get_env("LENS_REVERSE") or "1") == "1"
+
+    lens = project.GovernanceLens.at(lens_address)
+    summaries = fetch_proposal_summaries(lens, hub_address, state, offset, count, reverse)
+    print(f"=== {STATE_NAMES.get(state, state)} proposals (offset={offset}, count={len(summaries)}) ===")
+    for s in summaries:
+        print(f"{s.proposal}  votes={s.total_votes:>6}  window=[{s.vote_start}, {s.vote_end}]  {s.title}")
+
+
+if __name__ == "__main__":
+    main()
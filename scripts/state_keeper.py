@@ -0,0 +1,114 @@
+"""
+Keeper that keeps GovernanceHub's per-state lists in step with voting windows.
+
+A proposal only leaves OPEN / ACTIVE when someone calls syncProposalState
+after its `voteStart` / `voteEnd` has passed. This keeper reads the window
+boundaries from the hub_indexer database (indexed by state and boundary), and
+at each tick submits every due proposal through
+`GovernanceHub.syncProposalStates` in batches of up to MAX_SYNC_BATCH. Between
+ticks it sleeps until the next known boundary instead of polling the chain on
+a fixed interval; `max_sleep` bounds the wait so windows created or changed
+in the meantime are picked up.
+
+The keeper runs its own HubIndexer over the database, so it can share the
+database with a running hub_indexer / hub_api or use a private one.
+
+Usage
+-----
+    GOVERNANCE_HUB=0x... ape run state_keeper --network ethereum:sepolia:alchemy
+
+Environment
+-----------
+- GOVERNANCE_HUB             (required) hub to keep in sync
+- HUB_INDEX_DB               (default: hub_index.sqlite) hub_indexer database
+- HUB_START_BLOCK            (default: 0) first block to scan on an empty database
+- KEEPER_ACCOUNT_ALIAS       (default: deployer) ape account that pays for gas
+- KEEPER_MAX_BATCH           (default: 100) proposals per syncProposalStates call
+- KEEPER_MAX_SLEEP_SECONDS   (default: 300) longest wait between ticks
+- KEEPER_MIN_SLEEP_SECONDS   (default: 12) shortest wait between ticks (~one block)
+"""
+
+import os
+import sys
+import time
+
+# `ape run` does not put scripts/ on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from hub_indexer import HubIndexer, HubStore  # noqa: E402
+
+# GovernanceHub.MAX_SYNC_BATCH
+MAX_SYNC_BATCH = 100
+
+
+class StateKeeper:
+    """Submits syncProposalStates batches for proposals whose window boundary passed."""
+
+    def __init__(self, hub, sender, indexer: HubIndexer, max_batch: int = MAX_SYNC_BATCH, clock=None):
+        self.hub = hub
+        self.sender = sender
+        self.indexer = indexer
+        self.store = indexer.store
+        self.max_batch = max(1, min(max_batch, MAX_SYNC_BATCH))
+        self.clock = clock or (lambda: indexer.chain.blocks.head.timestamp)
+
+    def due(self) -> list[str]:
+        return self.store.due_transitions(self.clock(), self.max_batch)
+
+    def tick(self) -> list:
+        """Index new events, then sync every due proposal. Returns the receipts sent."""
+        self.indexer.sync()
+        receipts = []
+        while True:
+            batch = self.due()
+            if not batch:
+                break
+            receipt = self.hub.syncProposalStates(batch, sender=self.sender)
+            receipts.append(receipt)
+            self.indexer.sync()
+            # A full batch may hide more due proposals; stop if nothing moved
+            # so an index that disagrees with the chain cannot spin the loop
+            if len(batch) < self.max_batch or not receipt.events.filter(self.hub.StateChanged):
+                break
+        return receipts
+
+    def seconds_until_next(self, min_sleep: float = 12.0, max_sleep: float = 300.0) -> float:
+        now = self.clock()
+        nxt = self.store.next_transition(now)
+        if nxt is None:
+            return max_sleep
+        return float(min(max(nxt - now, min_sleep), max_sleep))
+
+
+def main():
+    from ape import accounts, project
+
+    hub_address = os.environ.get("GOVERNANCE_HUB", "").strip()
+    if not hub_address:
+        raise SystemExit("Set GOVERNANCE_HUB.")
+    db_path = os.environ.get("HUB_INDEX_DB", "").strip() or "hub_index.sqlite"
+    start_block = int(os.environ.get("HUB_START_BLOCK") or 0)
+    alias = os.environ.get("KEEPER_ACCOUNT_ALIAS", "").strip() or "deployer"
+    max_batch = int(os.environ.get("KEEPER_MAX_BATCH") or MAX_SYNC_BATCH)
+    max_sleep = float(os.environ.get("KEEPER_MAX_SLEEP_SECONDS") or 300)
+    min_sleep = float(os.environ.get("KEEPER_MIN_SLEEP_SECONDS") or 12)
+
+    sender = accounts.load(alias)
+    sender.set_autosign(True)
+    store = HubStore(db_path)
+    indexer = HubIndexer(hub_address, store, start_block=start_block)
+    keeper = StateKeeper(project.GovernanceHub.at(hub_address), sender, indexer, max_batch=max_batch)
+    print(f"Keeping {hub_address} in sync as {sender.address}", flush=True)
+    try:
+        while True:
+            for receipt in keeper.tick():
+                moved = len(receipt.events.filter(keeper.hub.StateChanged))
+                print(f"[keeper] tx={receipt.txn_hash} moved={moved} gas={receipt.gas_used}", flush=True)
+            time.sleep(keeper.seconds_until_next(min_sleep, max_sleep))
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
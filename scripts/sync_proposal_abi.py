@@ -26,6 +26,7 @@ CONTRACTS_TO_SYNC = {
   "GovernanceHub": REPO_ROOT / "app" / "src" / "abis" / "GovernanceHub.json",
   "ProposalTemplate": REPO_ROOT / "app" / "src" / "abis" / "ProposalTemplate.json",
   "CommentTemplate": REPO_ROOT / "app" / "src" / "abis" / "CommentTemplate.json",
+  "GovernanceLens": REPO_ROOT / "app" / "src" / "abis" / "GovernanceLens.json",
 }
 
 
@@ -0,0 +1,326 @@
+"""
+Relayer for EIP-712 signed GovernanceHub votes and comments.
+
+Users sign `Vote` / `Comment` typed messages off-chain (see sign_vote /
+sign_comment for the exact domain and types); whoever collects them writes
+them into a local SQLite queue. The relayer pools queued messages and submits
+them through `GovernanceHub.relayVotes` / `relayComments`, so throughput scales
+with the batch size rather than with one transaction per user.
+
+- A batch is flushed once `max_batch` messages of a kind are pending, or the
+  oldest pending one has waited `max_wait` seconds.
+- Messages are ordered per signer by nonce. Stale nonces and expired deadlines
+  are rejected; messages whose nonce is ahead of the signer's next on-chain
+  nonce stay queued until the gap is filled.
+- The batch is simulated first. If it would revert, it is rebuilt one message
+  at a time and the messages that fail are rejected with the revert reason, so
+  one bad signature never blocks the rest.
+
+Usage
+-----
+    GOVERNANCE_HUB=0x... ape run vote_relayer --network ethereum:sepolia:alchemy
+
+Environment
+-----------
+- GOVERNANCE_HUB          (required) hub to relay to
+- RELAY_QUEUE_DB          (default: relay_queue.sqlite) queue database
+- RELAYER_ACCOUNT_ALIAS   (default: deployer) ape account that pays for gas
+- RELAY_MAX_BATCH         (default: 50 votes / 20 comments, capped at the hub's bounds)
+- RELAY_MAX_WAIT_SECONDS  (default: 10) flush a partial batch after this long
+- RELAY_POLL_SECONDS      (default: 1) queue poll interval
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+from eth_account import Account
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+
+EIP712_NAME = "GovernanceHub"
+EIP712_VERSION = "1"
+
+VOTE_TYPES = {
+    "Vote": [
+        {"name": "voter", "type": "address"},
+        {"name": "proposal", "type": "address"},
+        {"name": "support", "type": "bool"},
+        {"name": "nonce", "type": "uint256"},
+        {"name": "deadline", "type": "uint256"},
+    ]
+}
+COMMENT_TYPES = {
+    "Comment": [
+        {"name": "author", "type": "address"},
+        {"name": "proposal", "type": "address"},
+        {"name": "content", "type": "string"},
+        {"name": "sentiment", "type": "uint256"},
+        {"name": "nonce", "type": "uint256"},
+        {"name": "deadline", "type": "uint256"},
+    ]
+}
+
+KIND_VOTE = "vote"
+KIND_COMMENT = "comment"
+# Must match MAX_VOTE_BATCH / MAX_COMMENT_BATCH in GovernanceHub.vy
+MAX_BATCH = {KIND_VOTE: 50, KIND_COMMENT: 20}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind         TEXT NOT NULL,
+    signer       TEXT NOT NULL,
+    nonce        INTEGER NOT NULL,
+    payload      TEXT NOT NULL,
+    received_at  REAL NOT NULL,
+    status       TEXT NOT NULL DEFAULT 'pending',
+    tx_hash      TEXT,
+    error        TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_messages_pending ON messages (status, kind, id);
+"""
+
+
+# --------------------------
+# Signing (client side)
+# --------------------------
+def eip712_domain(hub_address: str, chain_id: int) -> dict:
+    return {
+        "name": EIP712_NAME,
+        "version": EIP712_VERSION,
+        "chainId": chain_id,
+        "verifyingContract": to_checksum_address(hub_address),
+    }
+
+
+def _signed(kind: str, message: dict, signed) -> dict:
+    return {
+        "kind": kind,
+        **message,
+        "v": signed.v,
+        "r": HexBytes(signed.r.to_bytes(32, "big")).to_0x_hex(),
+        "s": HexBytes(signed.s.to_bytes(32, "big")).to_0x_hex(),
+    }
+
+
+def sign_vote(private_key, hub_address: str, chain_id: int, proposal: str, support: bool, nonce: int, deadline: int) -> dict:
+    """Sign a `Vote` and return the queue payload."""
+    voter = Account.from_key(private_key).address
+    message = {
+        "voter": voter,
+        "proposal": to_checksum_address(proposal),
+        "support": bool(support),
+        "nonce": int(nonce),
+        "deadline": int(deadline),
+    }
+    signed = Account.sign_typed_data(private_key, eip712_domain(hub_address, chain_id), VOTE_TYPES, message)
+    return _signed(KIND_VOTE, message, signed)
+
+
+def sign_comment(
+    private_key, hub_address: str, chain_id: int, proposal: str, content: str, sentiment: int, nonce: int, deadline: int
+) -> dict:
+    """Sign a `Comment` and return the queue payload."""
+    author = Account.from_key(private_key).address
+    message = {
+        "author": author,
+        "proposal": to_checksum_address(proposal),
+        "content": content,
+        "sentiment": int(sentiment),
+        "nonce": int(nonce),
+        "deadline": int(deadline),
+    }
+    signed = Account.sign_typed_data(private_key, eip712_domain(hub_address, chain_id), COMMENT_TYPES, message)
+    return _signed(KIND_COMMENT, message, signed)
+
+
+def _signer(message: dict) -> str:
+    return message["voter"] if message["kind"] == KIND_VOTE else message["author"]
+
+
+def to_struct(message: dict) -> tuple:
+    """Queue payload -> SignedVote / SignedComment tuple for the hub call."""
+    sig = (int(message["v"]), HexBytes(message["r"]), HexBytes(message["s"]))
+    if message["kind"] == KIND_VOTE:
+        head = (message["voter"], message["proposal"], bool(message["support"]))
+    else:
+        head = (message["author"], message["proposal"], message["content"], int(message["sentiment"]))
+    return head + (int(message["nonce"]), int(message["deadline"])) + sig
+
+
+# --------------------------
+# Queue
+# --------------------------
+class RelayQueue:
+    """SQLite spool of signed messages; producers only need put()."""
+
+    def __init__(self, path: str = ":memory:"):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def put(self, message: dict, received_at: float | None = None) -> int:
+        if message.get("kind") not in MAX_BATCH:
+            raise ValueError(f"unknown message kind: {message.get('kind')!r}")
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO messages (kind, signer, nonce, payload, received_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    message["kind"],
+                    to_checksum_address(_signer(message)),
+                    int(message["nonce"]),
+                    json.dumps(message),
+                    time.time() if received_at is None else received_at,
+                ),
+            )
+        return cur.lastrowid
+
+    def pending(self, kind: str, limit: int | None = None) -> list[dict]:
+        sql = "SELECT id, payload, received_at FROM messages WHERE status = 'pending' AND kind = ? ORDER BY id"
+        params: tuple = (kind,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return [{"id": r["id"], "received_at": r["received_at"], **json.loads(r["payload"])} for r in self.conn.execute(sql, params)]
+
+    def count_pending(self, kind: str) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM messages WHERE status = 'pending' AND kind = ?", (kind,)).fetchone()[0]
+
+    def oldest_pending(self, kind: str) -> float | None:
+        return self.conn.execute(
+            "SELECT MIN(received_at) FROM messages WHERE status = 'pending' AND kind = ?", (kind,)
+        ).fetchone()[0]
+
+    def mark_sent(self, ids, tx_hash: str) -> None:
+        with self.conn:
+            self.conn.executemany("UPDATE messages SET status = 'sent', tx_hash = ? WHERE id = ?", [(tx_hash, i) for i in ids])
+
+    def mark_rejected(self, message_id: int, error: str) -> None:
+        with self.conn:
+            self.conn.execute("UPDATE messages SET status = 'rejected', error = ? WHERE id = ?", (error, message_id))
+
+    def status(self, message_id: int) -> dict:
+        row = self.conn.execute("SELECT status, tx_hash, error FROM messages WHERE id = ?", (message_id,)).fetchone()
+        return dict(row) if row else None
+
+
+# --------------------------
+# Relayer
+# --------------------------
+class Relayer:
+    """Flushes queued signatures to the hub by size or age."""
+
+    def __init__(self, hub, sender, queue: RelayQueue, max_batch: int | None = None, max_wait: float = 10.0, clock=time.time):
+        self.hub = hub
+        self.sender = sender
+        self.queue = queue
+        self.max_batch = {k: min(max_batch or cap, cap) for k, cap in MAX_BATCH.items()}
+        self.max_wait = max_wait
+        self.clock = clock
+
+    def _method(self, kind: str):
+        return self.hub.relayVotes if kind == KIND_VOTE else self.hub.relayComments
+
+    def due(self, kind: str) -> bool:
+        count = self.queue.count_pending(kind)
+        if count == 0:
+            return False
+        if count >= self.max_batch[kind]:
+            return True
+        return self.clock() - self.queue.oldest_pending(kind) >= self.max_wait
+
+    def _simulate(self, kind: str, batch: list[dict]) -> str | None:
+        """Return None if the batch would succeed, else the revert reason."""
+        try:
+            self._method(kind).call([to_struct(m) for m in batch], sender=self.sender)
+            return None
+        except Exception as e:
+            return getattr(e, "revert_message", None) or str(e) or type(e).__name__
+
+    def _select(self, kind: str, rows: list[dict]) -> list[dict]:
+        # Stable sort keeps each signer's messages in nonce order
+        rows = sorted(rows, key=lambda m: int(m["nonce"]))
+        now = self.clock()
+        expected: dict[str, int] = {}
+        candidates = []
+        for m in rows:
+            signer = to_checksum_address(_signer(m))
+            if signer not in expected:
+                expected[signer] = int(self.hub.nonces(signer))
+            if int(m["deadline"]) < now:
+                self.queue.mark_rejected(m["id"], "signature expired")
+            elif int(m["nonce"]) < expected[signer]:
+                self.queue.mark_rejected(m["id"], "stale nonce")
+            elif int(m["nonce"]) == expected[signer]:
+                candidates.append(m)
+                expected[signer] += 1
+            # nonce ahead of the chain: stays pending until the gap is filled
+            if len(candidates) == self.max_batch[kind]:
+                break
+
+        if not candidates or self._simulate(kind, candidates) is None:
+            return candidates
+        accepted: list[dict] = []
+        for m in candidates:
+            error = self._simulate(kind, accepted + [m])
+            if error is None:
+                accepted.append(m)
+            else:
+                self.queue.mark_rejected(m["id"], error)
+        return accepted
+
+    def flush(self, kind: str):
+        """Submit one batch of `kind`; returns the receipt or None if nothing was sent."""
+        batch = self._select(kind, self.queue.pending(kind))
+        if not batch:
+            return None
+        receipt = self._method(kind)([to_struct(m) for m in batch], sender=self.sender)
+        self.queue.mark_sent([m["id"] for m in batch], str(receipt.txn_hash))
+        return receipt
+
+    def poll(self) -> list:
+        receipts = []
+        for kind in (KIND_VOTE, KIND_COMMENT):
+            if self.due(kind):
+                receipt = self.flush(kind)
+                if receipt is not None:
+                    receipts.append(receipt)
+        return receipts
+
+
+def main():
+    from ape import accounts, project
+
+    hub_address = os.environ.get("GOVERNANCE_HUB", "").strip()
+    if not hub_address:
+        raise SystemExit("Set GOVERNANCE_HUB.")
+    db_path = os.environ.get("RELAY_QUEUE_DB", "").strip() or "relay_queue.sqlite"
+    alias = os.environ.get("RELAYER_ACCOUNT_ALIAS", "").strip() or "deployer"
+    max_batch = int(os.environ.get("RELAY_MAX_BATCH") or 0) or None
+    max_wait = float(os.environ.get("RELAY_MAX_WAIT_SECONDS") or 10)
+    poll = float(os.environ.get("RELAY_POLL_SECONDS") or 1)
+
+    sender = accounts.load(alias)
+    sender.set_autosign(True)
+    queue = RelayQueue(db_path)
+    relayer = Relayer(project.GovernanceHub.at(hub_address), sender, queue, max_batch=max_batch, max_wait=max_wait)
+    print(f"Relaying {db_path} -> {hub_address} as {sender.address}", flush=True)
+    try:
+        while True:
+            for receipt in relayer.poll():
+                print(f"[relay] tx={receipt.txn_hash} gas={receipt.gas_used}", flush=True)
+            time.sleep(poll)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
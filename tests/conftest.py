@@ -1,8 +1,15 @@
 import os
+from pathlib import Path
+import sys
+
 from dotenv import find_dotenv, load_dotenv
 import pytest
 from ape import networks
 
+# Make helper modules under scripts/ importable from tests (same approach the
+# deploy scripts use when they import sync_proposal_abi).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
 # Load .env before Ape connects; avoids demo-key fallback during collection
 load_dotenv(find_dotenv(usecwd=True), override=False)
 
@@ -26,3 +33,21 @@ def _use_local_test_provider():
     # Use Ape's in-process test provider with pre-funded accounts
     with networks.parse_network_choice("ethereum:local:test") as _provider:
         yield
+
+
+@pytest.fixture(scope="session")
+def deploy_hub(accounts):
+    """
+    Deploys a fresh GovernanceHub (deployer accounts[0], bobu accounts[1],
+    elected admins accounts[2:5]) and returns (hub, bobu). Call it again for
+    a second hub.
+    """
+    from local_hub import deploy_hub as _deploy_hub
+
+    return lambda: _deploy_hub(accounts)
+
+
+@pytest.fixture(scope="function")
+def hub(deploy_hub):
+    """A fresh GovernanceHub per test, as (hub, bobu)."""
+    return deploy_hub()
@@ -0,0 +1,286 @@
+import asyncio
+import json
+import time
+
+import pytest
+import aiohttp
+from aiohttp import web
+
+from anime_oracles import (
+    CmcSource,
+    OracleEngine,
+    PythSource,
+    PythStream,
+    Source,
+    SseParser,
+    backoff_delay,
+    parse_feeds,
+)
+
+FEED = "45b75908a1965a86080a26d9f31ab69d045d4dda73d1394e0d3693ce00d40e6f"
+
+
+def _pyth_item(feed_id, price=1573594, ema=1568627, publish_time=1757437614):
+    return {
+        "id": feed_id,
+        "price": {"price": str(price), "expo": -8, "publish_time": publish_time},
+        "ema_price": {"price": str(ema), "expo": -8, "publish_time": publish_time},
+    }
+
+
+def _cmc_item(price=0.01570607):
+    return [{"quote": {"USD": {"price": price}}}]
+
+
+class StubServer:
+    """Local Hermes + CMC stand-ins with scriptable delays and failures."""
+
+    def __init__(self):
+        self.delay = {"pyth": 0.0, "cmc": 0.0}
+        self.failures = {"pyth": [], "cmc": []}  # statuses to return before succeeding
+        self.requests = {"pyth": 0, "cmc": 0}
+        self.peers = set()
+        self.pyth_ids = {FEED: 1573594}  # feed id -> raw price (expo -8) the stub knows
+        self.cmc_prices = {"ANIME": 0.01570607}
+        self.stream_script = []  # per connection: an HTTP status, or bytes to send / floats to sleep
+        self.stream_requests = []
+        self.runner = None
+
+    async def _handle(self, name, request, body):
+        self.requests[name] += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(self.delay[name])
+        if self.failures[name]:
+            return web.Response(status=self.failures[name].pop(0))
+        return web.json_response(body)
+
+    async def pyth(self, request):
+        ids = request.query.getall("ids[]")
+        body = {"parsed": [_pyth_item(i, price=self.pyth_ids[i]) for i in ids if i in self.pyth_ids]}
+        return await self._handle("pyth", request, body)
+
+    async def cmc(self, request):
+        assert request.headers["X-CMC_PRO_API_KEY"] == "test-key"
+        symbols = request.query["symbol"].split(",")
+        body = {"data": {s: _cmc_item(self.cmc_prices[s]) for s in symbols if s in self.cmc_prices}}
+        return await self._handle("cmc", request, body)
+
+    async def stream(self, request):
+        self.stream_requests.append((request.query.getall("ids[]"), request.headers.get("Last-Event-ID")))
+        script = self.stream_script.pop(0) if self.stream_script else []
+        if isinstance(script, int):
+            return web.Response(status=script)
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        for step in script:
+            if isinstance(step, float):
+                await asyncio.sleep(step)
+            else:
+                await resp.write(step)
+        return resp
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/v2/updates/price/latest", self.pyth)
+        app.router.add_get("/v2/updates/price/stream", self.stream)
+        app.router.add_get("/v2/cryptocurrency/quotes/latest", self.cmc)
+        self.runner = web.AppRunner(app, handler_cancellation=True)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+def _sources(base, feeds=None, timeout=2.0):
+    feeds = feeds or {"ANIME": FEED}
+    return [
+        PythSource(feeds, url=f"{base}/v2/updates/price/latest", timeout=timeout),
+        CmcSource(list(feeds), api_key="test-key", url=f"{base}/v2/cryptocurrency/quotes/latest", timeout=timeout),
+    ]
+
+
+def test_tick_fetches_sources_concurrently_over_pooled_connections():
+    async def scenario():
+        stub = StubServer()
+        base = await stub.start()
+        stub.delay = {"pyth": 0.4, "cmc": 0.4}
+        try:
+            async with OracleEngine(_sources(base)) as engine:
+                started = time.monotonic()
+                [row] = await engine.tick()
+                elapsed = time.monotonic() - started
+                await engine.tick()
+        finally:
+            await stub.stop()
+        return row, elapsed, stub
+
+    row, elapsed, stub = asyncio.run(scenario())
+    assert row["symbol"] == "ANIME"
+    assert row["Pyth_Stable"] == 0.01573594 and row["Pyth_EMA"] == 0.01568627
+    assert row["Pyth_publish_time"] == 1757437614 and row["CMC_price_USD"] == 0.01570607
+    # Both 0.4s sources in one tick take ~0.4s, not 0.8s
+    assert elapsed < 0.7
+    # Second tick reused the first tick's connections (one per source)
+    assert stub.requests == {"pyth": 2, "cmc": 2} and len(stub.peers) == 2
+
+
+def test_retries_with_backoff_and_isolates_failing_sources():
+    async def scenario():
+        stub = StubServer()
+        base = await stub.start()
+        try:
+            async with OracleEngine(_sources(base, timeout=0.3), retries=2, backoff_base=0.01) as engine:
+                # Transient 503s are retried; a 404 is not
+                stub.failures = {"pyth": [503, 502], "cmc": [404]}
+                [recovered] = await engine.tick()
+                # A source that keeps timing out comes back NA after its retries; the other is unaffected
+                stub.delay["cmc"] = 5
+                started = time.monotonic()
+                [slow] = await engine.tick()
+                elapsed = time.monotonic() - started
+        finally:
+            await stub.stop()
+        return recovered, slow, elapsed, stub
+
+    recovered, slow, elapsed, stub = asyncio.run(scenario())
+    assert recovered["Pyth_Stable"] == 0.01573594 and recovered["CMC_price_USD"] is None
+    assert stub.requests["pyth"] == 3 + 1 and stub.requests["cmc"] == 1 + 3
+    assert slow["Pyth_Stable"] == 0.01573594 and slow["CMC_price_USD"] is None
+    assert elapsed < 3 * 0.3 + 0.5
+
+
+def test_many_feeds_cost_two_requests_per_tick():
+    feeds = {f"T{i}": f"{i:064x}" for i in range(50)}
+    feeds["CMCONLY"] = None
+
+    async def scenario():
+        stub = StubServer()
+        base = await stub.start()
+        stub.pyth_ids = {fid: 1_000_000 * (i + 1) for i, fid in enumerate(feeds.values()) if fid}
+        stub.cmc_prices = {sym: float(i) for i, sym in enumerate(feeds)}
+        del stub.cmc_prices["T7"]  # unknown to CMC
+        try:
+            async with OracleEngine(_sources(base, feeds)) as engine:
+                rows = await engine.tick()
+        finally:
+            await stub.stop()
+        return rows, stub
+
+    rows, stub = asyncio.run(scenario())
+    assert stub.requests == {"pyth": 1, "cmc": 1}
+    by_symbol = {r["symbol"]: r for r in rows}
+    assert list(by_symbol) == list(feeds)
+    assert by_symbol["T0"]["Pyth_Stable"] == 0.01 and by_symbol["T49"]["Pyth_Stable"] == 0.5
+    assert by_symbol["T7"]["CMC_price_USD"] is None and by_symbol["T8"]["CMC_price_USD"] == 8.0
+    assert by_symbol["CMCONLY"]["Pyth_Stable"] is None and by_symbol["CMCONLY"]["CMC_price_USD"] == 50.0
+
+
+def test_incomplete_source_fails_at_construction():
+    class NoParse(Source):
+        def request(self):
+            return {}
+
+        def symbols(self):
+            return ["ANIME"]
+
+    with pytest.raises(TypeError, match="parse"):
+        NoParse("http://127.0.0.1")
+
+
+def test_parse_feeds():
+    assert parse_feeds(f" anime=0x{FEED.upper()}, btc ,") == {"ANIME": FEED, "BTC": None}
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    class Rng:
+        def uniform(self, lo, hi):
+            return (lo, hi)
+
+    assert [backoff_delay(a, base=0.5, cap=8.0, rng=Rng()) for a in range(6)] == [
+        (0.25, 0.5), (0.5, 1.0), (1.0, 2.0), (2.0, 4.0), (4.0, 8.0), (4.0, 8.0)
+    ]
+
+
+def _sse(event_id, *items):
+    return f"id: {event_id}\ndata: {json.dumps({'parsed': list(items)})}\n\n".encode()
+
+
+def test_stream_reconnects_dedupes_and_carries_polled_columns():
+    first, second, third = (_pyth_item(FEED, price=p, publish_time=t) for p, t in ((1_000_000, 100), (1_100_000, 101), (1_200_000, 102)))
+
+    async def scenario():
+        stub = StubServer()
+        base = await stub.start()
+        stub.stream_script = [
+            # Connection 1: two updates (the second repeated), then the server hangs up
+            [0.2, b": hello\n\n", _sse(1, first), _sse(2, second), _sse(3, second)],
+            # Connection 2: keep-alive only, then silence past the idle timeout
+            [b": ping\n\n", 5.0],
+            # Connection 3: replays what was already seen, then one new update split across writes
+            [_sse(2, second), _sse(4, third)[:20], 0.05, _sse(4, third)[20:]],
+        ]
+        rows = []
+        try:
+            async with OracleEngine(_sources(base)[1:], backoff_base=0.01) as engine:
+                stream = PythStream({"ANIME": FEED}, url=f"{base}/v2/updates/price/stream", idle_timeout=0.3)
+                started = time.monotonic()
+                await engine.stream(stream, interval=300, on_row=rows.append, events=3)
+                elapsed = time.monotonic() - started
+        finally:
+            await stub.stop()
+        return rows, elapsed, stub
+
+    rows, elapsed, stub = asyncio.run(scenario())
+    assert [(r["symbol"], round(r["Pyth_Stable"] * 1e8), r["Pyth_publish_time"]) for r in rows] == [
+        ("ANIME", 1_000_000, 100), ("ANIME", 1_100_000, 101), ("ANIME", 1_200_000, 102)
+    ]
+    # CMC is polled once (interval 300s) and its price rides along on every stream row
+    assert stub.requests["cmc"] == 1 and all(r["CMC_price_USD"] == 0.01570607 for r in rows)
+    # Three connections, resuming with the last event id; no waiting for a poll interval
+    assert stub.stream_requests == [([FEED], None), ([FEED], "3"), ([FEED], "3")]
+    assert elapsed < 2.0
+
+
+def test_sse_parser_handles_split_chunks_and_multiline_data():
+    parser = SseParser()
+    assert parser.feed(b": keep-alive\r\nevent: price\r\ndata: {\"a\":") == []
+    assert parser.feed(b"\r\ndata: 1}\r\nid: 7\r\n\r\ndata:x\n\n") == [("price", '{"a":\n1}'), ("message", "x")]
+    assert parser.last_event_id == "7"
+
+
+def test_stream_retries_server_errors_and_fails_on_client_errors(capsys):
+    async def scenario():
+        stub = StubServer()
+        base = await stub.start()
+        stub.stream_script = [503, 404, [_sse(1, _pyth_item(FEED))]]
+        try:
+            async with OracleEngine([], backoff_base=0.01) as engine:
+                stream = PythStream({"ANIME": FEED}, url=f"{base}/v2/updates/price/stream")
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await engine.stream(stream, on_row=lambda row: None, events=1)
+        finally:
+            await stub.stop()
+        return stub
+
+    stub = asyncio.run(scenario())
+    # The 503 is retried; the 404 is not
+    assert len(stub.stream_requests) == 2
+    err = capsys.readouterr().err
+    assert "pyth-stream: HTTP 404" in err and "giving up" in err
+
+
+def test_stream_drops_updates_not_newer_than_the_last():
+    stream = PythStream({"ANIME": FEED})
+
+    def emitted(price, publish_time):
+        return [cols["Pyth_publish_time"] for _, cols in stream.updates({"parsed": [_pyth_item(FEED, price=price, publish_time=publish_time)]})]
+
+    assert emitted(1_000_000, 100) == [100]
+    # Same publish_time with a different price is still not newer
+    assert emitted(1_100_000, 100) == []
+    assert emitted(1_200_000, 99) == []
+    assert emitted(1_200_000, 101) == [101]
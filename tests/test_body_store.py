@@ -0,0 +1,77 @@
+import os
+
+import ape
+import pytest
+from ape import project
+
+from body_store import BlobStore, BodyIntegrityError, body_hash, read_proposal_body
+from hub_indexer import HubIndexer, HubStore
+
+BODY = "Plant more carrots. " * 200  # 4000 bytes
+
+
+def test_hashed_body_mode_commits_hash_and_emits_body(hub, accounts):
+    hub, bobu = hub
+    author = accounts[5]
+    with ape.reverts("bobu only"):
+        hub.setBodyMode(1, sender=author)
+
+    stored_gas = hub.createProposal("Stored", BODY, 0, 0, sender=author).gas_used
+    stored = hub.getProposals(0, 0, 1, True)[0]
+    assert hub.bodyHash(stored) == b"\x00" * 32
+
+    hub.setBodyMode(1, sender=bobu)
+    tx = hub.createProposal("Hashed", BODY, 0, 0, sender=author)
+    hashed = hub.getProposals(0, 0, 1, True)[0]
+    assert project.ProposalTemplate.at(hashed).body() == ""
+    assert hub.bodyHash(hashed).hex() == body_hash(BODY)[2:] and hub.bodyLength(hashed) == len(BODY)
+    [event] = tx.events.filter(hub.ProposalBody)
+    assert event.proposal == hashed and event.body == BODY
+
+    assert tx.gas_used * 2 < stored_gas, f"stored={stored_gas:,} hashed={tx.gas_used:,}"
+
+
+def test_blob_store_verifies_on_read(tmp_path):
+    store = BlobStore(str(tmp_path / "bodies"))
+    h = store.put(BODY)
+    assert h == body_hash(BODY) and store.has(h) and store.get(h) == BODY
+    assert store.get(body_hash("missing")) is None
+    with pytest.raises(BodyIntegrityError):
+        store.put("other", expected_hash=h)
+
+    with open(store._path(h), "wb") as f:
+        f.write(b"tampered")
+    with pytest.raises(BodyIntegrityError):
+        store.get(h)
+
+
+def test_read_proposal_body_and_indexer(hub, accounts, chain, tmp_path):
+    hub, bobu = hub
+    author = accounts[5]
+    start = chain.blocks.height
+    hub.createProposal("Stored", "on the template", 0, 0, sender=author)
+    stored = hub.getProposals(0, 0, 1, True)[0]
+    hub.setBodyMode(1, sender=bobu)
+    hub.createProposal("Hashed", BODY, 0, 0, sender=author)
+    hashed = hub.getProposals(0, 0, 1, True)[0]
+
+    blobs = BlobStore(str(tmp_path / "bodies"))
+    assert read_proposal_body(hub, stored, blobs) == "on the template"
+    # Miss: recovered from the ProposalBody event and cached
+    assert not blobs.has(body_hash(BODY))
+    assert read_proposal_body(hub, hashed, blobs) == BODY
+    assert blobs.has(body_hash(BODY))
+
+    # A corrupted cache entry is never served
+    with open(blobs._path(body_hash(BODY)), "wb") as f:
+        f.write(b"tampered")
+    with pytest.raises(BodyIntegrityError):
+        read_proposal_body(hub, hashed, blobs)
+    os.remove(blobs._path(body_hash(BODY)))
+
+    store = HubStore(str(tmp_path / "hub.sqlite"))
+    HubIndexer(hub.address, store, start_block=start, blob_store=blobs).sync()
+    row = store.get_proposal(hashed)
+    assert row["body"] == BODY and row["body_hash"] == body_hash(BODY)
+    assert store.get_proposal(stored)["body_hash"] is None
+    assert blobs.get(body_hash(BODY)) == BODY
@@ -0,0 +1,85 @@
+import ape
+import pytest
+from ape import project
+
+TOKEN_ID = 1
+
+
+@pytest.fixture(scope="function")
+def token(accounts):
+    return accounts[0].deploy(project.ERC1155)
+
+
+def _recipients(start, n):
+    return [f"0x{i:040x}" for i in range(start, start + n)]
+
+
+def test_mint_to_many_costs_a_fraction_of_single_mints(token, accounts):
+    owner = accounts[0]
+    n = 100
+    singles = sum(token.mint(r, TOKEN_ID, 1, b"", sender=owner).gas_used for r in _recipients(1_000, n))
+    airdrop = _recipients(2_000, n)
+    tx = token.mintToMany(airdrop, TOKEN_ID, 1, b"", sender=owner)
+
+    assert token.balanceOfBatch(airdrop, [TOKEN_ID] * n) == [1] * n
+    events = tx.events.filter(token.TransferSingle)
+    assert [e.to.lower() for e in events] == airdrop
+    assert {(e._from, e.id, e.amount) for e in events} == {("0x" + "00" * 20, TOKEN_ID, 1)}
+    assert tx.gas_used * 2 < singles, f"mint x{n}={singles:,} mintToMany={tx.gas_used:,}"
+
+    with ape.reverts("ERC1155: only owner can mint"):
+        token.mintToMany(airdrop[:1], TOKEN_ID, 1, b"", sender=accounts[1])
+    with ape.reverts("ERC1155: mint to the zero address"):
+        token.mintToMany([airdrop[0], "0x" + "00" * 20], TOKEN_ID, 1, b"", sender=owner)
+
+
+def test_batches_past_the_old_100_bound(token, accounts):
+    owner, alice, bob = accounts[0], accounts[1], accounts[2]
+    ids = list(range(1, 301))
+    token.mintBatch(alice.address, ids, [2] * 300, b"", sender=owner)
+    # Repeated ids in one batch accumulate
+    token.safeBatchTransferFrom(alice.address, bob.address, ids + [1], [1] * 301, b"", sender=alice)
+    assert token.balanceOfBatch([alice.address] * 300, ids) == [0] + [1] * 299
+    assert token.balanceOfBatch([bob.address] * 300, ids) == [2] + [1] * 299
+    with ape.reverts("ERC1155: insufficient balance for transfer"):
+        token.safeBatchTransferFrom(alice.address, bob.address, [2, 2], [1, 1], b"", sender=alice)
+
+
+def test_runs_of_a_repeated_id_touch_its_balance_once(token, accounts):
+    owner, alice, bob = accounts[0], accounts[1], accounts[2]
+    ids = list(range(1, 11))
+    token.mintBatch(alice.address, ids, [100] * 10, b"", sender=owner)
+    token.mintBatch(bob.address, ids, [100] * 10, b"", sender=owner)
+    runs = [i for i in ids for _ in range(5)]
+
+    # The 40 extra items repeat ids already in the batch: they add calldata
+    # and event bytes but no balance or checkpoint writes (~1.9k / ~2.8k
+    # gas per item when every item was debited and credited on its own)
+    mint_ids = token.mintBatch(alice.address, ids, [1] * 10, b"", sender=owner).gas_used
+    mint_runs = token.mintBatch(alice.address, runs, [1] * 50, b"", sender=owner).gas_used
+    move_ids = token.safeBatchTransferFrom(alice.address, bob.address, ids, [1] * 10, b"", sender=alice).gas_used
+    move_runs = token.safeBatchTransferFrom(alice.address, bob.address, runs, [1] * 50, b"", sender=alice).gas_used
+    assert mint_runs - mint_ids < 40 * 1_500, f"mintBatch 10 ids={mint_ids:,} 50 items={mint_runs:,}"
+    assert move_runs - move_ids < 40 * 1_500, f"safeBatchTransferFrom 10 ids={move_ids:,} 50 items={move_runs:,}"
+
+    assert token.balanceOfBatch([alice.address] * 10, ids) == [100] * 10
+    assert token.balanceOfBatch([bob.address] * 10, ids) == [106] * 10
+    # One checkpoint per block however many items touched the id
+    assert token.numCheckpoints(bob.address, 1) == 3
+
+
+def test_replacing_a_hook_without_the_callback_is_logged(token, accounts):
+    owner = accounts[0]
+    no_callback = owner.deploy(project.CommentTemplate)
+    token.setTransferHook(no_callback.address, sender=owner)
+    tx = token.setTransferHook("0x" + "00" * 20, sender=owner)
+    assert [e.hook for e in tx.events.filter(token.TransferHookFailed)] == [no_callback.address]
+    assert token.transferHook() == "0x" + "00" * 20
+
+
+def test_set_uri_emits_for_each_id(token, accounts):
+    owner = accounts[0]
+    tx = token.setURI("ipfs://meta/{id}", [1, 2, 7], sender=owner)
+    assert [(e.value, e.id) for e in tx.events.filter(token.URI)] == [("ipfs://meta/{id}", i) for i in (1, 2, 7)]
+    [event] = token.setURI("ipfs://v2/{id}", sender=owner).events.filter(token.URI)
+    assert event.id == 0 and token.uri(5) == "ipfs://v2/{id}"
@@ -0,0 +1,65 @@
+import ape
+import pytest
+from ape import project
+
+TOKEN_ID = 1
+
+
+@pytest.fixture(scope="function")
+def token(accounts):
+    return accounts[0].deploy(project.ERC1155)
+
+
+def test_balance_of_at_follows_history(token, accounts, chain):
+    owner, alice, bob = accounts[0], accounts[1], accounts[2]
+    before = chain.blocks.height
+    token.mint(alice.address, TOKEN_ID, 10, b"", sender=owner)
+    minted = chain.blocks.height
+    token.safeTransferFrom(alice.address, bob.address, TOKEN_ID, 4, b"", sender=alice)
+    moved = chain.blocks.height
+    token.safeBatchTransferFrom(alice.address, bob.address, [TOKEN_ID, TOKEN_ID], [1, 2], b"", sender=alice)
+    batched = chain.blocks.height
+    chain.mine(2)
+
+    assert [token.balanceOfAt(alice.address, TOKEN_ID, b) for b in (before, minted, moved, batched)] == [0, 10, 6, 3]
+    assert [token.balanceOfAt(bob.address, TOKEN_ID, b) for b in (before, minted, moved, batched)] == [0, 0, 4, 7]
+    # One checkpoint per block, even when a batch repeats the id
+    assert token.numCheckpoints(alice.address, TOKEN_ID) == 3
+    assert token.balanceOfAt(alice.address, TOKEN_ID + 1, batched) == 0
+    with ape.reverts("ERC1155: block not yet mined"):
+        token.balanceOfAt(alice.address, TOKEN_ID, chain.blocks.height + 1)
+
+
+def _snapshot_hub(deploy_hub, token):
+    hub, bobu = deploy_hub()
+    hub.setTokenRequirement(token.address, TOKEN_ID, sender=bobu)
+    hub.setVoteWeightMode(2, sender=bobu)
+    return hub
+
+
+def test_snapshot_vote_cost_is_logarithmic_in_history(token, deploy_hub, accounts, chain):
+    owner, author = accounts[0], accounts[5]
+
+    # Each voter gets n checkpoints (one mint per block) with the proposal's
+    # snapshot in the middle, so castVote runs the full binary search. A
+    # fresh hub per size keeps the leaderboard work identical; views are
+    # measured through castVote because estimate_gas_cost is too coarse.
+    costs = {}
+    for n, voter in ((4, accounts[6]), (64, accounts[7]), (512, accounts[8])):
+        hub = _snapshot_hub(deploy_hub, token)
+        for _ in range(n // 2):
+            token.mint(voter.address, TOKEN_ID, 1, b"", sender=owner)
+        now = chain.pending_timestamp
+        hub.createProposal(f"P{n}", "Body", now, now + 100_000, sender=author)
+        p = hub.getProposals(2, 0, 1, True)[0]
+        for _ in range(n // 2):
+            token.mint(voter.address, TOKEN_ID, 1, b"", sender=owner)
+        assert token.numCheckpoints(voter.address, TOKEN_ID) == n
+        receipt = hub.castVote(p, True, sender=voter)
+        assert project.ProposalTemplate.at(p).votesFor() == n // 2
+        costs[n] = receipt.gas_used
+
+    # Each doubling of the history adds one search step (a cold read);
+    # 4 -> 512 is 7 doublings
+    assert costs[4] <= costs[64] <= costs[512], costs
+    assert costs[512] - costs[4] < 7 * 5_000, costs
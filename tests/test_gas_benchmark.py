@@ -0,0 +1,46 @@
+import os
+
+from gas_benchmark import DEFAULT_BASELINE, compare, format_report, load_baseline, measure, populate
+from local_hub import deploy_hub
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "..", DEFAULT_BASELINE)
+# Local-chain gas is deterministic apart from timestamp calldata; leave room for that
+THRESHOLD = 0.02
+
+
+def test_compare_flags_only_regressions_above_threshold():
+    baseline = {"10": {"castVote": 100_000, "createProposal": 200_000, "removed": 1}}
+    current = {
+        "10": {"castVote": 104_000, "createProposal": 230_000, "new": 5},
+        "1000": {"castVote": 999_999},
+    }
+    regressions = compare(baseline, current, threshold=0.05)
+    assert [(r["size"], r["benchmark"]) for r in regressions] == [("10", "createProposal")]
+    assert regressions[0]["baseline"] == 200_000 and regressions[0]["current"] == 230_000
+    assert abs(regressions[0]["change"] - 0.15) < 1e-9
+    # Improvements never count as regressions
+    assert compare(current, baseline, threshold=0.0) == []
+
+
+def test_small_backlog_matches_recorded_baseline(accounts, chain):
+    baseline = load_baseline(BASELINE_PATH)
+    assert "10" in baseline, "record the baseline with GAS_BENCH_MODE=record"
+
+    hub, bobu = deploy_hub(accounts)
+    populate(hub, accounts[5], chain, 10)
+    current = {"10": measure(hub, bobu, accounts, chain)}
+
+    assert set(current["10"]) == set(baseline["10"])
+    assert all(gas > 0 for gas in current["10"].values())
+    assert compare(baseline, current, THRESHOLD) == [], format_report(baseline, current)
+
+
+def test_baseline_tiers_cover_the_same_benchmarks():
+    baseline = load_baseline(BASELINE_PATH)
+    assert sorted(baseline, key=int) == ["10", "1000"]
+    assert set(baseline["10"]) == set(baseline["1000"])
+    # Calldata-bound entry points do not depend on the backlog at all
+    for name in ("addComment clone 256B", "addComment light 256B", "createProposal title=128 body=4096"):
+        assert baseline["1000"][name] == baseline["10"][name], name
+    # A full page costs more than the handful of proposals a small backlog holds
+    assert baseline["1000"]["view getProposals ACTIVE page=100"] > baseline["10"]["view getProposals ACTIVE page=100"]
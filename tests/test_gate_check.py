@@ -0,0 +1,66 @@
+import csv
+
+import pytest
+from ape import project
+
+from gate_check import read_addresses, run
+
+TOKEN_ID = 1
+
+
+@pytest.fixture(scope="function")
+def gated_hub(hub, accounts):
+    hub, bobu = hub
+    token = accounts[0].deploy(project.ERC1155)
+    return hub, token, bobu
+
+
+class _CountingHub:
+    def __init__(self, hub):
+        self.hub = hub
+        self.calls = []
+
+    def hasTokenBatch(self, users):
+        self.calls.append(len(users))
+        return self.hub.hasTokenBatch(users)
+
+
+def test_has_token_batch_matches_has_token(gated_hub, accounts):
+    hub, token, bobu = gated_hub
+    users = [a.address for a in accounts[5:10]]
+    assert hub.hasTokenBatch(users) == [False] * 5  # no token configured
+
+    hub.setTokenRequirement(token.address, TOKEN_ID, sender=bobu)
+    token.mint(users[1], TOKEN_ID, 1, b"", sender=accounts[0])
+    token.mint(users[3], TOKEN_ID, 5, b"", sender=accounts[0])
+    token.mint(users[4], TOKEN_ID + 1, 1, b"", sender=accounts[0])
+    assert hub.hasTokenBatch(users) == [hub.hasToken(u) for u in users] == [False, True, False, True, False]
+    assert hub.hasTokenBatch([]) == []
+
+
+def test_gate_check_cli_streams_csv_in_chunks(gated_hub, accounts, tmp_path):
+    hub, token, bobu = gated_hub
+    hub.setTokenRequirement(token.address, TOKEN_ID, sender=bobu)
+    holder = accounts[5].address
+    token.mint(holder, TOKEN_ID, 1, b"", sender=accounts[0])
+
+    addresses = [f"0x{i:040x}" for i in range(1, 250)] + [holder.lower()]
+    src = tmp_path / "holders.csv"
+    src.write_text("label,address\n" + "".join(f"h{i},{a}\n" for i, a in enumerate(addresses)) + "\nbad,0x1234\n")
+    out = tmp_path / "out.csv"
+
+    counting = _CountingHub(hub)
+    counts = run(counting, str(src), str(out))
+    assert counting.calls == [100, 100, 50]
+    assert counts == {"true": 1, "false": 249, "invalid": 1}
+
+    rows = list(csv.reader(out.open()))
+    assert rows[0] == ["address", "eligible"]
+    assert rows[250] == [holder, "true"]
+    assert rows[-1] == ["0x1234", "invalid"]
+
+
+def test_read_addresses_only_skips_a_non_hex_header():
+    assert list(read_addresses(["label,address\n", "a,0x01\n"])) == ["0x01"]
+    # A malformed first address is a row, not a header
+    assert list(read_addresses(["0x1234\n", "0x01\n"])) == ["0x1234", "0x01"]
@@ -0,0 +1,121 @@
+import ape
+import pytest
+from ape import project
+
+STATE_ACTIVE = 2
+TOKEN_ID = 1
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+@pytest.fixture(scope="function")
+def gated_hub(hub, accounts):
+    hub, bobu = hub
+    token = accounts[0].deploy(project.ERC1155)
+    hub.setTokenRequirement(token.address, TOKEN_ID, sender=bobu)
+    hub.setGating(False, True, True, sender=bobu)
+    return hub, token, bobu
+
+
+def _active(hub, author, chain):
+    now = chain.pending_timestamp
+    hub.createProposal("P", "Body", now, now + 100_000, sender=author)
+    return hub.getProposals(STATE_ACTIVE, 0, 1, True)[0]
+
+
+def test_gate_cache_follows_transfers(gated_hub, accounts, chain):
+    hub, token, bobu = gated_hub
+    owner, author, alice, bob = accounts[0], accounts[5], accounts[6], accounts[7]
+    token.mint(alice.address, TOKEN_ID, 3, b"", sender=owner)
+
+    with ape.reverts("hook not registered"):
+        hub.setGateCache(True, sender=bobu)
+    token.setTransferHook(hub.address, sender=owner)
+    hub.setGateCache(True, sender=bobu)
+    assert hub.gateCacheEnabled()
+
+    # alice predates the cache: falls back to balanceOf until warmed
+    assert hub.hasToken(alice) and not hub.hasToken(bob)
+    hub.refreshGateCache([alice.address, bob.address], sender=bob)
+
+    # Transfers and mints reach the cache through the hook
+    token.safeTransferFrom(alice.address, bob.address, TOKEN_ID, 3, b"", sender=alice)
+    assert hub.hasToken(bob) and not hub.hasToken(alice)
+    p = _active(hub, author, chain)
+    with ape.reverts("token required to vote"):
+        hub.castVote(p, True, sender=alice)
+    hub.castVote(p, True, sender=bob)
+    token.mintBatch(alice.address, [TOKEN_ID, 7], [1, 1], b"", sender=owner)
+    hub.addComment(p, "back in", 1, sender=alice)
+
+    # Only the token can write to the cache
+    hub.onTokenTransfer(bob.address, alice.address, [TOKEN_ID], sender=alice)
+    assert hub.hasToken(bob)
+
+    # Pointing the gate at another token disables the cache, visibly
+    tx = hub.setTokenRequirement(token.address, 7, sender=bobu)
+    assert not hub.gateCacheEnabled()
+    assert [e.enabled for e in tx.events.filter(hub.GateCacheUpdated)] == [False]
+    assert hub.hasToken(alice) and not hub.hasToken(bob)
+
+
+def test_unhooking_the_token_disables_the_gate_cache(gated_hub, accounts, chain):
+    hub, token, bobu = gated_hub
+    owner, author, alice, bob = accounts[0], accounts[5], accounts[6], accounts[7]
+    token.mint(alice.address, TOKEN_ID, 1, b"", sender=owner)
+    token.setTransferHook(hub.address, sender=owner)
+    hub.setGateCache(True, sender=bobu)
+    hub.refreshGateCache([alice.address], sender=alice)
+    p = _active(hub, author, chain)
+
+    # Transfers made after the unhook never reach the cache; the stale
+    # entry must not let alice vote with a token she no longer holds
+    token.setTransferHook(ZERO_ADDRESS, sender=owner)
+    assert not hub.gateCacheEnabled()
+    token.safeTransferFrom(alice.address, bob.address, TOKEN_ID, 1, b"", sender=alice)
+    with ape.reverts("token required to vote"):
+        hub.castVote(p, True, sender=alice)
+    hub.castVote(p, True, sender=bob)
+
+    # Repointing the hook elsewhere disables it the same way
+    token.setTransferHook(hub.address, sender=owner)
+    hub.setGateCache(True, sender=bobu)
+    token.setTransferHook(author.address, sender=owner)
+    assert not hub.gateCacheEnabled()
+
+
+def test_a_reverting_hook_does_not_stop_token_movement(accounts):
+    owner, alice, bob = accounts[0], accounts[6], accounts[7]
+    token = owner.deploy(project.ERC1155)
+    broken = owner.deploy(project.CommentTemplate)  # no onTokenTransfer
+    token.setTransferHook(broken.address, sender=owner)
+
+    tx = token.mint(alice.address, TOKEN_ID, 2, b"", sender=owner)
+    assert [e.hook for e in tx.events.filter(token.TransferHookFailed)] == [broken.address]
+    token.safeTransferFrom(alice.address, bob.address, TOKEN_ID, 1, b"", sender=alice)
+    token.safeBatchTransferFrom(alice.address, bob.address, [TOKEN_ID], [1], b"", sender=alice)
+    token.mintToMany([alice.address, bob.address], TOKEN_ID, 1, b"", sender=owner)
+    assert token.balanceOfBatch([alice.address, bob.address], [TOKEN_ID] * 2) == [1, 3]
+
+
+def test_gate_cache_skips_balance_of_on_gated_actions(gated_hub, accounts, chain):
+    hub, token, bobu = gated_hub
+    owner, author = accounts[0], accounts[5]
+    voters = accounts[6:10]
+    for v in voters:
+        token.mint(v.address, TOKEN_ID, 1, b"", sender=owner)
+    p = _active(hub, author, chain)
+
+    # First vote/comment on the proposal pays for cold slots; measure after it
+    hub.castVote(p, True, sender=voters[0])
+    hub.addComment(p, "x", 1, sender=voters[0])
+    plain_vote = hub.castVote(p, True, sender=voters[1]).gas_used
+    plain_comment = hub.addComment(p, "x", 1, sender=voters[1]).gas_used
+
+    token.setTransferHook(hub.address, sender=owner)
+    hub.setGateCache(True, sender=bobu)
+    hub.refreshGateCache([v.address for v in voters[2:]], sender=owner)
+    cached_vote = hub.castVote(p, True, sender=voters[2]).gas_used
+    cached_comment = hub.addComment(p, "x", 1, sender=voters[2]).gas_used
+
+    assert cached_vote < plain_vote, f"castVote {plain_vote:,} -> cached {cached_vote:,}"
+    assert cached_comment < plain_comment, f"addComment {plain_comment:,} -> cached {cached_comment:,}"
@@ -0,0 +1,124 @@
+import ape
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+STATE_ACTIVE = 2
+STATE_CLOSED = 3
+
+
+def _create_active(hub, author, chain, n):
+    now = chain.pending_timestamp
+    created = []
+    for i in range(n):
+        hub.createProposal(f"P{i}", "Body", now, now + 100_000, sender=author)
+        created.append(hub.getProposals(STATE_ACTIVE, 0, 1, True)[0])
+    return created
+
+
+def test_leaderboard_tracks_votes_and_state_moves(hub, accounts, chain):
+    hub, bobu = hub
+    author, v1, v2, v3 = accounts[5], accounts[6], accounts[7], accounts[8]
+    assert hub.getTopActiveProposal() == ZERO_ADDRESS
+
+    p1, p2, p3 = _create_active(hub, author, chain, 3)
+    # Proposals without votes are not ranked
+    assert list(hub.getTopActiveProposals(10)) == []
+    assert hub.getTopActiveProposal() == ZERO_ADDRESS
+
+    hub.castVote(p3, True, sender=v1)
+    hub.castVote(p3, False, sender=v2)
+    hub.castVote(p2, True, sender=v1)
+    assert hub.totalVotes(p3) == 2 and hub.totalVotes(p2) == 1
+    assert list(hub.getTopActiveProposals(10)) == [p3, p2]
+    assert list(hub.getTopActiveProposals(1)) == [p3]
+    assert hub.getTopActiveProposal() == p3
+
+    # Leaving ACTIVE drops off the board; coming back re-enters by votes
+    hub.adminMoveState(p3, STATE_CLOSED, sender=bobu)
+    assert list(hub.getTopActiveProposals(10)) == [p2]
+    hub.castVote(p1, True, sender=v2)
+    hub.castVote(p1, True, sender=v3)
+    assert hub.getTopActiveProposal() == p1
+    # Ties keep the earliest entrant first
+    hub.adminMoveState(p3, STATE_ACTIVE, sender=bobu)
+    assert list(hub.getTopActiveProposals(10)) == [p1, p3, p2]
+
+
+def test_leaderboard_evicts_and_backfills_beyond_capacity(hub, accounts, chain):
+    hub, bobu = hub
+    author, voter = accounts[5], accounts[6]
+    ps = _create_active(hub, author, chain, 12)
+    for p in ps[:10]:
+        hub.castVote(p, True, sender=voter)
+    assert list(hub.getTopActiveProposals(10)) == ps[:10]
+    # One vote ties the board minimum: stays outside
+    hub.castVote(ps[10], True, sender=voter)
+    assert ps[10] not in hub.getTopActiveProposals(10)
+
+    # A second vote beats the minimum and evicts the last entry
+    hub.castVote(ps[10], False, sender=accounts[7])
+    board = list(hub.getTopActiveProposals(10))
+    assert board[0] == ps[10] and ps[9] not in board
+
+    # Freeing a slot refills it with the best outsider (ps[9]: 1 vote over ps[11]: 0)
+    hub.adminMoveState(ps[0], STATE_CLOSED, sender=bobu)
+    board = list(hub.getTopActiveProposals(10))
+    assert len(board) == 10 and board[-1] == ps[9]
+    # The keeper hook cannot push a zero-vote outsider onto a full board
+    hub.refreshLeaderboard([ps[11]], sender=accounts[9])
+    assert ps[11] not in hub.getTopActiveProposals(10)
+
+    # ps[11] ties the board minimum and waits outside; the next free slot is its
+    hub.castVote(ps[11], True, sender=voter)
+    assert ps[11] not in hub.getTopActiveProposals(10)
+    hub.adminMoveState(ps[1], STATE_CLOSED, sender=bobu)
+    board = list(hub.getTopActiveProposals(10))
+    assert len(board) == 10 and board[-1] == ps[11]
+    assert hub.getTopActiveProposal() == ps[10]
+
+
+def test_drained_board_refills_and_ignores_zero_votes(hub, accounts, chain):
+    hub, bobu = hub
+    author, v1, v2 = accounts[5], accounts[6], accounts[7]
+    ps = _create_active(hub, author, chain, 12)
+    # No votes yet: there is no top proposal
+    assert hub.getTopActiveProposal() == ZERO_ADDRESS
+
+    for p in ps[:10]:
+        hub.castVote(p, True, sender=v1)
+        hub.castVote(p, False, sender=v2)
+    hub.castVote(ps[10], True, sender=v1)
+    assert ps[10] not in hub.getTopActiveProposals(10)
+
+    # Closing every leader refills the board from the active set
+    for p in ps[:10]:
+        hub.adminMoveState(p, STATE_CLOSED, sender=bobu)
+    assert hub.getTopActiveProposal() == ps[10]
+    assert list(hub.getTopActiveProposals(10)) == [ps[10]]
+
+    # An outsider that passes a board member after a refill still ranks above it
+    hub.castVote(ps[11], True, sender=v1)
+    hub.castVote(ps[11], False, sender=v2)
+    assert list(hub.getTopActiveProposals(10)) == [ps[11], ps[10]]
+    hub.adminMoveState(ps[11], STATE_CLOSED, sender=bobu)
+    hub.adminMoveState(ps[10], STATE_CLOSED, sender=bobu)
+    assert hub.getTopActiveProposal() == ZERO_ADDRESS
+
+
+def test_stale_board_beyond_page_limit_reverts_until_refreshed(hub, accounts, chain):
+    hub, bobu = hub
+    author, v1, v2 = accounts[5], accounts[6], accounts[7]
+    ps = _create_active(hub, author, chain, 111)
+    for p in ps[:10]:
+        hub.castVote(p, True, sender=v1)
+        hub.castVote(p, False, sender=v2)
+    hub.castVote(ps[10], True, sender=v1)
+
+    # With more than PAGE_LIMIT active proposals the refill pass is skipped
+    for p in ps[:10]:
+        hub.adminMoveState(p, STATE_CLOSED, sender=bobu)
+    assert list(hub.getTopActiveProposals(10)) == []
+    with ape.reverts("leaderboard stale"):
+        hub.getTopActiveProposal()
+
+    hub.refreshLeaderboard([ps[10]], sender=accounts[9])
+    assert hub.getTopActiveProposal() == ps[10]
@@ -0,0 +1,77 @@
+import ape
+import pytest
+from ape import project
+
+COMMENT_DELETE_WINDOW = 14 * 86400
+
+
+@pytest.fixture(scope="function")
+def proposal(hub, accounts):
+    hub, _ = hub
+    hub.createProposal("Light", "Body", 0, 0, sender=accounts[5])
+    return hub.getProposals(0, 0, 1, True)[0]
+
+
+def test_light_comments_store_packed_record_and_emit_content(hub, proposal, accounts, chain):
+    hub, bobu = hub
+    a, b = accounts[6], accounts[7]
+    with ape.reverts("bobu only"):
+        hub.setCommentMode(1, sender=a)
+    hub.setCommentMode(1, sender=bobu)
+
+    tx = hub.addComment(proposal, "gm from the event log", 2, sender=a)
+    hub.addComment(proposal, "second", 4, sender=b)
+    [event] = tx.events.filter(hub.LightCommentAdded)
+    assert event.proposal == proposal and event.commentId == 0 and event.author == a.address
+    assert event.content == "gm from the event log" and event.sentiment == 2
+
+    assert hub.lightCommentCount(proposal) == 2 and hub.totalComments() == 2
+    # No clone was created
+    assert len(project.ProposalTemplate.at(proposal).getComments(0, 10, False)) == 0
+
+    first, second = hub.getLightComments(proposal, 0, 10, False)
+    assert (first.id, first.author, first.sentiment, first.deleted) == (0, a.address, 2, False)
+    assert first.createdAt == event.createdAt == chain.blocks[tx.block_number].timestamp
+    assert (second.id, second.author) == (1, b.address)
+    assert [c.id for c in hub.getLightComments(proposal, 0, 1, True)] == [1]
+
+    with ape.reverts("bad sentiment"):
+        hub.addComment(proposal, "x", 9, sender=a)
+
+
+def test_light_comment_admin_delete_window(hub, proposal, accounts, chain):
+    hub, bobu = hub
+    hub.setCommentMode(1, sender=bobu)
+    hub.addComment(proposal, "first", 1, sender=accounts[6])
+    hub.addComment(proposal, "second", 1, sender=accounts[6])
+
+    with ape.reverts("admin required"):
+        hub.adminDeleteLightComment(proposal, 0, sender=accounts[6])
+    with ape.reverts("unknown comment"):
+        hub.adminDeleteLightComment(proposal, 2, sender=bobu)
+
+    tx = hub.adminDeleteLightComment(proposal, 0, sender=bobu)
+    assert len(tx.events.filter(hub.LightCommentDeleted)) == 1
+    deleted, kept = hub.getLightComments(proposal, 0, 10, False)
+    assert deleted.deleted and deleted.author == accounts[6].address and deleted.sentiment == 1
+    assert not kept.deleted
+    # A second delete would look like another deletion to indexers
+    with ape.reverts("already deleted"):
+        hub.adminDeleteLightComment(proposal, 0, sender=bobu)
+
+    chain.pending_timestamp += COMMENT_DELETE_WINDOW + 1
+    with ape.reverts("window passed"):
+        hub.adminDeleteLightComment(proposal, 1, sender=bobu)
+
+
+def test_gas_clone_vs_light_comments(hub, proposal, accounts):
+    hub, bobu = hub
+    content = "x" * 512
+    # Warm-up: the first comment on a proposal pays extra first-write costs in both modes
+    hub.addComment(proposal, "warm", 1, sender=accounts[6])
+    clone_gas = hub.addComment(proposal, content, 1, sender=accounts[7]).gas_used
+    hub.setCommentMode(1, sender=bobu)
+    hub.addComment(proposal, "warm", 1, sender=accounts[6])
+    light_gas = hub.addComment(proposal, content, 1, sender=accounts[7]).gas_used
+
+    assert light_gas * 3 < clone_gas, f"clone={clone_gas:,} light={light_gas:,}"
@@ -0,0 +1,59 @@
+import ape
+from ape import project
+
+STATE_DRAFT = 0
+STATE_OPEN = 1
+
+
+def _walk(view, *args, page=4):
+    items, cursor = [], 0
+    while True:
+        batch, cursor = view(*args, cursor, page)
+        items.extend(batch)
+        if cursor == 0:
+            return items
+
+
+def test_state_lists_page_by_offset_and_cursor(hub, accounts):
+    hub, bobu = hub
+    author = accounts[5]
+    for i in range(10):
+        hub.createProposal(f"P{i}", "Body", 0, 0, sender=author)
+    drafts = list(hub.getProposals(STATE_DRAFT, 0, 100, False))
+    assert len(drafts) == hub.getProposalCountByState(STATE_DRAFT) == 10
+    assert list(hub.getProposals(STATE_DRAFT, 0, 100, True)) == drafts[::-1]
+    assert list(hub.getProposals(STATE_DRAFT, 8, 100, False)) == drafts[8:]
+    assert list(hub.getProposals(STATE_DRAFT, 10, 100, False)) == []
+
+    page, cursor = hub.getProposalsByCursor(STATE_DRAFT, 0, 4)
+    assert list(page) == drafts[:4] and cursor == 4
+    assert _walk(hub.getProposalsByCursor, STATE_DRAFT) == drafts
+    assert list(hub.getProposalsByCursor(STATE_DRAFT, 10, 4)[0]) == []
+    assert list(hub.getProposalsByCursor(STATE_OPEN, 0, 4)[0]) == []
+
+    # Swap-and-pop keeps indexes dense; a re-appended proposal goes to the tail
+    hub.adminMoveState(drafts[0], STATE_OPEN, sender=bobu)
+    assert _walk(hub.getProposalsByCursor, STATE_DRAFT) == [drafts[9]] + drafts[1:9]
+    hub.adminMoveState(drafts[0], STATE_DRAFT, sender=bobu)
+    assert _walk(hub.getProposalsByCursor, STATE_DRAFT) == [drafts[9]] + drafts[1:9] + [drafts[0]]
+    assert hub.getProposalCountByState(STATE_OPEN) == 0
+    with ape.reverts("bad state"):
+        hub.getProposalsByCursor(4, 0, 4)
+
+
+def test_comment_list_pages_by_offset_and_cursor(hub, accounts):
+    hub, _ = hub
+    author = accounts[5]
+    hub.createProposal("Comments", "Body", 0, 0, sender=author)
+    proposal = project.ProposalTemplate.at(hub.getProposals(STATE_DRAFT, 0, 1, False)[0])
+    assert proposal.commentCount() == 0 and _walk(proposal.getCommentsByCursor) == []
+
+    for i in range(6):
+        hub.addComment(proposal.address, f"c{i}", 1, sender=accounts[6 + i])
+    comments = list(proposal.getComments(0, 100, False))
+    assert proposal.commentCount() == 6
+    assert [proposal.comments(i) for i in range(6)] == comments
+    assert list(proposal.getComments(1, 2, True)) == [comments[4], comments[3]]
+    assert _walk(proposal.getCommentsByCursor) == comments
+    with ape.reverts("index out of range"):
+        proposal.comments(6)
@@ -0,0 +1,148 @@
+import ape
+import pytest
+from ape import project
+
+STATE_ACTIVE = 2
+TOKEN_ID = 1
+
+
+@pytest.fixture(scope="function")
+def token(accounts, hub):
+    hub, bobu = hub
+    deployer = accounts[0]
+    token = deployer.deploy(project.ERC1155)
+    hub.setTokenRequirement(token.address, TOKEN_ID, sender=bobu)
+    return token
+
+
+def _create_active(hub, author, chain, n):
+    now = chain.pending_timestamp
+    created = []
+    for i in range(n):
+        hub.createProposal(f"P{i}", "Body", now, now + 100_000, sender=author)
+        created.append(hub.getProposals(STATE_ACTIVE, 0, 1, True)[0])
+    return created
+
+
+def test_cast_votes_batch(hub, accounts, chain, project):
+    hub, _ = hub
+    author, voter = accounts[5], accounts[6]
+    ps = _create_active(hub, author, chain, 3)
+
+    hub.castVotes(ps, [True, False, True], sender=voter)
+    tallies = [(project.ProposalTemplate.at(p).votesFor(), project.ProposalTemplate.at(p).votesAgainst()) for p in ps]
+    assert tallies == [(1, 0), (0, 1), (1, 0)]
+    assert [hub.totalVotes(p) for p in ps] == [1, 1, 1]
+    assert hub.uniqueUsers() == 2
+
+    # Any invalid entry reverts the whole ballot
+    with ape.reverts("already voted"):
+        hub.castVotes([ps[0]], [True], sender=voter)
+    with ape.reverts("unknown proposal"):
+        hub.castVotes([ps[1], author.address], [True, True], sender=accounts[7])
+    assert hub.totalVotes(ps[1]) == 1
+    with ape.reverts("length mismatch"):
+        hub.castVotes(ps, [True], sender=accounts[7])
+    with ape.reverts("empty ballot"):
+        hub.castVotes([], [], sender=accounts[7])
+
+    hub.createProposal("Draft", "Body", 0, 0, sender=author)
+    draft = hub.getProposals(0, 0, 1, True)[0]
+    with ape.reverts("no voting window"):
+        hub.castVotes([draft], [True], sender=accounts[7])
+
+
+def test_token_weighted_votes(hub, token, accounts, chain, project):
+    hub, bobu = hub
+    author, whale, holder, nobody = accounts[5], accounts[6], accounts[7], accounts[8]
+    token.mint(whale.address, TOKEN_ID, 25, b"", sender=accounts[0])
+    token.mint(holder.address, TOKEN_ID, 2, b"", sender=accounts[0])
+    p1, p2 = _create_active(hub, author, chain, 2)
+
+    with ape.reverts("bobu only"):
+        hub.setVoteWeightMode(1, sender=author)
+    with ape.reverts("bad mode"):
+        hub.setVoteWeightMode(7, sender=bobu)
+    hub.setVoteWeightMode(1, sender=bobu)
+    assert hub.voteWeightMode() == 1
+
+    hub.castVotes([p1, p2], [True, False], sender=whale)
+    hub.castVote(p1, False, sender=holder)
+    t1 = project.ProposalTemplate.at(p1)
+    assert (t1.votesFor(), t1.votesAgainst()) == (25, 2)
+    assert hub.totalVotes(p1) == 27 and hub.totalVotes(p2) == 25
+    assert hub.getTopActiveProposal() == p1
+
+    with ape.reverts("no voting weight"):
+        hub.castVote(p1, True, sender=nobody)
+
+    # Back to one address = one vote; the gate still applies independently
+    hub.setVoteWeightMode(0, sender=bobu)
+    hub.setGating(False, False, True, sender=bobu)
+    with ape.reverts("token required to vote"):
+        hub.castVote(p2, True, sender=nobody)
+    hub.castVote(p2, True, sender=holder)
+    assert hub.totalVotes(p2) == 26
+
+
+def test_gas_single_vs_batch_votes(hub, token, accounts, chain):
+    hub, bobu = hub
+    author, single_voter, batch_voter = accounts[5], accounts[6], accounts[7]
+    token.mint(single_voter.address, TOKEN_ID, 1, b"", sender=accounts[0])
+    token.mint(batch_voter.address, TOKEN_ID, 1, b"", sender=accounts[0])
+    hub.setGating(False, False, True, sender=bobu)
+    n = 10
+    # Separate proposals so neither path benefits from the other's storage writes
+    ps = _create_active(hub, author, chain, 2 * n)
+    singles, batch = ps[:n], ps[n:]
+
+    single_gas = sum(hub.castVote(p, True, sender=single_voter).gas_used for p in singles)
+    batch_gas = hub.castVotes(batch, [True] * n, sender=batch_voter).gas_used
+
+    # Each single tx pays the 21k base cost plus its own gate balanceOf
+    assert batch_gas < single_gas - (n - 1) * 21_000, f"single={single_gas:,} batch={batch_gas:,}"
+
+
+def test_snapshot_weighted_votes_ignore_mid_vote_transfers(hub, token, accounts, chain, project):
+    hub, bobu = hub
+    author, whale, friend, nobody = accounts[5], accounts[6], accounts[7], accounts[8]
+    token.mint(whale.address, TOKEN_ID, 25, b"", sender=accounts[0])
+    [legacy] = _create_active(hub, author, chain, 1)
+
+    hub.setVoteWeightMode(2, sender=bobu)
+    [p] = _create_active(hub, author, chain, 1)
+    assert hub.createdBlock(p) > 0 and hub.createdBlock(legacy) == 0
+
+    # Moving tokens after creation does not let them vote twice
+    hub.castVote(p, True, sender=whale)
+    token.safeTransferFrom(whale.address, friend.address, TOKEN_ID, 25, b"", sender=whale)
+    with ape.reverts("no voting weight"):
+        hub.castVote(p, True, sender=friend)
+    with ape.reverts("no voting weight"):
+        hub.castVote(p, True, sender=nobody)
+    assert project.ProposalTemplate.at(p).votesFor() == 25
+
+    # Proposals created before snapshot mode fall back to the live balance
+    hub.castVote(legacy, False, sender=friend)
+    assert project.ProposalTemplate.at(legacy).votesAgainst() == 25
+
+
+def test_snapshot_mode_requires_a_token_with_balance_of_at(hub, accounts, project):
+    hub, bobu = hub
+    with ape.reverts("no token"):
+        hub.setVoteWeightMode(2, sender=bobu)
+
+    # A contract without balanceOfAt, and an address with no code at all
+    for not_snapshot in (accounts[0].deploy(project.CommentTemplate).address, accounts[9].address):
+        hub.setTokenRequirement(not_snapshot, TOKEN_ID, sender=bobu)
+        with ape.reverts("token lacks balanceOfAt"):
+            hub.setVoteWeightMode(2, sender=bobu)
+    assert hub.voteWeightMode() == 0
+
+    # Once on, the token cannot be swapped for one that would break votes
+    token = accounts[0].deploy(project.ERC1155)
+    hub.setTokenRequirement(token.address, TOKEN_ID, sender=bobu)
+    hub.setVoteWeightMode(2, sender=bobu)
+    with ape.reverts("token lacks balanceOfAt"):
+        hub.setTokenRequirement(accounts[9].address, TOKEN_ID, sender=bobu)
+    assert hub.tokenContract1155() == token.address
@@ -0,0 +1,63 @@
+import ape
+
+HOUR = 3600
+STATE_OPEN = 1
+STATE_ACTIVE = 2
+
+
+def _boundaries(hub, start, end, page_cursor=0):
+    items, cursor = hub.getWindowBoundaries(start, end, page_cursor)
+    return [(b.proposal, b.timestamp, b.isEnd, b.state) for b in items], cursor
+
+
+def test_window_index_returns_current_boundaries_in_range(hub, accounts, chain):
+    hub, bobu = hub
+    author = accounts[5]
+    base = (chain.pending_timestamp // HOUR + 10) * HOUR
+    # Off by default: nothing is indexed
+    hub.createProposal("Unindexed", "Body", base + 20, base + 30, sender=author)
+    assert hub.windowBucketLength(base // HOUR) == 0
+    hub.setWindowIndex(True, sender=bobu)
+    hub.createProposal("A", "Body", base + 10, base + 2 * HOUR, sender=author)
+    hub.createProposal("B", "Body", base + HOUR + 5, base + 5 * HOUR, sender=author)
+    hub.createProposal("Draft", "Body", 0, 0, sender=author)
+    _, a, b = hub.getProposals(STATE_OPEN, 0, 3, False)
+    assert hub.windowBucketLength(base // HOUR) == 1
+    assert hub.windowBucketLength(base // HOUR + 2) == 1
+
+    items, cursor = _boundaries(hub, base, base + 2 * HOUR)
+    assert cursor == 0
+    assert items == [
+        (a, base + 10, False, STATE_OPEN),
+        (b, base + HOUR + 5, False, STATE_OPEN),
+        (a, base + 2 * HOUR, True, STATE_OPEN),
+    ]
+    # Range edges are exact timestamps, not whole buckets
+    assert _boundaries(hub, base + 11, base + HOUR + 5)[0] == [(b, base + HOUR + 5, False, STATE_OPEN)]
+    assert _boundaries(hub, base + 6 * HOUR, base + 7 * HOUR) == ([], 0)
+
+    # Moving a window drops its old boundaries from results
+    now = chain.pending_timestamp
+    hub.setVotingWindow(a, now, base + 3 * HOUR, sender=author)
+    items, _ = _boundaries(hub, base, base + 3 * HOUR)
+    assert items == [(b, base + HOUR + 5, False, STATE_OPEN), (a, base + 3 * HOUR, True, STATE_ACTIVE)]
+
+    with ape.reverts("bad range"):
+        hub.getWindowBoundaries(base + 1, base, 0)
+    with ape.reverts("range too wide"):
+        hub.getWindowBoundaries(base, base + 168 * HOUR, 0)
+
+
+def test_window_index_pages_with_cursor(hub, accounts, chain):
+    hub, bobu = hub
+    author = accounts[5]
+    hub.setWindowIndex(True, sender=bobu)
+    base = (chain.pending_timestamp // HOUR + 10) * HOUR
+    for i in range(60):
+        hub.createProposal(f"P{i}", "Body", base + i, base + HOUR + i, sender=author)
+
+    items, cursor = _boundaries(hub, base, base + 2 * HOUR)
+    assert len(items) == 100 and cursor == 100
+    rest, cursor = _boundaries(hub, base, base + 2 * HOUR, cursor)
+    assert len(rest) == 20 and cursor == 0
+    assert [t for _, t, _, _ in items + rest] == [base + i for i in range(60)] + [base + HOUR + i for i in range(60)]
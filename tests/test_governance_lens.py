@@ -0,0 +1,65 @@
+import pytest
+from ape import project
+
+from proposal_lens import decode_summaries, fetch_proposal_summaries, fetch_summaries
+
+
+@pytest.fixture(scope="function")
+def hub_and_lens(hub, accounts):
+    hub, bobu = hub
+    lens = accounts[0].deploy(project.GovernanceLens)
+    return hub, lens, bobu
+
+
+def test_lens_empty_state_returns_empty_page(hub_and_lens):
+    hub, lens, _ = hub_and_lens
+    assert fetch_proposal_summaries(lens, hub.address, 0) == []
+    assert lens.getProposalSummaries(hub.address, 3, 0, 10, True) == []
+
+
+def test_lens_page_matches_per_field_reads(hub_and_lens, accounts, chain):
+    hub, lens, _ = hub_and_lens
+    a, b, voter = accounts[5], accounts[6], accounts[7]
+
+    now = chain.pending_timestamp
+    hub.createProposal("Active one", "Body A", now, now + 1000, sender=a)
+    hub.createProposal("Active two", "Body B", now, now + 2000, sender=b)
+    first, second = hub.getProposals(2, 0, 10, False)
+    hub.castVote(second, True, sender=voter)
+    hub.castVote(first, False, sender=a)
+
+    summaries = fetch_proposal_summaries(lens, hub.address, 2, 0, 10, reverse=False)
+    assert [s.proposal for s in summaries] == [first, second]
+
+    for s in summaries:
+        p = project.ProposalTemplate.at(s.proposal)
+        assert s.title == p.title()
+        assert s.author == p.author()
+        assert s.created_at == p.createdAt()
+        assert s.vote_start == p.voteStart()
+        assert s.vote_end == p.voteEnd()
+        assert s.votes_for == p.votesFor()
+        assert s.votes_against == p.votesAgainst()
+
+    assert summaries[0].votes_against == 1 and summaries[1].votes_for == 1
+
+    # Reverse paging mirrors getProposals
+    newest = fetch_proposal_summaries(lens, hub.address, 2, 0, 1, reverse=True)
+    assert [s.proposal for s in newest] == [second]
+
+
+def test_lens_explicit_list_and_raw_decode(hub_and_lens, accounts):
+    hub, lens, _ = hub_and_lens
+    author = accounts[5]
+    for i in range(3):
+        hub.createProposal(f"Draft {i}", "Body", 0, 0, sender=author)
+    drafts = list(hub.getProposals(0, 0, 10, False))
+
+    summaries = fetch_summaries(lens, drafts)
+    assert [s.title for s in summaries] == ["Draft 0", "Draft 1", "Draft 2"]
+
+    calldata = lens.getProposalSummaries.encode_input(hub.address, 0, 0, 10, False)
+    raw = lens.provider.send_call(
+        lens.provider.network.ecosystem.create_transaction(receiver=lens.address, data=calldata)
+    )
+    assert decode_summaries(raw) == fetch_proposal_summaries(lens, hub.address, 0, 0, 10, reverse=False)
@@ -0,0 +1,106 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from hub_api import ResponseCache, serve
+from hub_indexer import HubIndexer, HubStore
+
+
+@pytest.fixture(scope="function")
+def api(hub, chain, tmp_path):
+    hub, _ = hub
+    store = HubStore(str(tmp_path / "hub.sqlite"))
+    indexer = HubIndexer(hub.address, store, start_block=chain.blocks.height)
+    cache = ResponseCache(max_entries=32, ttl=60)
+    server = serve(store, port=0, cache=cache)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    yield base, indexer, cache
+    server.shutdown()
+    server.server_close()
+    store.close()
+
+
+def _get(url, etag=None):
+    req = urllib.request.Request(url, headers={"If-None-Match": etag} if etag else {})
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, resp.headers.get("ETag"), json.loads(resp.read() or b"null")
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        return e.code, e.headers.get("ETag"), json.loads(body) if body else None
+
+
+def test_api_serves_lists_detail_and_comments(hub, api, accounts, chain):
+    hub, _ = hub
+    base, indexer, _ = api
+    author, commenter, voter = accounts[5], accounts[6], accounts[7]
+    now = chain.pending_timestamp
+    hub.createProposal("Fund the farm", "x" * 4096, now, now + 1000, sender=author)
+    hub.createProposal("Second", "Body", now, now + 1000, sender=author)
+    first = hub.getProposals(2, 0, 1, False)[0]
+    hub.addComment(first, "Love it", 1, sender=commenter)
+    hub.addComment(first, "Hate it", 2, sender=voter)
+    hub.castVote(first, True, sender=voter)
+    indexer.sync()
+
+    status, _, page = _get(f"{base}/proposals?state=2&count=1&reverse=true")
+    assert status == 200
+    assert page["total"] == 2 and [p["title"] for p in page["items"]] == ["Second"]
+    assert "body" not in page["items"][0]
+
+    status, _, detail = _get(f"{base}/proposals/{first.lower()}")
+    assert status == 200
+    assert detail["body"] == "x" * 4096
+    assert detail["tally"] == {"votesFor": 1, "votesAgainst": 0, "voters": 1}
+    assert [c["content"] for c in detail["comments"]] == ["Love it", "Hate it"]
+    assert detail["bodyHash"] is None
+    assert _get(f"{base}/proposals/{first}/body")[2] == {"proposal": first, "body": "x" * 4096, "bodyHash": None}
+
+    _, _, comments = _get(f"{base}/proposals/{first}/comments?offset=1&count=1")
+    assert comments["total"] == 2 and [c["content"] for c in comments["items"]] == ["Hate it"]
+
+    _, _, votes = _get(f"{base}/proposals/{first}/votes")
+    assert votes["items"] == [{"voter": voter.address, "support": True, "weight": 1}]
+
+    assert _get(f"{base}/proposals/0x{'11' * 20}")[0] == 404
+    assert _get(f"{base}/proposals/not-an-address")[0] == 400
+    assert _get(f"{base}/proposals?state=9")[0] == 400
+
+
+def test_api_etag_and_cache_invalidation(hub, api, accounts):
+    hub, _ = hub
+    base, indexer, cache = api
+    author = accounts[5]
+    hub.createProposal("One", "Body", 0, 0, sender=author)
+    indexer.sync()
+
+    status, etag, page = _get(f"{base}/proposals?state=0")
+    assert status == 200 and etag and len(page["items"]) == 1
+    hits = cache.hits
+    assert _get(f"{base}/proposals?state=0", etag)[0] == 304
+    assert cache.hits == hits + 1
+
+    # A sync changes the data version, so the cached page is not reused
+    hub.createProposal("Two", "Body", 0, 0, sender=author)
+    indexer.sync()
+    status, new_etag, page = _get(f"{base}/proposals?state=0", etag)
+    assert status == 200 and new_etag != etag
+    assert [p["title"] for p in page["items"]] == ["One", "Two"]
+
+
+def test_response_cache_lru_and_ttl():
+    now = [0.0]
+    cache = ResponseCache(max_entries=2, ttl=10, clock=lambda: now[0])
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None and cache.get("a") == 1 and cache.get("c") == 3
+
+    now[0] = 10.0
+    assert cache.get("a") is None and len(cache) == 1
@@ -0,0 +1,171 @@
+import pytest
+
+from hub_indexer import HubIndexer, HubStore, is_range_error, light_comment_key
+
+
+def test_indexer_materializes_proposals_comments_votes(hub, accounts, chain, tmp_path):
+    hub, bobu = hub
+    author, commenter, voter = accounts[5], accounts[6], accounts[7]
+    start = chain.blocks.height
+
+    now = chain.pending_timestamp
+    hub.createProposal("Fund the farm", "Plant more carrots", 0, 0, sender=author)
+    hub.createProposal("Vote now", "Active window body", now, now + 1000, sender=author)
+    draft = hub.getProposals(0, 0, 1, False)[0]
+    active = hub.getProposals(2, 0, 1, False)[0]
+
+    hub.addComment(draft, "Love it", 1, sender=commenter)
+    hub.castVote(active, True, sender=voter)
+    hub.castVote(active, False, sender=commenter)
+    hub.adminMoveState(draft, 1, sender=bobu)
+
+    store = HubStore(str(tmp_path / "hub.sqlite"))
+    indexer = HubIndexer(hub.address, store, start_block=start)
+    assert indexer.sync() > 0
+
+    assert store.count_by_state() == {0: 0, 1: 1, 2: 1, 3: 0}
+    [opened] = store.list_proposals(1)
+    assert opened["address"] == draft
+    assert opened["body"] == "Plant more carrots"
+    assert opened["comment_count"] == 1
+
+    [row] = store.list_proposals(2)
+    assert row["vote_start"] == now and row["vote_end"] == now + 1000
+    assert store.vote_tally(active) == {"votesFor": 1, "votesAgainst": 1, "voters": 2}
+
+    [comment] = store.list_comments(draft)
+    assert comment["content"] == "Love it" and comment["sentiment"] == 1 and comment["deleted"] == 0
+
+    assert [p["address"] for p in store.search_proposals("carrots")] == [draft]
+    assert store.search_proposals("nothing like this") == []
+
+
+def test_indexer_resumes_from_checkpoint(hub, accounts, chain, tmp_path):
+    hub, bobu = hub
+    author = accounts[5]
+    start = chain.blocks.height
+    db = str(tmp_path / "hub.sqlite")
+
+    hub.createProposal("First", "Body", 0, 0, sender=author)
+    store = HubStore(db)
+    HubIndexer(hub.address, store, start_block=start).sync()
+    first_checkpoint = store.last_block
+    store.close()
+
+    hub.createProposal("Second", "Body", 0, 0, sender=author)
+    p = hub.getProposals(0, 0, 1, True)[0]
+    hub.setVotingWindow(p, chain.pending_timestamp + 500, chain.pending_timestamp + 900, sender=author)
+
+    store = HubStore(db)
+    indexer = HubIndexer(hub.address, store, start_block=start)
+    assert store.last_block == first_checkpoint
+    indexer.sync()
+    assert store.last_block == chain.blocks.height
+    assert [r["title"] for r in store.list_proposals(0)] == ["First"]
+    [opened] = store.list_proposals(1)
+    assert opened["title"] == "Second" and opened["vote_start"] > 0
+
+    # Nothing new: a second sync is a no-op
+    assert indexer.sync() == 0
+
+
+def test_indexer_adapts_range_on_provider_errors(hub, accounts, chain, tmp_path):
+    hub, _ = hub
+    author = accounts[5]
+    start = chain.blocks.height
+    for i in range(6):
+        hub.createProposal(f"P{i}", "Body", 0, 0, sender=author)
+
+    store = HubStore(str(tmp_path / "hub.sqlite"))
+    indexer = HubIndexer(hub.address, store, start_block=start, range_size=64)
+    real_get_logs = indexer._get_logs
+    spans = []
+
+    def capped_get_logs(from_block, to_block):
+        # Simulate a provider that rejects ranges wider than 2 blocks
+        if to_block - from_block + 1 > 2:
+            raise ValueError("query returned more than 10000 results")
+        spans.append(to_block - from_block + 1)
+        return real_get_logs(from_block, to_block)
+
+    indexer._get_logs = capped_get_logs
+    indexer.sync()
+    assert max(spans) <= 2
+    assert store.count_by_state()[0] == 6
+
+    # Anything that is not a range/result cap is raised, not retried with smaller ranges
+    def failing_get_logs(from_block, to_block):
+        raise ValueError("401 Client Error: Unauthorized")
+
+    hub.createProposal("Later", "Body", 0, 0, sender=author)
+    indexer._get_logs = failing_get_logs
+    range_before = indexer.range_size
+    with pytest.raises(ValueError, match="Unauthorized"):
+        indexer.sync()
+    assert indexer.range_size == range_before
+    assert is_range_error(ValueError({"code": -32005, "message": "limit exceeded"}))
+    assert is_range_error(ValueError("Log response size exceeded."))
+    assert not is_range_error(ValueError("exceeded rate limit"))
+
+
+def test_indexer_only_fetches_logs_of_the_hub_and_its_proposals(hub, deploy_hub, accounts, chain, tmp_path):
+    hub, _ = hub
+    author, voter = accounts[5], accounts[6]
+    other, _ = deploy_hub()
+    start = chain.blocks.height
+    now = chain.pending_timestamp
+    for h in (hub, other):
+        h.createProposal("Vote", "Body", now, now + 1000, sender=author)
+        h.castVote(h.getProposals(2, 0, 1, False)[0], True, sender=voter)
+    mine = hub.getProposals(2, 0, 1, False)[0]
+
+    store = HubStore(str(tmp_path / "hub.sqlite"))
+    indexer = HubIndexer(hub.address, store, start_block=start)
+    real_get_logs = indexer._get_logs
+    fetched = []
+
+    def recording_get_logs(from_block, to_block):
+        logs = real_get_logs(from_block, to_block)
+        fetched.extend(logs)
+        return logs
+
+    indexer._get_logs = recording_get_logs
+    eth = indexer.provider.web3.eth
+    real_eth_get_logs = eth.get_logs
+    requests = []
+
+    def counting_eth_get_logs(params):
+        requests.append(params)
+        return real_eth_get_logs(params)
+
+    eth.get_logs = counting_eth_get_logs
+    try:
+        indexer.sync()
+    finally:
+        del eth.get_logs
+    # The vote in the page that created the proposal is picked up; the other hub's are dropped
+    assert {log["address"] for log in fetched} == {hub.address, mine}
+    # Two requests per page, however many proposals are known
+    assert len(requests) == 2 and "address" not in requests[1]
+    assert store.vote_tally(mine) == {"votesFor": 1, "votesAgainst": 0, "voters": 1}
+
+
+def test_indexer_materializes_light_comments(hub, accounts, chain, tmp_path):
+    hub, bobu = hub
+    author, commenter = accounts[5], accounts[6]
+    start = chain.blocks.height
+    hub.createProposal("Light", "Body", 0, 0, sender=author)
+    p = hub.getProposals(0, 0, 1, False)[0]
+    hub.setCommentMode(1, sender=bobu)
+    hub.addComment(p, "only in the log", 3, sender=commenter)
+    hub.addComment(p, "soon gone", 2, sender=commenter)
+    hub.adminDeleteLightComment(p, 1, sender=bobu)
+
+    store = HubStore(str(tmp_path / "hub.sqlite"))
+    HubIndexer(hub.address, store, start_block=start).sync()
+    first, second = store.list_comments(p)
+    assert first["address"] == light_comment_key(p, 0)
+    assert (first["content"], first["sentiment"], first["deleted"]) == ("only in the log", 3, 0)
+    assert first["created_at"] > 0
+    assert second["deleted"] == 1 and second["deleted_by"] == bobu.address
+    assert store.get_proposal(p)["comment_count"] == 2
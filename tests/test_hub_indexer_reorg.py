@@ -0,0 +1,79 @@
+import pytest
+
+from hub_indexer import HubIndexer, HubStore, ReorgTooDeep
+
+
+def test_indexer_rolls_back_orphaned_blocks(hub, accounts, chain, tmp_path):
+    hub, bobu = hub
+    author, commenter, voter = accounts[5], accounts[6], accounts[7]
+    start = chain.blocks.height
+
+    now = chain.pending_timestamp
+    hub.createProposal("Canonical", "Body", now, now + 1000, sender=author)
+    kept = hub.getProposals(2, 0, 1, False)[0]
+    store = HubStore(str(tmp_path / "hub.sqlite"))
+    indexer = HubIndexer(hub.address, store, start_block=start)
+    indexer.sync()
+    fork_point = store.last_block
+
+    # Snapshot = fork point; everything after it is indexed, then orphaned
+    snapshot = chain.snapshot()
+    hub.createProposal("Orphan", "Body", 0, 0, sender=author)
+    orphan = hub.getProposals(0, 0, 1, False)[0]
+    hub.castVote(kept, True, sender=voter)
+    hub.addComment(kept, "Gone soon", 1, sender=commenter)
+    hub.adminMoveState(kept, 1, sender=bobu)
+    indexer.sync()
+    assert store.has_proposal(orphan)
+    assert store.get_proposal(kept)["state"] == 1
+    assert store.vote_tally(kept)["votesFor"] == 1
+
+    # Replace the orphaned blocks with a different canonical history
+    chain.restore(snapshot)
+    hub.castVote(kept, False, sender=commenter)
+    hub.castVote(kept, False, sender=voter)
+    chain.mine(3)
+
+    assert indexer.check_reorg() == fork_point
+    indexer.sync()
+    assert not store.has_proposal(orphan)
+    assert store.count_by_state() == {0: 0, 1: 0, 2: 1, 3: 0}
+    row = store.get_proposal(kept)
+    assert row["state"] == 2 and row["comment_count"] == 0
+    assert store.list_comments(kept) == []
+    assert store.vote_tally(kept) == {"votesFor": 0, "votesAgainst": 2, "voters": 2}
+    assert store.last_block == chain.blocks.height
+
+    # Checkpoints now agree with the chain
+    assert indexer.check_reorg() is None
+
+
+def test_indexer_keeps_only_confirmation_window_hashes(hub, accounts, chain, tmp_path):
+    hub, _ = hub
+    author = accounts[5]
+    start = chain.blocks.height
+    hub.createProposal("P", "Body", 0, 0, sender=author)
+    chain.mine(10)
+
+    store = HubStore(str(tmp_path / "hub.sqlite"))
+    HubIndexer(hub.address, store, start_block=start, confirmations=4).sync()
+    head = chain.blocks.height
+    assert [n for n, _ in store.checkpoints()] == list(range(head, head - 5, -1))
+
+
+def test_indexer_raises_when_reorg_exceeds_window(hub, accounts, chain, tmp_path):
+    hub, _ = hub
+    author = accounts[5]
+    snapshot = chain.snapshot()
+    start = chain.blocks.height
+    hub.createProposal("P", "Body", 0, 0, sender=author)
+    chain.mine(5)
+
+    store = HubStore(str(tmp_path / "hub.sqlite"))
+    indexer = HubIndexer(hub.address, store, start_block=start, confirmations=2)
+    indexer.sync()
+
+    chain.restore(snapshot)
+    chain.mine(8)
+    with pytest.raises(ReorgTooDeep):
+        indexer.sync()
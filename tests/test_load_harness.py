@@ -0,0 +1,34 @@
+from load_harness import PAGE_LIMIT, format_report, run
+
+
+def test_small_fill_reports_every_checkpoint(accounts):
+    report = run(accounts, proposals=130, comments=25, checkpoints=(20, 100))
+
+    proposals = report["proposals"]
+    assert proposals["target"] == 130 and proposals["senders"] == len(accounts)
+    assert proposals["fill_seconds"] >= 0
+    assert [p["depth"] for p in proposals["pagination"]] == [20, 100, 130]
+    assert [p["full_walk_pages"] for p in proposals["pagination"]] == [1, 1, 2]
+    assert [p["first_page_len"] for p in proposals["pagination"]] == [20, PAGE_LIMIT, PAGE_LIMIT]
+    for p in proposals["pagination"]:
+        assert min(p["first_page_ms"], p["deepest_page_ms"], p["reverse_page_ms"], p["full_walk_ms"]) >= 0
+        assert p["deepest_page_gas"] > 0
+    assert [m["depth"] for m in proposals["state_moves"]] == [20, 100, 130]
+    # Swap-and-pop of the head touches one more slot pair than popping the tail
+    for m in proposals["state_moves"]:
+        assert m["move_head_gas"] > m["move_tail_gas"]
+    # Below the caps the ceiling is not probed
+    assert "ceiling_reverts" not in proposals
+
+    comments = report["comments"]
+    assert comments["target"] == 25
+    assert [p["depth"] for p in comments["pagination"]] == [20, 25]
+    assert [p["first_page_len"] for p in comments["pagination"]] == [20, 25]
+    assert "ceiling_reverts" not in comments
+
+    # Per section: header, column row and a row per checkpoint; proposals add a move line each
+    lines = format_report(report).splitlines()
+    assert lines[0].startswith(f"proposals: 130 via {len(accounts)} senders")
+    assert sum(line.lstrip().startswith("move @") for line in lines) == 3
+    assert any(line.startswith("comments: 25 via") for line in lines)
+    assert len(lines) == 2 + 3 + 3 + 2 + 2
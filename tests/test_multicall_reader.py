@@ -0,0 +1,65 @@
+import pytest
+from ape import project
+
+from multicall_reader import MulticallReader, get_multicall, list_hub_proposals, view_call
+
+
+@pytest.fixture(scope="module")
+def hub_with_content(deploy_hub, accounts):
+    hub, bobu = deploy_hub()
+    author, commenter = accounts[5], accounts[6]
+    for i in range(5):
+        hub.createProposal(f"P{i}", "B" * (i * 1000), 0, 0, sender=author)
+    drafts = list(hub.getProposals(0, 0, 100, False))
+    hub.adminMoveState(drafts[0], 3, sender=bobu)
+    hub.addComment(drafts[1], "hello", 1, sender=commenter)
+    hub.addComment(drafts[1], "world", 4, sender=commenter)
+    return hub, drafts
+
+
+def test_get_multicall_deploys_once_on_local(accounts):
+    first = get_multicall(accounts[0])
+    assert get_multicall().address == first.address
+
+
+def test_read_fields_match_direct_reads(hub_with_content):
+    hub, drafts = hub_with_content
+    # Small chunks + several workers exercise concurrent dispatch and ordering
+    reader = MulticallReader(get_multicall(), chunk_size=3, max_workers=4)
+
+    rows = reader.read_proposals(drafts)
+    assert [r["address"] for r in rows] == drafts
+    for row in rows:
+        p = project.ProposalTemplate.at(row["address"])
+        assert row["title"] == p.title()
+        assert row["body"] == p.body()  # up to 4000 chars still fits the return buffer
+        assert row["author"] == p.author()
+        assert row["createdAt"] == p.createdAt()
+        assert row["votesFor"] == 0
+
+    comments = list(project.ProposalTemplate.at(drafts[1]).getComments(0, 10, False))
+    comment_rows = reader.read_comments(comments)
+    assert [c["content"] for c in comment_rows] == ["hello", "world"]
+    assert [c["sentiment"] for c in comment_rows] == [1, 4]
+    assert all(c["proposal"] == drafts[1] for c in comment_rows)
+
+
+def test_list_hub_proposals_and_failed_calls(hub_with_content, accounts):
+    hub, drafts = hub_with_content
+    reader = MulticallReader(get_multicall(), chunk_size=100, max_workers=1)
+
+    by_state = list_hub_proposals(reader, hub, page_size=2)
+    assert set(by_state[0]) == set(drafts[1:])
+    assert by_state[3] == [drafts[0]]
+
+    # Calling a template getter on an EOA fails softly when allowed
+    eoa = accounts[9].address
+    values = reader.read([
+        view_call(project.ProposalTemplate, drafts[0], "title"),
+        view_call(project.GovernanceHub, hub.address, "getProposalCountByState", 7),
+    ])
+    assert values == ["P0", None]
+
+    with pytest.raises(Exception):
+        reader.read([view_call(project.GovernanceHub, hub.address, "getProposalCountByState", 7, allow_failure=False)])
+    assert reader.read([view_call(project.ProposalTemplate, eoa, "title")]) == [None]
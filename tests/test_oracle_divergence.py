@@ -0,0 +1,79 @@
+import json
+import math
+import random
+
+from oracle_divergence import DivergenceMonitor, JsonlAlertSink, RollingWindow, Thresholds
+
+
+def test_rolling_window_matches_brute_force_over_live_buckets():
+    rng = random.Random(7)
+    w = RollingWindow(60.0, buckets=12)  # 5s buckets
+    samples, ts = [], 1_000.0
+    for i in range(5_000):
+        # Mostly sub-second steps with the odd multi-minute gap that empties the window
+        ts += 300.0 if i % 1_000 == 999 else rng.uniform(0, 0.5)
+        value = rng.gauss(0, 25)
+        w.add(ts, value)
+        samples.append((ts, value))
+
+        if i % 97 == 0 or i % 1_000 == 999:
+            oldest = int(ts // 5.0) - 11
+            live = [v for t, v in samples if int(t // 5.0) >= oldest]
+            mean = sum(live) / len(live)
+            assert w.count == len(live) and math.isclose(w.mean, mean, abs_tol=1e-9)
+            if len(live) > 1:
+                std = math.sqrt(sum((v - mean) ** 2 for v in live) / (len(live) - 1))
+                assert math.isclose(w.stddev, std, rel_tol=1e-6)
+            assert w.max_abs == max(abs(v) for v in live)
+
+    # Memory is the ring, however many samples went through
+    assert len(w._ring) == 12
+    w.expire(ts + 61)
+    assert (w.count, w.mean, w.max_abs) == (0, None, None)
+
+
+def _row(ts, symbol, pyth, ema, cmc, publish_time):
+    return {"timestamp": ts, "symbol": symbol, "Pyth_Stable": pyth, "Pyth_EMA": ema,
+            "Pyth_publish_time": publish_time, "CMC_price_USD": cmc}
+
+
+def test_monitor_raises_and_clears_alerts_per_symbol(tmp_path):
+    log = tmp_path / "alerts.jsonl"
+    monitor = DivergenceMonitor(
+        window=600, thresholds=Thresholds(max_divergence_bps=100, max_zscore=4, max_staleness=30), sink=JsonlAlertSink(str(log))
+    )
+    t = 10_000.0
+    for i in range(60):
+        # BTC tracks CMC within ~10 bps; ETH's CMC column is missing
+        monitor(_row(t + i, "BTC", 100.0 + (i % 3) * 0.05, 100.0, 100.0, int(t + i)))
+        monitor(_row(t + i, "ETH", 2_000.0, 2_000.0, None, int(t + i)))
+    assert log.exists() is False
+
+    # BTC Pyth jumps 2% above CMC for two rows (one alert, not two), then recovers
+    monitor(_row(t + 60, "BTC", 102.0, 100.0, 100.0, int(t + 60)))
+    monitor(_row(t + 61, "BTC", 102.0, 100.0, 100.0, int(t + 61)))
+    monitor(_row(t + 62, "BTC", 100.0, 100.0, 100.0, int(t + 62)))
+    # ETH stops publishing: staleness crosses 30s
+    monitor(_row(t + 100, "ETH", 2_000.0, 2_000.0, None, int(t + 59)))
+
+    alerts = [json.loads(line) for line in log.read_text().splitlines()]
+    summary = [(a["symbol"], a["metric"], a["kind"], a["active"]) for a in alerts]
+    assert summary == [
+        ("BTC", "Pyth_Stable/CMC_price_USD", "divergence", True),
+        ("BTC", "Pyth_Stable/CMC_price_USD", "zscore", True),
+        ("BTC", "Pyth_Stable/Pyth_EMA", "divergence", True),
+        ("BTC", "Pyth_Stable/Pyth_EMA", "zscore", True),
+        ("BTC", "Pyth_Stable/CMC_price_USD", "divergence", False),
+        ("BTC", "Pyth_Stable/CMC_price_USD", "zscore", False),
+        ("BTC", "Pyth_Stable/Pyth_EMA", "divergence", False),
+        ("BTC", "Pyth_Stable/Pyth_EMA", "zscore", False),
+        ("ETH", "staleness", "staleness", True),
+    ]
+    assert alerts[0]["value"] == 200.0 and alerts[-1]["value"] == 41.0
+    assert monitor.active_alerts() == [("ETH", "staleness", "staleness")]
+
+    btc = monitor.stats("BTC")
+    assert btc["Pyth_Stable/CMC_price_USD"]["count"] == 63 and btc["Pyth_Stable/CMC_price_USD"]["max_abs"] == 200.0
+    assert btc["Pyth_EMA/CMC_price_USD"]["max_abs"] == 0.0
+    assert monitor.stats("ETH")["Pyth_Stable/CMC_price_USD"]["count"] == 0
+    assert monitor.symbols() == ["BTC", "ETH"]
@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+
+from oracle_store import DAY, OracleStore, StoreSink, samples_from_row
+
+T0 = datetime(2025, 9, 9, tzinfo=timezone.utc).timestamp()
+
+
+def _series(start, end, step, symbol="ANIME", source="pyth"):
+    # price rises 1e-6 per second so every bar's open/close/high/low is predictable
+    return [(t, symbol, source, 0.01 + (t - T0) * 1e-6, 0.0099, int(t) - 1) for t in range(int(start), int(end), step)]
+
+
+def test_append_and_range_query_across_partitions(tmp_path):
+    store = OracleStore(str(tmp_path))
+    store.append(_series(T0 - 60, T0 + 60, 30))
+    store.append([(T0 + 30, "ANIME", "pyth", 1.5, None, None)])  # same key: replaces
+    store.append([(T0, "ANIME", "cmc", 0.02, None, None)])
+
+    assert store.partitions(store.tiers[0]) == ["20250908", "20250909"]
+    rows = store.query("ANIME", "pyth", T0 - 45, T0 + 60)
+    assert [r["ts"] for r in rows] == [T0 - 30, T0, T0 + 30]
+    assert rows[-1]["price"] == 1.5 and rows[0]["publish_time"] == int(T0) - 31
+    assert [r["price"] for r in store.query("ANIME", "cmc", T0 - DAY, T0 + DAY)] == [0.02]
+    assert store.query("BTC", "pyth", T0 - DAY, T0 + DAY) == []
+    store.close()
+
+
+def test_rollups_are_exact_and_incremental(tmp_path):
+    store = OracleStore(str(tmp_path), grace=0)
+    samples = _series(T0, T0 + 2 * DAY + 3600, 10) + _series(T0, T0 + 2 * DAY + 3600, 10, source="cmc")
+    store.append(samples)
+    now = T0 + 2 * DAY + 3600
+    written = store.rollup(now)
+    assert written == {"1m": 2 * (2 * 24 + 1) * 60, "1h": 2 * (2 * 24 + 1), "1d": 2 * 2}
+
+    price = lambda t: 0.01 + (t - T0) * 1e-6  # noqa: E731
+    [bar] = store.query("ANIME", "pyth", T0 + 60, T0 + 120, "1m")
+    assert (bar["open"], bar["close"], bar["count"]) == (price(T0 + 60), price(T0 + 110), 6)
+    [day] = store.query("ANIME", "pyth", T0 + DAY, T0 + 2 * DAY, "1d")
+    assert day["count"] == 8640 and day["low"] == price(T0 + DAY) and day["high"] == price(T0 + 2 * DAY - 10)
+    assert abs(day["sum"] / day["count"] - (price(T0 + DAY) + price(T0 + 2 * DAY - 10)) / 2) < 1e-12
+    assert day["publish_time"] == int(T0 + 2 * DAY - 10) - 1
+
+    # Nothing new is closed: no work; a later hour only adds its own bars
+    assert store.rollup(now) == {}
+    store.append(_series(now, now + 3600, 10))
+    assert store.rollup(now + 3600) == {"1m": 60, "1h": 1}
+    store.close()
+
+
+def test_prune_drops_expired_partitions_and_sink_feeds_store(tmp_path):
+    store = OracleStore(str(tmp_path), grace=0)
+    clock = [T0]
+    sink = StoreSink(store, rollup_every=60, prune_every=DAY, clock=lambda: clock[0])
+    for day in range(40):
+        for minute in range(0, 1440, 120):
+            clock[0] = T0 + day * DAY + minute * 60
+            sink({"timestamp": clock[0], "symbol": "ANIME", "Pyth_Stable": 0.01, "Pyth_EMA": 0.01,
+                  "Pyth_publish_time": int(clock[0]), "CMC_price_USD": 0.02})
+
+    # raw keeps 7 days (+ today's partition), 1m 30 days; 1h / 1d keep everything here
+    assert len(store.partitions(store.tiers[0])) == 8
+    assert len(store.partitions(store.tiers[1])) == 31
+    day_bars = store.query("ANIME", "cmc", T0, T0 + 40 * DAY, "1d")
+    assert len(day_bars) == 39 and all(b["count"] == 12 for b in day_bars)
+    assert samples_from_row({"timestamp": 1.0, "symbol": "X", "Pyth_Stable": None, "CMC_price_USD": 2.0}) == [
+        (1.0, "X", "cmc", 2.0, None, None)
+    ]
+    store.close()
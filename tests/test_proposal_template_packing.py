@@ -0,0 +1,67 @@
+import ape
+from ape import project
+
+# Gas measured on the local test chain with the previous one-slot-per-field
+# ProposalTemplate layout (same scenario as below). Kept as the regression
+# baseline for the packed layout.
+UNPACKED_LAYOUT_GAS = {
+    "createProposal": 684_254,
+    "castVote (2nd voter)": 127_322,
+    "initialize": 404_045,
+    "hubSetVotingWindow": 30_869,
+}
+# Minimum saving the packed layout must keep
+REQUIRED_SAVINGS = {
+    "createProposal": 60_000,
+    "castVote (2nd voter)": 15_000,
+    "initialize": 60_000,
+    "hubSetVotingWindow": 2_000,
+}
+
+
+def test_packed_template_keeps_public_getters(accounts):
+    deployer, hub_account, author = accounts[0], accounts[1], accounts[5]
+    t = deployer.deploy(project.ProposalTemplate)
+    assert not t.initialized() and t.ownerHub() == "0x0000000000000000000000000000000000000000"
+
+    t.initialize(hub_account, "Title", author, "Body", 1_700_000_000, 2**40 - 2, 2**40 - 1, sender=deployer)
+    assert t.initialized() and t.ownerHub() == hub_account.address
+    assert t.author() == author.address and t.createdAt() == 1_700_000_000
+    assert (t.voteStart(), t.voteEnd()) == (2**40 - 2, 2**40 - 1)
+    assert tuple(t.votingWindow()) == (2**40 - 2, 2**40 - 1)
+    assert (t.title(), t.body()) == ("Title", "Body")
+
+    # Counters stay independent within the shared slot
+    t.hubCastVote(accounts[6], True, 2**100, sender=hub_account)
+    t.hubCastVote(accounts[7], False, 3, sender=hub_account)
+    assert (t.votesFor(), t.votesAgainst()) == (2**100, 3)
+    with ape.reverts("votes overflow"):
+        t.hubCastVote(accounts[8], True, 2**128, sender=hub_account)
+
+    # Window updates keep the hub and the initialized flag
+    t.hubSetVotingWindow(0, 0, sender=hub_account)
+    assert (t.voteStart(), t.voteEnd()) == (0, 0)
+    assert t.initialized() and t.ownerHub() == hub_account.address
+    with ape.reverts("timestamp too large"):
+        t.hubSetVotingWindow(1, 2**40, sender=hub_account)
+    with ape.reverts("inited"):
+        t.initialize(hub_account, "Again", author, "Body", 1, 0, 0, sender=deployer)
+
+
+def test_gas_regression_packed_vs_unpacked_layout(hub, accounts, chain):
+    hub, _ = hub
+    now = chain.pending_timestamp
+    measured = {}
+    measured["createProposal"] = hub.createProposal("Title", "Body " * 50, now, now + 100_000, sender=accounts[5]).gas_used
+    p = hub.getProposals(2, 0, 1, True)[0]
+    hub.castVote(p, True, sender=accounts[6])
+    measured["castVote (2nd voter)"] = hub.castVote(p, False, sender=accounts[7]).gas_used
+
+    t = accounts[0].deploy(project.ProposalTemplate)
+    measured["initialize"] = t.initialize(
+        accounts[9], "Title", accounts[5], "Body " * 50, 1, now, now + 100_000, sender=accounts[0]
+    ).gas_used
+    measured["hubSetVotingWindow"] = t.hubSetVotingWindow(now, now + 5, sender=accounts[9]).gas_used
+
+    for name, before in UNPACKED_LAYOUT_GAS.items():
+        assert measured[name] <= before - REQUIRED_SAVINGS[name], f"{name}: unpacked={before:,} packed={measured[name]:,}"
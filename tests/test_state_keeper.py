@@ -0,0 +1,70 @@
+import ape
+
+from hub_indexer import HubIndexer, HubStore
+from state_keeper import StateKeeper
+
+STATE_DRAFT = 0
+STATE_OPEN = 1
+STATE_ACTIVE = 2
+STATE_CLOSED = 3
+
+
+def _create(hub, author, state, n, vote_start, vote_end):
+    for i in range(n):
+        hub.createProposal(f"P{i}", "Body", vote_start, vote_end, sender=author)
+    return list(hub.getProposals(state, 0, 100, False))[-n:]
+
+
+def test_sync_proposal_states_moves_due_proposals_in_one_tx(hub, accounts, chain):
+    hub, _ = hub
+    author = accounts[5]
+    now = chain.pending_timestamp
+    opening = _create(hub, author, STATE_OPEN, 3, now + 100, now + 1000)
+    closing = _create(hub, author, STATE_ACTIVE, 3, now, now + 50)
+    [draft] = _create(hub, author, STATE_DRAFT, 1, 0, 0)
+    chain.mine(timestamp=now + 200)
+
+    tx = hub.syncProposalStates(opening[:2] + closing[:2] + [draft], sender=author)
+    moves = {(e.proposal, e.newState) for e in tx.events.filter(hub.StateChanged)}
+    assert moves == {(p, STATE_ACTIVE) for p in opening[:2]} | {(p, STATE_CLOSED) for p in closing[:2]}
+    assert hub.getProposalState(draft) == STATE_DRAFT
+
+    # Same proposals again: all no-ops
+    assert not hub.syncProposalStates(opening[:2], sender=author).events.filter(hub.StateChanged)
+    with ape.reverts("unknown proposal"):
+        hub.syncProposalStates([accounts[9].address], sender=author)
+
+    # Cheaper than the same moves one transaction each
+    single_open = hub.syncProposalState(opening[2], sender=author).gas_used
+    single_close = hub.syncProposalState(closing[2], sender=author).gas_used
+    singles = 2 * single_open + 2 * single_close
+    assert tx.gas_used < singles, f"syncProposalState x4={singles:,} syncProposalStates x4={tx.gas_used:,}"
+
+
+def test_keeper_submits_batches_only_when_transitions_are_due(hub, accounts, chain, tmp_path):
+    hub, _ = hub
+    author, keeper_account = accounts[5], accounts[9]
+    start = chain.blocks.height
+    now = chain.pending_timestamp
+    opening = _create(hub, author, STATE_OPEN, 5, now + 100, now + 10_000)
+    closing = _create(hub, author, STATE_ACTIVE, 2, now, now + 300)
+
+    indexer = HubIndexer(hub.address, HubStore(str(tmp_path / "hub.sqlite")), start_block=start)
+    keeper = StateKeeper(hub, keeper_account, indexer, max_batch=2)
+
+    # Nothing due yet: no transactions, sleep until the first boundary
+    assert keeper.tick() == []
+    head = chain.blocks.head.timestamp
+    assert keeper.seconds_until_next(min_sleep=1, max_sleep=10_000) == now + 100 - head
+
+    chain.mine(timestamp=now + 150)
+    receipts = keeper.tick()
+    assert len(receipts) == 3  # 5 due, two per batch
+    assert {p["address"] for p in indexer.store.list_proposals(STATE_ACTIVE)} == set(opening + closing)
+    assert keeper.seconds_until_next(min_sleep=1, max_sleep=10_000) == now + 301 - chain.blocks.head.timestamp
+
+    chain.mine(timestamp=now + 400)
+    [receipt] = keeper.tick()
+    assert {e.proposal for e in receipt.events.filter(hub.StateChanged)} == set(closing)
+    assert [p["address"] for p in indexer.store.list_proposals(STATE_CLOSED)] == closing
+    assert keeper.tick() == []
@@ -0,0 +1,105 @@
+import ape
+import pytest
+from ape import project
+
+from vote_relayer import RelayQueue, Relayer, sign_comment, sign_vote, to_struct
+
+STATE_ACTIVE = 2
+
+
+@pytest.fixture(scope="function")
+def proposal(hub, accounts, chain):
+    hub, _ = hub
+    now = chain.pending_timestamp
+    hub.createProposal("Relayed", "Body", now, now + 100_000, sender=accounts[5])
+    return hub.getProposals(STATE_ACTIVE, 0, 1, True)[0]
+
+
+def test_relay_votes_verifies_signature_nonce_and_deadline(hub, proposal, accounts, chain):
+    hub, _ = hub
+    voter, relayer = accounts[6], accounts[9]
+    deadline = chain.pending_timestamp + 3600
+    vote = sign_vote(voter.private_key, hub.address, chain.chain_id, proposal, True, 0, deadline)
+
+    # Tampered payload no longer matches the signature
+    with ape.reverts("bad signature"):
+        hub.relayVotes([to_struct({**vote, "support": False})], sender=relayer)
+    with ape.reverts("bad nonce"):
+        hub.relayVotes([to_struct(sign_vote(voter.private_key, hub.address, chain.chain_id, proposal, True, 1, deadline))], sender=relayer)
+    expired = sign_vote(voter.private_key, hub.address, chain.chain_id, proposal, True, 0, chain.pending_timestamp - 1)
+    with ape.reverts("signature expired"):
+        hub.relayVotes([to_struct(expired)], sender=relayer)
+
+    hub.relayVotes([to_struct(vote)], sender=relayer)
+    assert project.ProposalTemplate.at(proposal).votesFor() == 1
+    assert hub.nonces(voter) == 1 and hub.totalVotes(proposal) == 1
+    # Replays are rejected by the nonce
+    with ape.reverts("bad nonce"):
+        hub.relayVotes([to_struct(vote)], sender=relayer)
+
+
+def test_relay_comments(hub, proposal, accounts, chain):
+    hub, _ = hub
+    author, relayer = accounts[6], accounts[9]
+    deadline = chain.pending_timestamp + 3600
+    first = sign_comment(author.private_key, hub.address, chain.chain_id, proposal, "signed gm", 1, 0, deadline)
+    second = sign_comment(author.private_key, hub.address, chain.chain_id, proposal, "signed again", 2, 1, deadline)
+    hub.relayComments([to_struct(first), to_struct(second)], sender=relayer)
+
+    comments = project.ProposalTemplate.at(proposal).getComments(0, 10, False)
+    details = [project.CommentTemplate.at(c) for c in comments]
+    assert [(c.author(), c.content(), c.sentiment()) for c in details] == [
+        (author.address, "signed gm", 1),
+        (author.address, "signed again", 2),
+    ]
+    assert hub.totalComments() == 2 and hub.nonces(author) == 2
+
+
+def test_relayer_flushes_by_size_and_time(hub, proposal, accounts, chain, project):
+    hub, _ = hub
+    relayer_account = accounts[9]
+    voters = accounts[2:8]
+    deadline = chain.pending_timestamp + 3600
+    now = [1_000.0]
+    queue = RelayQueue()
+    relayer = Relayer(hub, relayer_account, queue, max_batch=4, max_wait=30, clock=lambda: now[0])
+
+    for v in voters[:3]:
+        queue.put(sign_vote(v.private_key, hub.address, chain.chain_id, proposal, True, 0, deadline), received_at=now[0])
+    assert relayer.poll() == []  # 3 < max_batch and nothing is old enough
+
+    queue.put(sign_vote(voters[3].private_key, hub.address, chain.chain_id, proposal, False, 0, deadline), received_at=now[0])
+    [receipt] = relayer.poll()  # size threshold
+    assert queue.count_pending("vote") == 0
+    t = project.ProposalTemplate.at(proposal)
+    assert (t.votesFor(), t.votesAgainst()) == (3, 1)
+
+    queue.put(sign_vote(voters[4].private_key, hub.address, chain.chain_id, proposal, True, 0, deadline), received_at=now[0])
+    assert relayer.poll() == []
+    now[0] += 31
+    assert len(relayer.poll()) == 1  # age threshold
+    assert t.votesFor() == 4
+
+
+def test_relayer_rejects_bad_messages_without_blocking_batch(hub, proposal, accounts, chain):
+    hub, _ = hub
+    relayer_account = accounts[9]
+    a, b, c = accounts[5], accounts[6], accounts[7]
+    deadline = chain.pending_timestamp + 3600
+    queue = RelayQueue()
+    relayer = Relayer(hub, relayer_account, queue, max_wait=0, clock=lambda: chain.pending_timestamp)
+
+    good = queue.put(sign_vote(a.private_key, hub.address, chain.chain_id, proposal, True, 0, deadline))
+    forged = sign_vote(b.private_key, hub.address, chain.chain_id, proposal, True, 0, deadline)
+    forged_id = queue.put({**forged, "voter": c.address})
+    ahead = queue.put(sign_vote(b.private_key, hub.address, chain.chain_id, proposal, True, 5, deadline))
+    # Same voter twice on one proposal: second fails in the hub ("already voted")
+    dup = queue.put(sign_vote(a.private_key, hub.address, chain.chain_id, proposal, False, 1, deadline))
+
+    assert len(relayer.poll()) == 1
+    assert queue.status(good)["status"] == "sent"
+    assert queue.status(forged_id)["status"] == "rejected"
+    assert queue.status(dup) == {"status": "rejected", "tx_hash": None, "error": "already voted"}
+    # Nonce gap: left pending for a later flush
+    assert queue.status(ahead)["status"] == "pending"
+    assert project.ProposalTemplate.at(proposal).votesFor() == 1